@@ -14,11 +14,17 @@
 # ----------------------------------------------------------------------
 """Contains command line utilities used with compilers"""
 
+import multiprocessing
 import os
 import sys
+import threading
+
+import six
 
 from CommonEnvironment import FileSystem
+from CommonEnvironment import Nonlocals
 from CommonEnvironment.StreamDecorator import StreamDecorator
+from CommonEnvironment import TaskPool
 
 # ----------------------------------------------------------------------
 _script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower() else sys.executable
@@ -30,6 +36,7 @@ def CommandLineInvoke( compiler,
                        inputs,
                        output_stream,
                        verbose,
+                       jobs=1,                          # Number of contexts invoked in parallel; None corresponds to the number of cores
                        _output_via_stderr=False,
                        _output_start_line=None,
                        _output_end_line=None,
@@ -50,11 +57,19 @@ def CommandLineInvoke( compiler,
 
     # ----------------------------------------------------------------------
 
+    if compiler.IsVerifier:
+        # Verifiers may be able to process all of the contexts at once
+        batch_functor = lambda contexts, output_stream: compiler.VerifyBatch(contexts, output_stream, verbose)
+    else:
+        batch_functor = None
+
     return _CommandLineImpl( compiler,
                              inputs,
                              Invoke,
                              output_stream,
                              compiler_kwargs,
+                             batch_functor=batch_functor,
+                             jobs=jobs,
                              output_via_stderr=_output_via_stderr,
                              output_start_line=_output_start_line,
                              output_end_line=_output_end_line,
@@ -64,6 +79,7 @@ def CommandLineInvoke( compiler,
 def CommandLineClean( compiler,
                       inputs,
                       output_stream,
+                      jobs=1,                           # Number of contexts cleaned in parallel; None corresponds to the number of cores
                       **compiler_kwargs
                     ):
     return _CommandLineImpl( compiler,
@@ -71,6 +87,7 @@ def CommandLineClean( compiler,
                              compiler.Clean,
                              output_stream,
                              compiler_kwargs,
+                             jobs=jobs,
                            )
 
 # ----------------------------------------------------------------------
@@ -107,6 +124,8 @@ def _CommandLineImpl( compiler,
                       functor,                          # def Func(context, output_stream) -> rval
                       output_stream,
                       compiler_kwargs,
+                      batch_functor=None,               # def Func(contexts, output_stream) -> [ rval, ... ]
+                      jobs=1,
                       output_via_stderr=False,          # <Unused variable> pylint: disable = W0613
                       output_start_line=None,           # <Unused variable> pylint: disable = W0613
                       output_end_line=None,             # <Unused variable> pylint: disable = W0613
@@ -115,6 +134,11 @@ def _CommandLineImpl( compiler,
     assert inputs
     assert output_stream
 
+    if jobs is None:
+        jobs = multiprocessing.cpu_count()
+
+    assert jobs >= 1, jobs
+
     result = compiler.ValidateEnvironment()
     if result:
         output_stream.write("{}\n".format(result.rstrip()))
@@ -142,13 +166,70 @@ def _CommandLineImpl( compiler,
                 else:
                     raise
 
-        for context in contexts:
-            dm.stream.flush()
+        if jobs > 1 and len(contexts) > 1:
+            # Parallel invocation takes precedence over batch invocation
+            results = _InvokeConcurrently(functor, contexts, dm.stream, jobs)
+        elif batch_functor is not None:
+            results = batch_functor(contexts, dm.stream) if contexts else []
+        else:
+            results = []
 
-            result = functor(context, dm.stream)
+            for context in contexts:
+                dm.stream.flush()
+                results.append(functor(context, dm.stream))
 
+        for result in results:
             if dm.result == 0 or (dm.result > 0 and result < 0):
                 dm.result = result
 
         return dm.result
-            
\ No newline at end of file
+            
+
+# ----------------------------------------------------------------------
+def _InvokeConcurrently(functor, contexts, output_stream, jobs):
+    """
+    Invokes the functor for each context via TaskPool. The output for each context
+    is buffered and written to the output stream in the order of the contexts, as
+    if the contexts had been invoked one after the other.
+    """
+
+    results = [ None, ] * len(contexts)
+    outputs = [ None, ] * len(contexts)
+    exceptions = [ None, ] * len(contexts)
+
+    output_lock = threading.Lock()
+    nonlocals = Nonlocals(next_output_index=0)
+
+    # ----------------------------------------------------------------------
+    def Invoke(task_index):
+        sink = six.moves.StringIO()
+
+        try:
+            results[task_index] = functor(contexts[task_index], StreamDecorator(sink))
+        except:
+            exceptions[task_index] = sys.exc_info()
+
+        with output_lock:
+            outputs[task_index] = sink.getvalue()
+
+            # Write all of the output that is now available in order
+            while nonlocals.next_output_index < len(outputs) and outputs[nonlocals.next_output_index] is not None:
+                output_stream.write(outputs[nonlocals.next_output_index])
+                output_stream.flush()
+
+                nonlocals.next_output_index += 1
+
+    # ----------------------------------------------------------------------
+
+    TaskPool.Execute( [ TaskPool.Task("Context {}".format(index), Invoke) for index in six.moves.range(len(contexts)) ],
+                      None,
+                      num_concurrent_tasks=jobs,
+                    )
+
+    # Raise the exception for the first context that failed (which is the exception
+    # that would have been raised if the contexts were invoked one after the other).
+    for exc_info in exceptions:
+        if exc_info is not None:
+            six.reraise(*exc_info)
+
+    return results
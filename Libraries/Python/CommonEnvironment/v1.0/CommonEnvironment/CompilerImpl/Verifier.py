@@ -17,6 +17,8 @@
 import os
 import sys
 
+from CommonEnvironment.Interface import extensionmethod
+
 from CommonEnvironment.CompilerImpl import CompilerImpl
 from CommonEnvironment.CompilerImpl.CommandLine import CommandLineInvoke
 from CommonEnvironment.CompilerImpl.InputProcessingMixin.IndividualInputProcessingMixin import IndividualInputProcessingMixin
@@ -47,6 +49,24 @@ class Verifier( IndividualInputProcessingMixin,
     def Verify(cls, context, status_stream, verbose=False):
         return cls._Invoke(context, status_stream, verbose)
 
+    # ----------------------------------------------------------------------
+    @classmethod
+    @extensionmethod
+    def VerifyBatch(cls, contexts, status_stream, verbose=False):
+        """
+        Verifies multiple contexts, returning a list of results. Override this method
+        if the derived verifier is able to verify many contexts more efficiently than
+        verifying each one individually.
+        """
+
+        results = []
+
+        for context in contexts:
+            status_stream.flush()
+            results.append(cls.Verify(context, status_stream, verbose))
+
+        return results
+
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
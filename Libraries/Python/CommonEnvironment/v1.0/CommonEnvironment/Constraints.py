@@ -25,7 +25,12 @@ import wrapt
 
 from CommonEnvironment.TypeInfo import ValidationException
 from CommonEnvironment.TypeInfo.DictTypeInfo import DictTypeInfo
-from CommonEnvironment.TypeInfo.FundamentalTypes.All import CreateFromPythonType as CreateFundamentalFromPythonType
+from CommonEnvironment.TypeInfo.FundamentalTypes.All import BoolTypeInfo, \
+                                                            EnumTypeInfo, \
+                                                            FloatTypeInfo, \
+                                                            IntTypeInfo, \
+                                                            StringTypeInfo, \
+                                                            CreateFromPythonType as CreateFundamentalFromPythonType
 
 # ----------------------------------------------------------------------
 _script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower() else sys.executable
@@ -34,6 +39,15 @@ _script_dir, _script_name = os.path.split(_script_fullpath)
 
 inflect                                     = inflect_mod.engine()
 
+# Validation is disabled when python is running with optimizations (-O) or when this
+# environment variable is set to a value other than "0". Arguments are still normalized
+# (None defaults are converted to empty collections) when validation is disabled. The
+# environment variable is read when this module is imported; VALIDATION_ENABLED is read
+# when a decorated function is first invoked.
+DISABLE_ENVIRONMENT_VAR_NAME                = "DEVELOPMENT_ENVIRONMENT_DISABLE_CONSTRAINTS"
+
+VALIDATION_ENABLED                          = __debug__ and os.getenv(DISABLE_ENVIRONMENT_VAR_NAME, "0") in [ "", "0", ]
+
 # ----------------------------------------------------------------------
 @wrapt.decorator
 class Constraints(object):
@@ -67,120 +81,240 @@ class Constraints(object):
         if not self.Preconditions and not self.Postconditions:
             raise Exception("Preconditions and/or postconditions must be provided")
 
-        self._args_to_kwargs_func           = None      # Lazy init
+        self._invoke_func                   = None      # Lazy init
 
     # ----------------------------------------------------------------------
     def __call__(self, wrapped, instance, args, kwargs):
-        if self._args_to_kwargs_func is None:
-            # Create a function that will map all positional arguments into the keyboard map
-            if sys.version_info[0] == 2:
-                arg_info = inspect.getargspec(wrapped)
-            else:
-                arg_info = inspect.getfullargspec(wrapped)
-
-            arg_defaults = arg_info.defaults or []
-            optional_args = arg_info.args[len(arg_info.args) - len(arg_defaults) :]
-
-            if self.Preconditions:
-                first_optional_arg_index = len(arg_info.args) - len(optional_args)
-
-                # Ensure that the precondition names match the function argument names
-                precondition_names = set(six.iterkeys(self.Preconditions))
-                missing = []
-
-                for index, arg in enumerate(arg_info.args):
-                    if arg in precondition_names:
-                        precondition_names.remove(arg)
-                    elif index < first_optional_arg_index:
-                        missing.append(arg)
-                    else:
-                        # Create a TypeInfo object based on the default
-                        default_value = arg_defaults[index - first_optional_arg_index]
-
-                        these_kwargs = { "arity" : '?', }
-
-                        if default_value == '':
-                            these_kwargs["min_length"] = 0
-
-                        self.Preconditions[arg] = CreateFundamentalFromPythonType(type(default_value), **these_kwargs)
-                
-                # Capture all errors
-                errors = []
-
-                errors += [ "A precondition was not provided for '{}'".format(arg) for arg in missing ]
-                errors += [ "A precondition was provided for '{}'".format(arg) for arg in precondition_names ]
-
-                if errors:
-                    raise Exception(textwrap.dedent(
-                                        """\
-                                        Constraint configuration for '{}' is not valid:
-                                        {}
-                                        """).format( wrapped,
-                                                     '\n'.join([ "    - {}".format(error) for error in errors ]),
-                                                   ))
+        if self._invoke_func is None:
+            self._invoke_func = self._CreateInvokeFunc(wrapped)
 
-            # ----------------------------------------------------------------------
-            def ArgsToKwargs(args, kwargs):
-                # Copy the position args into the kwargs map
-                assert len(args) <= len(arg_info.args)
-
-                index = 0
-                while index < len(args):
-                    kwargs[arg_info.args[index]] = args[index]
-                    index += 1
-
-                # Copy the optional args
-                for arg, default_value in six.moves.zip(optional_args, arg_defaults):
-                    if arg not in kwargs:
-                        kwargs[arg] = default_value
-
-                        # Default parameter values in python arg string in that it is better
-                        # to provide a None value in the function signature rather than an empty 
-                        # list when the arity is '*', as that empty list may be modified within
-                        # the function itself. However, parameter validation requires an empty list
-                        # rather than None. Handle that wonkiness here by providing the actual value.
-                        if ( default_value is None and
-                             arg in self.Preconditions and
-                             self.Preconditions[arg] is not None
-                           ):
-                            if self.Preconditions[arg].Arity.IsCollection:
-                                kwargs[arg] = []
-                            elif isinstance(self.Preconditions[arg], DictTypeInfo):
-                                kwargs[arg] = {}
-
-                return kwargs
+        return self._invoke_func(wrapped, args, kwargs)
 
-            # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _CreateInvokeFunc(self, wrapped):
+        """
+        Generates a function specialized for the wrapped function's signature that maps positional
+        arguments to keyword arguments, validates the arguments, invokes the function, and validates
+        the result. Checks for fundamental types are inlined; the TypeInfo object is only invoked
+        when an inline check fails (to generate the error message) or when the check can't be inlined.
+        """
+
+        if sys.version_info[0] == 2:
+            arg_info = inspect.getargspec(wrapped)
+        else:
+            arg_info = inspect.getfullargspec(wrapped)
+
+        arg_defaults = arg_info.defaults or []
+        first_optional_arg_index = len(arg_info.args) - len(arg_defaults)
+
+        if self.Preconditions:
+            # Ensure that the precondition names match the function argument names
+            precondition_names = set(six.iterkeys(self.Preconditions))
+            missing = []
 
-            self._args_to_kwargs_func = ArgsToKwargs
+            for index, arg in enumerate(arg_info.args):
+                if arg in precondition_names:
+                    precondition_names.remove(arg)
+                elif index < first_optional_arg_index:
+                    missing.append(arg)
+                else:
+                    # Create a TypeInfo object based on the default
+                    default_value = arg_defaults[index - first_optional_arg_index]
 
-        # Validate the arguments
-        kwargs = self._args_to_kwargs_func(args, kwargs)
+                    these_kwargs = { "arity" : '?', }
+
+                    if default_value == '':
+                        these_kwargs["min_length"] = 0
+
+                    self.Preconditions[arg] = CreateFundamentalFromPythonType(type(default_value), **these_kwargs)
+            
+            # Capture all errors
+            errors = []
+
+            errors += [ "A precondition was not provided for '{}'".format(arg) for arg in missing ]
+            errors += [ "A precondition was provided for '{}'".format(arg) for arg in precondition_names ]
+
+            if errors:
+                raise Exception(textwrap.dedent(
+                                    """\
+                                    Constraint configuration for '{}' is not valid:
+                                    {}
+                                    """).format( wrapped,
+                                                 '\n'.join([ "    - {}".format(error) for error in errors ]),
+                                               ))
+
+        global_vars = { "ValidationException" : ValidationException, }
+
+        # ----------------------------------------------------------------------
+        def AddGlobal(value):
+            name = "_global{}".format(len(global_vars))
+            global_vars[name] = value
+
+            return name
+
+        # ----------------------------------------------------------------------
+
+        statements = []
+
+        # Copy the positional args and defaults into the kwargs map
+        map_args = False
 
         if self.Preconditions:
-            assert len(kwargs) == len(self.Preconditions)
+            map_args = VALIDATION_ENABLED
+
+            statements += [ "assert len(args) <= {}, args".format(len(arg_info.args)),
+                            "num_args = len(args)",
+                          ]
+
+            for index, arg in enumerate(arg_info.args):
+                statements.append("if num_args > {index}: kwargs[{arg!r}] = args[{index}]".format( index=index,
+                                                                                                    arg=arg,
+                                                                                                  ))
+
+                if index < first_optional_arg_index:
+                    continue
 
-            for k, v in six.iteritems(kwargs):
-                assert k in self.Preconditions, k
+                default_value = arg_defaults[index - first_optional_arg_index]
+                type_info = self.Preconditions[arg]
 
-                type_info = self.Preconditions[k]
+                # Default parameter values in python arg string in that it is better
+                # to provide a None value in the function signature rather than an empty 
+                # list when the arity is '*', as that empty list may be modified within
+                # the function itself. However, parameter validation requires an empty list
+                # rather than None. Handle that wonkiness here by providing the actual value.
+                if default_value is None and type_info is not None and type_info.Arity.IsCollection:
+                    default_statement = "[]"
+                    map_args = True
+                elif default_value is None and isinstance(type_info, DictTypeInfo):
+                    default_statement = "{}"
+                    map_args = True
+                else:
+                    default_statement = AddGlobal(default_value)
+
+                statements.append("elif {arg!r} not in kwargs: kwargs[{arg!r}] = {default}".format( arg=arg,
+                                                                                                     default=default_statement,
+                                                                                                   ))
+
+            statements.append("assert len(kwargs) == {}, kwargs".format(len(self.Preconditions)))
+
+        if not map_args:
+            statements = []
+
+        # Validate the arguments
+        if self.Preconditions and VALIDATION_ENABLED:
+            for arg in arg_info.args:
+                type_info = self.Preconditions[arg]
                 if type_info is None:
                     continue
 
-                result = type_info.ValidateNoThrow(v)
-                if result is not None:
-                    raise ValidationException("Validation for the arg '{}' failed - {}".format(k, result))
+                statements.append("value = kwargs[{!r}]".format(arg))
+                statements += _CreateValidationStatements( type_info,
+                                                           "Validation for the arg '{}' failed - {{}}".format(arg),
+                                                           AddGlobal,
+                                                         )
 
         # Invoke the function
-        func_result = wrapped(**kwargs)
+        if not statements and not (self.Postconditions and VALIDATION_ENABLED):
+            # ----------------------------------------------------------------------
+            def Invoke(wrapped, args, kwargs):
+                return wrapped(*args, **kwargs)
+
+            # ----------------------------------------------------------------------
+
+            return Invoke
+
+        statements.append("value = wrapped({})".format("**kwargs" if map_args else "*args, **kwargs"))
 
         # Validate postconditions
-        for postcondition in self.Postconditions:
-            if postcondition is None:
-                continue
+        if VALIDATION_ENABLED:
+            for postcondition in self.Postconditions:
+                if postcondition is None:
+                    continue
+
+                statements += _CreateValidationStatements( postcondition,
+                                                           "Validation for the result failed - {}",
+                                                           AddGlobal,
+                                                         )
+
+        statements.append("return value")
+
+        content = "def Invoke(wrapped, args, kwargs):\n{}\n".format('\n'.join([ "    {}".format(statement.replace('\n', '\n    ')) for statement in statements ]))
+
+        six.exec_(compile(content, "<Constraints for '{}'>".format(getattr(wrapped, "__name__", wrapped)), "exec"), global_vars)
+
+        return global_vars["Invoke"]
+
+# ----------------------------------------------------------------------
+# |  
+# |  Private Methods
+# |  
+# ----------------------------------------------------------------------
+def _CreateValidationStatements(type_info, error_template, add_global_func):
+    """Returns statements that validate the local variable 'value'."""
+
+    type_info_name = add_global_func(type_info)
+
+    validate_statements = textwrap.dedent(
+        """\
+        result = {type_info}.ValidateNoThrow(value)
+        if result is not None:
+            raise ValidationException({error_template!r}.format(result))""",
+    ).format( type_info=type_info_name,
+              error_template=error_template,
+            )
+
+    expression = _CreateInlineValidationExpression(type_info, type_info_name, add_global_func)
+    if expression is None:
+        return [ validate_statements, ]
+
+    return [ "if not ({}):".format(expression),
+             "    {}".format(validate_statements.replace('\n', '\n    ')),
+           ]
+
+# ----------------------------------------------------------------------
+def _CreateInlineValidationExpression(type_info, type_info_name, add_global_func):
+    """
+    Returns an expression that evaluates to True if the local variable 'value' is valid,
+    or None if the TypeInfo's validation can't be expressed inline. A False result
+    doesn't imply that the value is invalid; the TypeInfo object is always consulted
+    in that case.
+
+    The expression reads the TypeInfo's constraints each time it is evaluated, so that
+    changes made to the TypeInfo after the function was first invoked are honored.
+    """
+
+    # Only the exact types are supported, as derived types may augment validation
+    type_info_type = type(type_info)
+
+    if type_info_type not in [ BoolTypeInfo, EnumTypeInfo, FloatTypeInfo, IntTypeInfo, StringTypeInfo, ]:
+        return None
+
+    if not type_info.Arity.IsSingle and not type_info.Arity.IsOptional:
+        return None
+
+    conditions = [ "{}.ValidationFunc is None".format(type_info_name),
+                   "isinstance(value, {})".format(add_global_func(type_info.ExpectedType)),
+                 ]
+
+    if type_info_type in [ IntTypeInfo, FloatTypeInfo, ]:
+        conditions += [ "({0}.Min is None or value >= {0}.Min)".format(type_info_name),
+                        "({0}.Max is None or value <= {0}.Max)".format(type_info_name),
+                      ]
+
+    elif type_info_type == StringTypeInfo:
+        conditions += [ "not {}.ValidationExpression".format(type_info_name),
+                        "({0}.MinLength is None or len(value) >= {0}.MinLength)".format(type_info_name),
+                        "({0}.MaxLength is None or len(value) <= {0}.MaxLength)".format(type_info_name),
+                      ]
+
+    elif type_info_type == EnumTypeInfo:
+        conditions.append("value in {}.Values".format(type_info_name))
+
+    expression = " and ".join(conditions)
 
-            result = postcondition.ValidateNoThrow(func_result)
-            if result is not None:
-                raise ValidationException("Validation for the result failed - {}".format(result))
+    if type_info.Arity.IsOptional:
+        expression = "value is None or ({})".format(expression)
 
-        return func_result
+    return expression
@@ -0,0 +1,158 @@
+# ----------------------------------------------------------------------
+# |  
+# |  DirectoryIndex.py
+# |  
+# |  David Brownell <db@DavidBrownell.com>
+# |      2018-06-15 09:26:44
+# |  
+# ----------------------------------------------------------------------
+# |  
+# |  Copyright David Brownell 2018.
+# |  Distributed under the Boost Software License, Version 1.0.
+# |  (See accompanying file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+# |  
+# ----------------------------------------------------------------------
+"""Contains the DirectoryIndex object"""
+
+import os
+import sys
+import threading
+import time
+
+import six
+import six.moves.cPickle as pickle
+
+from CommonEnvironment import FileSystem
+from CommonEnvironment import PersistedData
+
+# ----------------------------------------------------------------------
+_script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower() else sys.executable
+_script_dir, _script_name = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+# ----------------------------------------------------------------------
+# |  
+# |  Public Types
+# |  
+# ----------------------------------------------------------------------
+class DirectoryIndex(object):
+    """
+    Persisted directory contents, used by FileSystem.WalkDirs and FileSystem.WalkFiles
+    to avoid listing directories that haven't changed since they were last walked.
+
+    A directory's modification time changes when items are added to, removed from, or
+    renamed within it; directories whose modification time matches the indexed value
+    are answered from the index, all others are listed and the index is updated.
+    """
+
+    DEFAULT_FILENAME                        = "DirectoryIndex.pickle"
+
+    # Directories modified within this period of time are not indexed, as subsequent
+    # changes may not be reflected in modification times on file systems with coarse
+    # timestamp resolution.
+    RECENT_MODIFICATION_SECONDS             = 2.0
+
+    _VERSION                                = 1
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Create(cls, filename=None):
+        """Creates a DirectoryIndex; the default filename is located in the activated repository's Generated directory."""
+
+        if filename is None:
+            filename = PersistedData.GetGeneratedFilename(cls.DEFAULT_FILENAME)
+            if filename is None:
+                raise Exception("A filename must be provided when a repository has not been activated")
+
+        return cls(filename)
+
+    # ----------------------------------------------------------------------
+    def __init__(self, filename):
+        self.Filename                       = filename
+
+        self._lock                          = threading.Lock()
+        self._entries                       = {}
+        self._is_modified                   = False
+
+        if os.path.isfile(filename):
+            try:
+                with open(filename, 'rb') as f:
+                    version, entries = pickle.load(f)
+
+                if version == self._VERSION:
+                    self._entries = entries
+
+            except Exception:
+                # The index will be rebuilt
+                pass
+
+    # ----------------------------------------------------------------------
+    def __enter__(self):
+        return self
+
+    # ----------------------------------------------------------------------
+    def __exit__(self, *args):
+        self.Save()
+
+    # ----------------------------------------------------------------------
+    def Save(self):
+        """Persists the index if it has been modified."""
+
+        with self._lock:
+            if not self._is_modified:
+                return
+
+            PersistedData.SavePickle(self.Filename, ( self._VERSION, self._entries ))
+
+            self._is_modified = False
+
+    # ----------------------------------------------------------------------
+    def Enumerate(self, directory):
+        """
+        Returns ( [ ( dir_name, is_symlink ), ... ], [ filename, ... ] ) for the directory.
+        Raises OSError if the directory can't be listed.
+        """
+
+        mtime = FileSystem.GetModificationTime(os.stat(directory))
+
+        with self._lock:
+            entry = self._entries.get(directory)
+
+        if entry is not None and entry[0] == mtime:
+            dirs, filenames = entry[1:]
+        else:
+            dirs, filenames = FileSystem.EnumerateDirectory(directory)
+
+            with self._lock:
+                if time.time() - mtime / 1000000000.0 >= self.RECENT_MODIFICATION_SECONDS:
+                    self._entries[directory] = ( mtime, dirs, filenames )
+                else:
+                    self._entries.pop(directory, None)
+
+                self._is_modified = True
+
+        # Return copies, as the caller may modify the lists
+        return list(dirs), list(filenames)
+
+    # ----------------------------------------------------------------------
+    def Invalidate(self, directories=None):
+        """Removes the provided directories (and their descendants) from the index, or all directories if None."""
+
+        with self._lock:
+            if directories is None:
+                self._entries = {}
+            else:
+                prefixes = []
+
+                for directory in directories:
+                    directory = os.path.realpath(directory)
+
+                    self._entries.pop(directory, None)
+                    prefixes.append(directory if directory.endswith(os.path.sep) else "{}{}".format(directory, os.path.sep))
+
+                prefixes = tuple(prefixes)
+
+                for key in [ key for key in six.iterkeys(self._entries) if key.startswith(prefixes) ]:
+                    del self._entries[key]
+
+            self._is_modified = True
@@ -15,11 +15,16 @@
 """Utilities helpful when working with the file system."""
 
 import hashlib
+import mmap
+import multiprocessing
 import os
+import re
 import sys
 import threading
 import time
 
+from collections import OrderedDict
+
 import six
 
 from CommonEnvironment.CallOnExit import CallOnExit
@@ -331,11 +336,16 @@ def WalkDirs( directory,
 
               recurse=True,
               include_generated=False,
+              directory_index=None,                     # DirectoryIndex.DirectoryIndex
             ):
     """
     Yields ( root, filenames ) on a (potentially) recursive search.
     
     All include/exclude values can be strings, callable, or regular expressions.
+
+    When 'directory_index' is provided, the contents of directories that haven't
+    changed since they were indexed are retrieved from the index rather than the
+    file system.
     """
 
     process_dir_name = _ProcessWalkArgs(include_dir_names, exclude_dir_names)
@@ -344,53 +354,30 @@ def WalkDirs( directory,
     process_traverse_dir_name = _ProcessWalkArgs(traverse_include_dir_names, traverse_exclude_dir_names)
     process_traverse_dir_path = _ProcessWalkArgs(traverse_include_dir_paths, traverse_exclude_dir_paths)
 
-    if include_generated:
-        # ----------------------------------------------------------------------
-        def IsValid(fullpath, directory):
-            return ( process_traverse_dir_path(fullpath) and
-                     process_traverse_dir_name(directory)
-                   )
-
-        # ----------------------------------------------------------------------
-    else:
-        # ----------------------------------------------------------------------
-        def IsValid(fullpath, directory):
-            return ( directory not in CODE_EXCLUDE_DIR_NAMES and
-                     process_traverse_dir_path(fullpath) and
-                     process_traverse_dir_name(directory)
-                   )
-
-        # ----------------------------------------------------------------------
+    exclude_dir_names = set() if include_generated else set(CODE_EXCLUDE_DIR_NAMES)
 
-    for root, dirs, filenames in os.walk(Normalize(directory)):
-        try:
-            root = str(root)
-        except UnicodeEncodeError:
-            continue
-
-        root = os.path.realpath(root)
+    # ----------------------------------------------------------------------
+    def IsValid(root, directory):
+        return ( directory not in exclude_dir_names and
+                 (process_traverse_dir_name is None or process_traverse_dir_name(directory)) and
+                 (process_traverse_dir_path is None or process_traverse_dir_path(os.path.join(root, directory)))
+               )
 
-        # Ensure that the drive letter is uppercase
-        drive, suffix = os.path.splitdrive(root)
-        drive = drive.upper()
+    # ----------------------------------------------------------------------
 
-        root = "{}{}".format(drive, suffix)
+    if directory_index is not None:
+        walk_func = lambda directory, is_valid_func, recurse: _ScandirWalk(directory, is_valid_func, recurse, enumerate_func=directory_index.Enumerate)
+    elif _USE_SCANDIR:
+        walk_func = _ScandirWalk
+    else:
+        walk_func = _OSWalk
 
-        if process_dir_path(root) and process_dir_name(os.path.basename(root)):
+    for root, filenames in walk_func(Normalize(directory), IsValid, recurse):
+        if ( (process_dir_path is None or process_dir_path(root)) and
+             (process_dir_name is None or process_dir_name(os.path.basename(root)))
+           ):
             yield root, filenames
 
-        index = 0
-        while index < len(dirs):
-            fullpath = os.path.join(root, dirs[index])
-
-            if not IsValid(fullpath, dirs[index]):
-                dirs.pop(index)
-            else:
-                index += 1
-
-        if not recurse:
-            dirs[:] = []
-
 # ----------------------------------------------------------------------
 def WalkFiles( directory,
 
@@ -420,11 +407,13 @@ def WalkFiles( directory,
 
                recurse=True,
                include_generated=False,
+               directory_index=None,                    # DirectoryIndex.DirectoryIndex
              ):
     """
     Yields <filename> on a (potentially) recursive search.
     
     All include/exclude values can be strings, callable, or regular expressions.
+    See WalkDirs for information on 'directory_index'.
     """
 
     process_file_name = _ProcessWalkArgs(include_file_names, exclude_file_names)
@@ -443,25 +432,79 @@ def WalkFiles( directory,
                                      traverse_exclude_dir_paths=traverse_exclude_dir_paths,
                                      recurse=recurse,
                                      include_generated=include_generated,
+                                     directory_index=directory_index,
                                    ):
+        # Equivalent to os.path.join, but without the per-file overhead
+        prefix = root if root.endswith(os.path.sep) else "{}{}".format(root, os.path.sep)
+
         for filename in filenames:
-            if not process_file_name(filename):
+            if process_file_name is not None and not process_file_name(filename):
                 continue
 
-            base_name, ext = os.path.splitext(filename)
+            if process_file_extension is not None or process_file_base_name is not None:
+                base_name, ext = os.path.splitext(filename)
 
-            if ( not process_file_extension(ext) or
-                 not process_file_base_name(base_name)
-               ):
-                continue
+                if ( (process_file_extension is not None and not process_file_extension(ext)) or
+                     (process_file_base_name is not None and not process_file_base_name(base_name))
+                   ):
+                    continue
 
-            fullpath = os.path.join(root, filename)
+            fullpath = prefix + filename
 
-            if not process_full_path(fullpath):
+            if process_full_path is not None and not process_full_path(fullpath):
                 continue
 
             yield fullpath
 
+# ----------------------------------------------------------------------
+def EnumerateDirectory(directory):
+    """
+    Returns ( [ ( dir_name, is_symlink ), ... ], [ filename, ... ] ) for the items
+    within the directory. Raises OSError if the directory can't be listed.
+    """
+
+    dirs = []
+    filenames = []
+
+    if hasattr(os, "scandir"):
+        for entry in os.scandir(directory):
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+
+            if not is_dir:
+                filenames.append(entry.name)
+                continue
+
+            try:
+                is_symlink = entry.is_symlink()
+            except OSError:
+                is_symlink = False
+
+            dirs.append(( entry.name, is_symlink ))
+
+    else:
+        for name in os.listdir(directory):
+            fullpath = os.path.join(directory, name)
+
+            if os.path.isdir(fullpath):
+                dirs.append(( name, os.path.islink(fullpath) ))
+            else:
+                filenames.append(name)
+
+    return dirs, filenames
+
+# ----------------------------------------------------------------------
+def GetModificationTime(stat_result):
+    """Returns the modification time (in nanoseconds) of the result of os.stat."""
+
+    mtime = getattr(stat_result, "st_mtime_ns", None)
+    if mtime is None:
+        mtime = int(stat_result.st_mtime * 1000000000)
+
+    return mtime
+
 # ----------------------------------------------------------------------
 def CalculateHashes( filenames,
                      optional_output_stream,
@@ -469,8 +512,61 @@ def CalculateHashes( filenames,
                      hash_block_size=65536,
                      hash_algorithm=hashlib.sha256,
                      hash_digest_name="digest",
+                     num_concurrent_tasks=1,
+                     mmap_min_size=4 * 1024 * 1024,
+                     hash_cache=None,               # HashCache.HashCache
                    ):
-    """Returns a list of hashe values calculated by each file"""
+    """
+    Returns a list of hashe values calculated by each file
+
+    When 'num_concurrent_tasks' is a value other than 1, files are hashed concurrently
+    ('None' uses a task for each core). Each task reads small files with a single
+    read and memory-maps files larger than 'mmap_min_size'; hashlib releases the
+    GIL while hashing, so these tasks are able to run in parallel. Hashes are
+    returned in the same order as the provided filenames.
+
+    When 'hash_cache' is provided, only files that have changed since they were
+    last hashed are read; the cache is updated with the new values.
+    """
+
+    if hash_cache is not None:
+        filenames = list(filenames)
+        algorithm = "{}.{}".format(hash_algorithm().name, hash_digest_name)
+
+        signatures_and_hashes = hash_cache.Lookup(filenames, algorithm)
+
+        hashes = [ hash for _, hash in signatures_and_hashes ]
+
+        stale_indexes = [ index for index, hash in enumerate(hashes) if hash is None and not CurrentShell.IsSymLink(filenames[index]) ]
+        if stale_indexes:
+            stale_hashes = CalculateHashes( [ filenames[index] for index in stale_indexes ],
+                                            optional_output_stream,
+                                            no_status=no_status,
+                                            hash_block_size=hash_block_size,
+                                            hash_algorithm=hash_algorithm,
+                                            hash_digest_name=hash_digest_name,
+                                            num_concurrent_tasks=num_concurrent_tasks,
+                                            mmap_min_size=mmap_min_size,
+                                          )
+
+            for index, hash in six.moves.zip(stale_indexes, stale_hashes):
+                hashes[index] = hash
+
+            hash_cache.Update( [ ( filenames[index], signatures_and_hashes[index][0], hashes[index] ) for index in stale_indexes ],
+                               algorithm,
+                             )
+
+        return hashes
+
+    if num_concurrent_tasks != 1:
+        return _CalculateHashesConcurrently( list(filenames),
+                                             optional_output_stream,
+                                             no_status,
+                                             hash_algorithm,
+                                             hash_digest_name,
+                                             num_concurrent_tasks,
+                                             mmap_min_size,
+                                           )
 
     hashes = []
 
@@ -633,53 +729,218 @@ def _RemoveImpl( func,                      # def Func(path)
     func(renamed_path)
 
 # ----------------------------------------------------------------------
-def _ProcessWalkArgs(include_items, exclude_items):
+def _CalculateHashesConcurrently( filenames,
+                                  optional_output_stream,
+                                  no_status,
+                                  hash_algorithm,
+                                  hash_digest_name,
+                                  num_concurrent_tasks,
+                                  mmap_min_size,
+                                ):
+    from CommonEnvironment import TaskPool
+
+    hashes = [ None, ] * len(filenames)
+
     # ----------------------------------------------------------------------
-    def Preprocess(items):
-        if items is None:
-            return []
+    def Impl(task_index, on_status_update):
+        filename = filenames[task_index]
+
+        if CurrentShell.IsSymLink(filename):
+            return
+
+        hash = hash_algorithm()
 
-        if isinstance(items, list):
-            return items
+        with open(filename, 'rb') as f:
+            file_size = os.fstat(f.fileno()).st_size
 
-        return [ items, ]
+            if not no_status:
+                on_status_update(GetSizeDisplay(file_size))
+
+            # Empty files can't be mapped
+            if file_size >= mmap_min_size and file_size != 0:
+                mapped_file = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                with CallOnExit(mapped_file.close):
+                    hash.update(mapped_file)
+            else:
+                hash.update(f.read())
+
+        hashes[task_index] = getattr(hash, hash_digest_name)()
 
     # ----------------------------------------------------------------------
-    def IsIn(value, items):
-        for item in items:
-            if isinstance(item, six.string_types) and item == value:
-                return True
 
-            elif callable(item):
+    # TaskPool uses more tasks than cores by default, which is appropriate for tasks that
+    # wait on I/O but not for hashing.
+    TaskPool.Execute( [ TaskPool.Task(filename, Impl) for filename in filenames ],
+                      optional_output_stream,
+                      progress_bar=bool(optional_output_stream),
+                      raise_on_error=True,
+                      num_concurrent_tasks=num_concurrent_tasks or multiprocessing.cpu_count(),
+                    )
+
+    return hashes
+
+# ----------------------------------------------------------------------
+_USE_SCANDIR                                = hasattr(os, "scandir")
+
+_RegexType                                  = type(re.compile(''))
+_inline_flags_regex                         = re.compile(r"\(\?[aiLmsux]+\)")
+
+# ----------------------------------------------------------------------
+def _OSWalk(directory, is_valid_func, recurse):
+    for root, dirs, filenames in os.walk(directory):
+        try:
+            root = str(root)
+        except UnicodeEncodeError:
+            continue
+
+        root = os.path.realpath(root)
+
+        # Ensure that the drive letter is uppercase
+        drive, suffix = os.path.splitdrive(root)
+        drive = drive.upper()
+
+        root = "{}{}".format(drive, suffix)
+
+        yield root, filenames
+
+        if not recurse:
+            dirs[:] = []
+            continue
+
+        dirs[:] = [ dir_name for dir_name in dirs if is_valid_func(root, dir_name) ]
+
+# ----------------------------------------------------------------------
+def _ScandirWalk( directory,
+                  is_valid_func,
+                  recurse,
+                  enumerate_func=None,      # def Func(directory) -> ( [ ( dir_name, is_symlink ), ... ], [ filename, ... ] )
+                ):
+    # Produces the same results as _OSWalk. Symbolic links are not traversed
+    # (as is the case with os.walk), so the real path of the initial directory
+    # is sufficient to produce real paths for all of its descendants.
+    root = os.path.realpath(directory)
+
+    # Ensure that the drive letter is uppercase
+    drive, suffix = os.path.splitdrive(root)
+    root = "{}{}".format(drive.upper(), suffix)
+
+    enumerate_func = enumerate_func or EnumerateDirectory
+
+    roots = [ root, ]
+
+    while roots:
+        root = roots.pop()
+
+        try:
+            dirs, filenames = enumerate_func(root)
+        except OSError:
+            continue
+
+        yield root, filenames
+
+        if not recurse:
+            continue
+
+        child_roots = []
+
+        for dir_name, is_symlink in dirs:
+            if is_valid_func(root, dir_name) and not is_symlink:
+                child_roots.append(os.path.join(root, dir_name))
+
+        # Dirs are processed in the order in which they were enumerated
+        roots += reversed(child_roots)
+
+# ----------------------------------------------------------------------
+def _ProcessWalkArgs(include_items, exclude_items):
+    """Returns a function that returns True if the value should be processed, or None if all values should be processed."""
+
+    is_included = _CreateWalkMatcher(include_items)
+    is_excluded = _CreateWalkMatcher(exclude_items)
+
+    if is_included is None:
+        if is_excluded is None:
+            return None
+
+        return lambda value: not is_excluded(value)
+
+    if is_excluded is None:
+        return is_included
+
+    return lambda value: not is_excluded(value) and is_included(value)
+
+# ----------------------------------------------------------------------
+def _CreateWalkMatcher(items):
+    """
+    Returns a function that returns True if a value matches any of the items, or None
+    if there aren't any items. String items are matched with a single set lookup, and
+    regular expressions are combined into a single expression when possible.
+    """
+
+    if items is None:
+        return None
+
+    if not isinstance(items, list):
+        items = [ items, ]
+
+    if not items:
+        return None
+
+    literals = set()
+    regex_patterns = OrderedDict()
+    match_funcs = []
+
+    for item in items:
+        if isinstance(item, six.string_types):
+            literals.add(item)
+
+        elif callable(item):
+            # ----------------------------------------------------------------------
+            def Impl(value, item=item):
                 try:
-                    if item(value):
-                        return True
-                except: 
-                    pass
+                    return item(value)
+                except:
+                    return False
 
-            elif hasattr(item, "match") and item.match(value):
-                return True
+            # ----------------------------------------------------------------------
 
-        return False
+            match_funcs.append(Impl)
 
-    # ----------------------------------------------------------------------
+        elif ( isinstance(item, _RegexType) and
+               isinstance(item.pattern, six.string_types) and
+               item.groups == 0 and
+               not _inline_flags_regex.search(item.pattern)
+             ):
+            regex_patterns.setdefault(item.flags, []).append(item.pattern)
+
+        elif hasattr(item, "match"):
+            match_funcs.append(item.match)
 
-    include_items = Preprocess(include_items)
-    exclude_items = Preprocess(exclude_items)
+    for flags, patterns in six.iteritems(regex_patterns):
+        try:
+            regex = re.compile('|'.join([ "(?:{})".format(pattern) for pattern in patterns ]), flags)
+        except re.error:
+            match_funcs += [ re.compile(pattern, flags).match for pattern in patterns ]
+            continue
+
+        match_funcs.append(regex.match)
+
+    if not match_funcs:
+        return literals.__contains__
 
     # ----------------------------------------------------------------------
-    def Impl(value):
-        if exclude_items and IsIn(value, exclude_items):
-            return False
+    def Matcher(value):
+        if value in literals:
+            return True
 
-        if include_items and not IsIn(value, include_items):
-            return False
+        for match_func in match_funcs:
+            if match_func(value):
+                return True
 
-        return True
+        return False
 
     # ----------------------------------------------------------------------
 
-    return Impl
+    return Matcher
 
 
 # TODO: CopyTree
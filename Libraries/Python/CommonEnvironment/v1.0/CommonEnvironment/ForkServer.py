@@ -0,0 +1,428 @@
+# ----------------------------------------------------------------------
+# |  
+# |  ForkServer.py
+# |  
+# |  David Brownell <db@DavidBrownell.com>
+# |      2018-06-18 08:42:17
+# |  
+# ----------------------------------------------------------------------
+# |  
+# |  Copyright David Brownell 2018.
+# |  Distributed under the Boost Software License, Version 1.0.
+# |  (See accompanying file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+# |  
+# ----------------------------------------------------------------------
+"""Contains the ForkServer object"""
+
+import errno
+import importlib
+import os
+import select
+import signal
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+
+import six
+import six.moves.cPickle as pickle
+
+# ----------------------------------------------------------------------
+_script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower() else sys.executable
+_script_dir, _script_name = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+_ZYGOTE_COMMAND_TEMPLATE                    = "import sys; sys.path.append({root!r}); from CommonEnvironment.ForkServer import _ZygoteMain; _ZygoteMain()"
+
+# Each message exchanged with the zygote is a pickled object preceded by its length
+_FRAME_HEADER                               = struct.Struct("!I")
+
+# ----------------------------------------------------------------------
+# |  
+# |  Public Types
+# |  
+# ----------------------------------------------------------------------
+class ForkServer(object):
+    """
+    Long-lived, pre-warmed Python interpreter (the zygote) that forks a child process
+    for each script that it runs. Modules imported by the zygote are available to
+    the children without the cost of starting a new interpreter and importing them
+    again.
+
+    The exit code and output of a script match the values returned by
+    Process.Execute('python "<filename>"'): stdout and stderr are merged and the
+    output is decoded with newlines converted.
+
+    Forking is only available on POSIX systems (see IsSupported).
+    """
+
+    DEFAULT_PRELOAD_MODULES                 = [ "six",
+                                                "unittest",
+                                                "CommonEnvironment",
+                                                "CommonEnvironment.CallOnExit",
+                                                "CommonEnvironment.CommandLine",
+                                                "CommonEnvironment.FileSystem",
+                                                "CommonEnvironment.Interface",
+                                                "CommonEnvironment.Process",
+                                                "CommonEnvironment.Shell.All",
+                                                "CommonEnvironment.TypeInfo.FundamentalTypes.All",
+                                              ]
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def IsSupported():
+        return hasattr(os, "fork")
+
+    # ----------------------------------------------------------------------
+    def __init__( self,
+                  preload_modules=None,         # Defaults to DEFAULT_PRELOAD_MODULES
+                  python_binary=None,           # Defaults to sys.executable
+                ):
+        if not self.IsSupported():
+            raise Exception("Processes can't be forked on this platform")
+
+        if preload_modules is None:
+            preload_modules = self.DEFAULT_PRELOAD_MODULES
+
+        self._process                       = subprocess.Popen( [ python_binary or sys.executable,
+                                                                  "-c",
+                                                                  _ZYGOTE_COMMAND_TEMPLATE.format(root=os.path.dirname(_script_dir)),
+                                                                ],
+                                                                stdin=subprocess.PIPE,
+                                                                stdout=subprocess.PIPE,
+                                                                close_fds=True,
+                                                              )
+
+        self._lock                          = threading.Lock()
+        self._pending                       = {}
+        self._next_id                       = 0
+        self._is_running                    = True
+
+        _WriteFrame(self._process.stdin.fileno(), list(preload_modules))
+
+        self._reader_thread                 = threading.Thread(target=self._ReaderThreadProc)
+        self._reader_thread.daemon = True
+        self._reader_thread.start()
+
+    # ----------------------------------------------------------------------
+    def __enter__(self):
+        return self
+
+    # ----------------------------------------------------------------------
+    def __exit__(self, *args):
+        self.Close()
+
+    # ----------------------------------------------------------------------
+    def Close(self):
+        """Stops the zygote once all running scripts have completed."""
+
+        with self._lock:
+            if self._process.stdin.closed:
+                return
+
+            self._process.stdin.close()
+
+        self._process.wait()
+        self._reader_thread.join()
+
+        self._process.stdout.close()
+
+    # ----------------------------------------------------------------------
+    def Execute(self, filename):
+        """
+        Runs the python script in a child process forked from the zygote.
+
+        Returns ( <exit_code>, <output> )
+        """
+
+        filename = os.path.abspath(filename)
+
+        output_handle, output_filename = tempfile.mkstemp()
+        os.close(output_handle)
+
+        try:
+            event = threading.Event()
+            result = [ -1, ]
+
+            with self._lock:
+                if self._is_running:
+                    request_id = self._next_id
+                    self._next_id += 1
+
+                    self._pending[request_id] = ( event, result )
+
+                    try:
+                        _WriteFrame( self._process.stdin.fileno(),
+                                     ( request_id, filename, output_filename, os.getcwd() ),
+                                   )
+                    except (IOError, OSError, ValueError):
+                        del self._pending[request_id]
+                        event.set()
+
+                else:
+                    event.set()
+
+            event.wait()
+
+            with open(output_filename, 'rb') as f:
+                content = f.read()
+
+        finally:
+            os.remove(output_filename)
+
+        return result[0], _Decode(content).replace('\r\n', '\n')
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _ReaderThreadProc(self):
+        fileno = self._process.stdout.fileno()
+
+        while True:
+            try:
+                response = _ReadFrame(fileno)
+            except (IOError, OSError):
+                response = None
+
+            if response is None:
+                break
+
+            request_id, exit_code = response
+
+            with self._lock:
+                event, result = self._pending.pop(request_id)
+
+            result[0] = exit_code
+            event.set()
+
+        # The zygote has terminated; any scripts that are still pending will never complete
+        with self._lock:
+            self._is_running = False
+
+            for event, _ in six.itervalues(self._pending):
+                event.set()
+
+            self._pending = {}
+
+# ----------------------------------------------------------------------
+# |  
+# |  Private Methods
+# |  
+# ----------------------------------------------------------------------
+def _ZygoteMain():
+    # Keep the protocol pipes away from stdin and stdout so that they aren't
+    # accidentally used by preloaded modules or inherited as stdio by children.
+    input_fileno = os.dup(0)
+    output_fileno = os.dup(1)
+
+    null_fileno = os.open(os.devnull, os.O_RDWR)
+    os.dup2(null_fileno, 0)
+    os.close(null_fileno)
+
+    os.dup2(2, 1)
+
+    for module_name in _ReadFrame(input_fileno) or []:
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            # The child will import the module itself (and report any errors)
+            pass
+
+    # Wake the main loop when a child terminates
+    wake_read_fileno, wake_write_fileno = os.pipe()
+
+    try:
+        import fcntl
+
+        fcntl.fcntl(wake_write_fileno, fcntl.F_SETFL, fcntl.fcntl(wake_write_fileno, fcntl.F_GETFL) | os.O_NONBLOCK)
+    except ImportError:
+        pass
+
+    # ----------------------------------------------------------------------
+    def OnChildTerminated(signum, frame):
+        try:
+            os.write(wake_write_fileno, b"\0")
+        except OSError:
+            pass
+
+    # ----------------------------------------------------------------------
+
+    signal.signal(signal.SIGCHLD, OnChildTerminated)
+
+    protocol_filenos = [ input_fileno, output_fileno, wake_read_fileno, wake_write_fileno, ]
+
+    children = {}
+    is_closing = False
+
+    try:
+        while not is_closing or children:
+            filenos = [ wake_read_fileno, ]
+            if not is_closing:
+                filenos.append(input_fileno)
+
+            try:
+                readable = select.select(filenos, [], [])[0]
+            except (select.error, OSError) as ex:
+                if ex.args[0] == errno.EINTR:
+                    continue
+
+                raise
+
+            if wake_read_fileno in readable:
+                os.read(wake_read_fileno, 4096)
+
+            if input_fileno in readable:
+                request = _ReadFrame(input_fileno)
+
+                if request is None:
+                    is_closing = True
+                else:
+                    request_id, filename, output_filename, working_dir = request
+
+                    # Don't duplicate buffered output in the child
+                    sys.stdout.flush()
+                    sys.stderr.flush()
+
+                    pid = os.fork()
+                    if pid == 0:
+                        _ExecuteChild(filename, output_filename, working_dir, protocol_filenos)
+
+                    children[pid] = request_id
+
+            while children:
+                try:
+                    pid, status = os.waitpid(-1, os.WNOHANG)
+                except OSError as ex:
+                    if ex.errno == errno.EINTR:
+                        continue
+
+                    raise
+
+                if pid == 0:
+                    break
+
+                request_id = children.pop(pid, None)
+                if request_id is None:
+                    continue
+
+                # Match the exit code reported by the shell used by Process.Execute
+                if os.WIFSIGNALED(status):
+                    exit_code = 128 + os.WTERMSIG(status)
+                else:
+                    exit_code = os.WEXITSTATUS(status)
+
+                _WriteFrame(output_fileno, ( request_id, exit_code ))
+
+    except KeyboardInterrupt:
+        pass
+
+# ----------------------------------------------------------------------
+def _ExecuteChild(filename, output_filename, working_dir, protocol_filenos):
+    """Runs the script as if it were invoked via 'python "<filename>"'; this method never returns."""
+
+    exit_code = 1
+
+    try:
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+
+        for fileno in protocol_filenos:
+            os.close(fileno)
+
+        output_fileno = os.open(output_filename, os.O_WRONLY | os.O_TRUNC)
+        os.dup2(output_fileno, 1)
+        os.dup2(output_fileno, 2)
+        os.close(output_fileno)
+
+        os.chdir(working_dir)
+
+        sys.argv = [ filename, ]
+        sys.path[0] = os.path.dirname(os.path.realpath(filename))
+
+        import atexit
+        import runpy
+
+        try:
+            runpy.run_path(filename, run_name="__main__")
+            exit_code = 0
+
+        except SystemExit as ex:
+            exit_code = _GetExitCode(ex.code)
+
+        except:
+            sys.excepthook(*sys.exc_info())
+            exit_code = 1
+
+        try:
+            atexit._run_exitfuncs()                 # <Access to a protected member> pylint: disable = W0212
+        except:
+            pass
+
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+    finally:
+        os._exit(exit_code)                         # <Access to a protected member> pylint: disable = W0212
+
+# ----------------------------------------------------------------------
+def _GetExitCode(code):
+    if code is None:
+        return 0
+
+    if isinstance(code, six.integer_types):
+        return code
+
+    sys.stderr.write("{}\n".format(code))
+    return 1
+
+# ----------------------------------------------------------------------
+def _WriteFrame(fileno, data):
+    data = pickle.dumps(data, 2)
+    data = _FRAME_HEADER.pack(len(data)) + data
+
+    while data:
+        data = data[os.write(fileno, data):]
+
+# ----------------------------------------------------------------------
+def _ReadFrame(fileno):
+    """Returns the unpickled data or None if the pipe has been closed."""
+
+    header = _ReadBytes(fileno, _FRAME_HEADER.size)
+    if header is None:
+        return None
+
+    data = _ReadBytes(fileno, _FRAME_HEADER.unpack(header)[0])
+    if data is None:
+        return None
+
+    return pickle.loads(data)
+
+# ----------------------------------------------------------------------
+def _ReadBytes(fileno, num_bytes):
+    content = []
+
+    while num_bytes:
+        data = os.read(fileno, num_bytes)
+        if not data:
+            return None
+
+        content.append(data)
+        num_bytes -= len(data)
+
+    return b''.join(content)
+
+# ----------------------------------------------------------------------
+def _Decode(content):
+    # Decode in the same way as Process.Execute
+    if sys.version_info[0] == 2:
+        return content
+
+    for codec in [ "utf-8",
+                   "ansi",
+                 ]:
+        try:
+            return content.decode(codec)
+        except (LookupError, UnicodeDecodeError):
+            pass
+
+    return content.decode("latin-1")
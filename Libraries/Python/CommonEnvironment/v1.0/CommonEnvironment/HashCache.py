@@ -0,0 +1,208 @@
+# ----------------------------------------------------------------------
+# |  
+# |  HashCache.py
+# |  
+# |  David Brownell <db@DavidBrownell.com>
+# |      2018-06-14 13:41:08
+# |  
+# ----------------------------------------------------------------------
+# |  
+# |  Copyright David Brownell 2018.
+# |  Distributed under the Boost Software License, Version 1.0.
+# |  (See accompanying file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+# |  
+# ----------------------------------------------------------------------
+"""Contains the HashCache object"""
+
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+import six
+
+from CommonEnvironment import FileSystem
+from CommonEnvironment import PersistedData
+
+# ----------------------------------------------------------------------
+_script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower() else sys.executable
+_script_dir, _script_name = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+# ----------------------------------------------------------------------
+# |  
+# |  Public Types
+# |  
+# ----------------------------------------------------------------------
+class HashCache(object):
+    """
+    Persisted hash values associated with files. A cached value is only returned
+    when the file's stat signature (size, modification time, and inode) matches
+    the signature of the file when it was hashed.
+
+    The data is stored in a SQLite database, which may be updated by multiple
+    processes at the same time.
+    """
+
+    DEFAULT_FILENAME                        = "HashCache.db"
+
+    # Files modified within this period of time are not cached, as subsequent changes
+    # may not be reflected in modification times on file systems with coarse timestamp
+    # resolution.
+    RECENT_MODIFICATION_SECONDS             = 2.0
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Create(cls, filename=None):
+        """Creates a HashCache; the default filename is located in the activated repository's Generated directory."""
+
+        if filename is None:
+            filename = PersistedData.GetGeneratedFilename(cls.DEFAULT_FILENAME)
+            if filename is None:
+                raise Exception("A filename must be provided when a repository has not been activated")
+
+        return cls(filename)
+
+    # ----------------------------------------------------------------------
+    def __init__( self,
+                  filename,
+                  timeout=60.0,             # seconds
+                ):
+        dirname = os.path.dirname(filename)
+        if dirname and not os.path.isdir(dirname):
+            os.makedirs(dirname)
+
+        self.Filename                       = filename
+
+        self._lock                          = threading.Lock()
+        self._connection                    = sqlite3.connect( filename,
+                                                               timeout=timeout,
+                                                               check_same_thread=False,
+                                                             )
+
+        try:
+            # WAL journals allow readers to proceed while another process is writing; this
+            # isn't supported on all file systems, in which case the default journal is used.
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.DatabaseError:
+            pass
+
+        with self._connection:
+            self._connection.execute(
+                """\
+                CREATE TABLE IF NOT EXISTS Hashes (
+                    filename TEXT NOT NULL,
+                    algorithm TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime INTEGER NOT NULL,
+                    inode INTEGER NOT NULL,
+                    value NOT NULL,
+                    PRIMARY KEY (filename, algorithm)
+                )
+                """)
+
+    # ----------------------------------------------------------------------
+    def __enter__(self):
+        return self
+
+    # ----------------------------------------------------------------------
+    def __exit__(self, *args):
+        self.Close()
+
+    # ----------------------------------------------------------------------
+    def Close(self):
+        with self._lock:
+            self._connection.close()
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def GetSignature(filename):
+        """Returns the stat signature of a file, or None if the file doesn't exist."""
+
+        try:
+            result = os.stat(filename)
+        except OSError:
+            return None
+
+        return ( result.st_size, FileSystem.GetModificationTime(result), result.st_ino )
+
+    # ----------------------------------------------------------------------
+    def Lookup(self, filenames, algorithm):
+        """
+        Returns a list of ( signature, value ) tuples for each filename; value is
+        None if the file hasn't been cached or has changed since it was cached.
+        """
+
+        results = []
+
+        with self._lock:
+            for filename in filenames:
+                signature = self.GetSignature(filename)
+
+                value = None
+
+                if signature is not None:
+                    row = self._connection.execute( "SELECT size, mtime, inode, value FROM Hashes WHERE filename = ? AND algorithm = ?",
+                                                    ( _NormalizeFilename(filename), algorithm ),
+                                                  ).fetchone()
+
+                    if row is not None and tuple(row[:3]) == signature:
+                        value = row[3]
+
+                        if not isinstance(value, six.string_types):
+                            value = bytes(value)
+
+                results.append(( signature, value ))
+
+        return results
+
+    # ----------------------------------------------------------------------
+    def Update(self, items, algorithm):
+        """
+        Updates the cache with ( filename, signature, value ) tuples, where signature
+        is the value returned by GetSignature before the file was hashed. Files that
+        changed while they were being hashed or were modified recently are not cached.
+        """
+
+        rows = []
+
+        now = time.time()
+
+        for filename, signature, value in items:
+            if signature is None or self.GetSignature(filename) != signature:
+                continue
+
+            if now - signature[1] / 1000000000.0 < self.RECENT_MODIFICATION_SECONDS:
+                continue
+
+            if isinstance(value, six.binary_type):
+                value = sqlite3.Binary(value)
+
+            rows.append(( _NormalizeFilename(filename), algorithm, signature[0], signature[1], signature[2], value ))
+
+        if not rows:
+            return
+
+        with self._lock, self._connection:
+            self._connection.executemany("INSERT OR REPLACE INTO Hashes VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+    # ----------------------------------------------------------------------
+    def Invalidate(self, filenames=None):
+        """Removes cached values for the provided filenames, or all values if filenames is None."""
+
+        with self._lock, self._connection:
+            if filenames is None:
+                self._connection.execute("DELETE FROM Hashes")
+            else:
+                self._connection.executemany( "DELETE FROM Hashes WHERE filename = ?",
+                                              [ ( _NormalizeFilename(filename), ) for filename in filenames ],
+                                            )
+
+# ----------------------------------------------------------------------
+# |  
+# |  Private Methods
+# |  
+# ----------------------------------------------------------------------
+def _NormalizeFilename(filename):
+    return os.path.normcase(os.path.realpath(filename))
@@ -15,14 +15,22 @@
 """Utilities to check for consistent interfaces at runtime"""
 
 import abc
+import atexit
+import hashlib
 import inspect
 import os
 import sys
 import textwrap
+import threading
+import traceback
+import weakref
 
 from collections import OrderedDict
 
 import six
+import six.moves.cPickle as pickle
+
+from CommonEnvironment import PersistedData
 
 # ----------------------------------------------------------------------
 _script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower() else sys.executable
@@ -34,6 +42,41 @@ _script_dir, _script_name = os.path.split(_script_fullpath)
 # ----------------------------------------------------------------------
 _is_python2                                 = sys.version_info[0] == 2
 
+_MAX_NUM_BINDING_PLANS                      = 128
+
+# Interface-based types are verified when they are instantiated for the first time; this
+# environment variable controls when that verification happens:
+#
+#     immediate:    Types are verified before the first instance is returned (default)
+#     background:   Types are verified on a background thread
+#     deferred:     Types are verified when VerifyAll is invoked
+#
+# Errors encountered in the background and deferred modes are raised by VerifyAll.
+VERIFICATION_MODE_ENV_VAR_NAME              = "DEVELOPMENT_ENVIRONMENT_INTERFACE_VERIFICATION"
+
+VERIFICATION_MODE_IMMEDIATE                 = "immediate"
+VERIFICATION_MODE_BACKGROUND                = "background"
+VERIFICATION_MODE_DEFERRED                  = "deferred"
+
+VERIFICATION_MODES                          = [ VERIFICATION_MODE_IMMEDIATE,
+                                                VERIFICATION_MODE_BACKGROUND,
+                                                VERIFICATION_MODE_DEFERRED,
+                                              ]
+
+VERIFICATION_MODE                           = os.getenv(VERIFICATION_MODE_ENV_VAR_NAME) or VERIFICATION_MODE_IMMEDIATE
+
+if VERIFICATION_MODE not in VERIFICATION_MODES:
+    raise Exception("'{}' is not a valid value for '{}'; valid values are {}".format( VERIFICATION_MODE,
+                                                                                       VERIFICATION_MODE_ENV_VAR_NAME,
+                                                                                       ", ".join([ "'{}'".format(mode) for mode in VERIFICATION_MODES ]),
+                                                                                     ))
+
+# Types that have been verified are persisted in this file (the default is located in the
+# activated repository's Generated directory) and aren't verified again until a file that
+# defines the type or one of its bases changes. Set the value to an empty string to disable
+# the cache.
+VERIFICATION_CACHE_ENV_VAR_NAME             = "DEVELOPMENT_ENVIRONMENT_INTERFACE_VERIFICATION_CACHE"
+
 # Introduce some abc items into the current namespace for convenience
 abstractmethod                              = abc.abstractmethod
 
@@ -102,364 +145,20 @@ class Interface(object):
         _verified_types                     = set()
 
         # ----------------------------------------------------------------------
-        # <Too many local variables> pylint: disable = R0914
         def __new__(cls, *args, **kwargs):
-            # If here, ABC has already validated that abstract methods and properties are
-            # present and named correctly. We not need to validate static methods and parameters.
-
             try:
                 try:
                     instance = super(Interface, cls).__new__(cls)
                 except TypeError as ex:
                     raise InterfaceException(str(ex))
             
-                if cls in Interface._verified_types:
-                    return instance
-
-                # ----------------------------------------------------------------------
-                class Entity(object):
-                    
-                    # ----------------------------------------------------------------------
-                    # |  Public Types
-
-                    # Enumeration values used to indicate type (not using enum, as this code has to be
-                    # backwards compatible with 2.7).
-                    ( StaticMethodType,
-                      ClassMethodType,
-                      MethodType,
-                      PropertyType,
-                    ) = six.moves.range(4)
-
-                    # ----------------------------------------------------------------------
-                    # <Too few public methods> pylint: disable = R0903
-                    class NoDefault(object):
-                        """
-                        Placeholder to indicate that a default value was not provided; we
-                        can't use None, as None may be the actual default value provided.
-                        """
-                        pass
-
-                    # ----------------------------------------------------------------------
-                    # |  Public Methods
-                    def __init__(self, item):
-                        if not _is_python2:
-                            while hasattr(item, "__func__"):
-                                item = item.__func__
-
-                        if IsStaticMethod(item):
-                            typ = Entity.StaticMethodType
-                        elif IsClassMethod(item):
-                            typ = Entity.ClassMethodType
-                        elif IsStandardMethod(item):
-                            typ = Entity.MethodType
-                        else:
-                            typ = Entity.PropertyType
-
-                        self.Type               = typ
-                        self.FuncCode           = getattr(item, "__code__", None)
-                        self.FuncDefaults       = getattr(item, "__defaults__", None)
-                
-                    # ----------------------------------------------------------------------
-                    def TypeString(self):
-                        if self.Type == Entity.StaticMethodType:
-                            return "staticmethod"
-                        if self.Type == Entity.ClassMethodType:
-                            return "classmethod"
-                        if self.Type == Entity.MethodType:
-                            return "method"
-                        if self.Type == Entity.PropertyType:
-                            return "property"
-
-                        assert False, self.Type
-                        return None
-
-                    # ----------------------------------------------------------------------
-                    def LocationString(self):
-                        if self.FuncCode is not None:
-                            filename = self.FuncCode.co_filename
-                            line = self.FuncCode.co_firstlineno
-                        else:
-                            filename = "Unknown"
-                            line = 0
-
-                        return "<{filename} [{line}]>".format( filename=filename,
-                                                               line=line,
-                                                             )
-
-                    # ----------------------------------------------------------------------
-                    def GetParams(self):
-                        assert self.Type != Entity.PropertyType
-
-                        params = OrderedDict()
-
-                        var_names = self.FuncCode.co_varnames[:self.FuncCode.co_argcount]
-                        default_value_offset = len(var_names) - len(self.FuncDefaults or [])
-
-                        for index, name in enumerate(var_names):
-                            # Skip the 'self' or 'cls' value as they aren't interesting when
-                            # it comes to argument comparison.
-                            if index == 0 and self.Type in [ Entity.MethodType, Entity.ClassMethodType, ]:
-                                continue
-
-                            if index >= default_value_offset:
-                                params[name] = self.FuncDefaults[index - default_value_offset]
-                            else:
-                                params[name] = Entity.NoDefault
-
-                        return params
-
-                # ----------------------------------------------------------------------
-
-                # Get all the abstract items and make that information available via the class type
-                abstracts = OrderedDict()
-                extension_methods = {}
-
-                for base in reversed(inspect.getmro(cls)):
-                    these_abstracts = []
-
-                    for member_name, member_info in inspect.getmembers(base):
-                        if getattr(member_info, "__extension_method", False):
-                            entity = Entity(member_info)
-
-                            extension_methods[entity.LocationString()] = "{}.{}".format( type(instance).__name__,
-                                                                                         member_name,
-                                                                                       )
-
-                        if getattr(member_info, "__isabstractmethod__", False):
-                            these_abstracts.append(member_name)
-
-                            if member_name not in abstracts:
-                                abstracts[member_name] = Entity(member_info)
-                                
-                    if these_abstracts and base not in Interface._verified_types:
-                        Interface._verified_types.add(base)
-                        base.AbstractItems = these_abstracts
-
-                extension_method_keys = list(six.iterkeys(extension_methods))
-                extension_method_keys.sort()
-
-                cls.ExtensionMethods = [ "{0:<50} {1}".format( extension_methods[emk],
-                                                               emk,
-                                                             )
-                                         for emk in extension_method_keys
-                                       ]
-
-
-                # Ensure that all abstracts exist
-                errors = []
-
-                # ----------------------------------------------------------------------
-                def HasEntity(abstract_name, abstract_entity):
-                    if abstract_entity.Type == Entity.MethodType:
-                        value = getattr(cls, abstract_name, None)
-                        if value is None:
-                            return False
-
-                        try:
-                            if six.get_function_code(value) == abstract_entity.FuncCode:
-                                return False
-                        except AttributeError:
-                            return False
-
-                    return hasattr(cls, abstract_name)
-
-                # ----------------------------------------------------------------------
-
-                for abstract_name, abstract_entity in six.iteritems(abstracts):
-                    if not HasEntity(abstract_name, abstract_entity):
-                        errors.append("The abstract {type_} '{name}' is missing {location}".format( type_=abstract_entity.TypeString(),
-                                                                                                    name=abstract_name,
-                                                                                                    location=abstract_entity.LocationString(),
-                                                                                                  ))
-
-                if errors:
-                    raise InterfaceException(errors)
-
-                # Ensure that all abstracts are of the correct type
-                errors = []
-
-                for abstract_name, abstract_entity in six.iteritems(abstracts):
-                    concrete_value = getattr(cls, abstract_name)
-                    concrete_entity = Entity(concrete_value)
-
-                    # Check if the types are the same. Allow for an abstract static
-                    # method to be fulfilled by a standard method.
-                    if not ( abstract_entity.Type == concrete_entity.Type or
-                             ( abstract_entity.Type in [ Entity.StaticMethodType, Entity.ClassMethodType, Entity.MethodType, ] and 
-                               concrete_entity.Type in [ Entity.StaticMethodType, Entity.ClassMethodType, Entity.MethodType, ]
-                             )
-                           ):
-                        errors.append("'{name}' was expected to be a {abstract_type} but {concrete_type} was found ({abstract_location}, {concrete_location})" \
-                                        .format( name=abstract_name,
-                                                 abstract_type=abstract_entity.TypeString(),
-                                                 abstract_location=abstract_entity.LocationString(),
-                                                 concrete_type=concrete_entity.TypeString(),
-                                                 concrete_location=concrete_entity.LocationString(),
-                                               ))
-
-                if errors:
-                    raise InterfaceException(errors)
-
-                # abc handles methods but not properties, static methods, or class methods. Use the 
-                # information associated with the function to ensure that the value defined is not the 
-                # same as the abstract value.
-                errors = []
-
-                for abstract_name, abstract_entity in six.iteritems(abstracts):
-                    if abstract_entity.Type == Entity.MethodType:
-                        continue
-
-                    concrete_value = getattr(cls, abstract_name)
-
-                    # ----------------------------------------------------------------------
-                    def IsMissing():
-                        if abstract_entity.Type == Entity.PropertyType:
-                            return getattr(concrete_value, "__isabstractmethod__", False)
-
-                        concrete_value_func_code = six.get_function_code(concrete_value)
-
-                        return ( concrete_value_func_code.co_filename == abstract_entity.FuncCode.co_filename and 
-                                 concrete_value_func_code.co_firstlineno == abstract_entity.FuncCode.co_firstlineno
-                               )
-
-                    # ----------------------------------------------------------------------
-
-                    if IsMissing():
-                        errors.append("The abstract {type_} '{name}' is missing {location}".format( type_=abstract_entity.TypeString(),
-                                                                                                    name=abstract_name,
-                                                                                                    location=abstract_entity.LocationString(),
-                                                                                                  ))
-
-                if errors:
-                    raise InterfaceException(errors)
-
-                # Ensure that the items are defined with the correct arguments
-                errors = []
-
-                kwargs_flag = 4
-                var_args_flag = 8
-
-                for abstract_name, abstract_entity in six.iteritems(abstracts):
-                    if abstract_entity.Type == Entity.PropertyType:
-                        continue
-
-                    concrete_value = getattr(cls, abstract_name)
-                    concrete_entity = Entity(concrete_value)
-                    concrete_params = concrete_entity.GetParams()
-
-                    abstract_params = abstract_entity.GetParams()
-
-                    # We can skip the test if either the abstract or concrete params are
-                    # forwarding functions:
-                    #   def Func(*args, **kwargs)
-
-                    # ----------------------------------------------------------------------
-                    def IsForwardingFunction(entity, params):
-                        return ( not params and
-                                 entity.FuncCode.co_flags & kwargs_flag and 
-                                 entity.FuncCode.co_flags & var_args_flag
-                               )
-
-                    # ----------------------------------------------------------------------
-
-                    if IsForwardingFunction(abstract_entity, abstract_params):
-                        continue
-
-                    if IsForwardingFunction(concrete_entity, concrete_params):
-                        continue
-
-                    # If the abstract specifies a variable number of args, only check those
-                    # that come before them
-                    require_exact_match = True
-
-                    for flag in [ kwargs_flag, var_args_flag, ]:
-                        if abstract_entity.FuncCode.co_flags & flag:
-                            require_exact_match = False
-                            break
-
-                    # This is not standard from an object-oriented perspective, but allow custom parameters
-                    # with default values in concrete definitions that weren't specified in the abstract
-                    # definition.
-                    if len(concrete_params) > len(abstract_params):
-                        params_to_remove = min(len(concrete_params) - len(abstract_params), len(concrete_entity.FuncDefaults or []))
-
-                        keys = list(six.iterkeys(concrete_params))
-
-                        for _ in range(params_to_remove):
-                            del concrete_params[keys.pop()]
-
-                    if ( (require_exact_match and len(concrete_params) != len(abstract_params)) or 
-                         not all(k in concrete_params and concrete_params[k] == v for k, v in six.iteritems(abstract_params))
-                       ):
-                        errors.append(( abstract_name, 
-                                        abstract_params, 
-                                        abstract_entity,
-                                        concrete_params,
-                                        concrete_entity,
-                                      ))
-
-                if errors:
-                    # ----------------------------------------------------------------------
-                    def DisplayParams(params):
-                        values = []
-                        has_default_value = False
-
-                        for name, default_value in six.iteritems(params):
-                            if default_value != Entity.NoDefault:
-                                has_default_value = True
-
-                                values.append("{name:<40}  {default:<20}  {type_}".format( name=name,
-                                                                                           default=str(default_value),
-                                                                                           type_=type(default_value),
-                                                                                         ))
-                            else:
-                                values.append(name)
-
-                        if has_default_value:
-                            return '\n'.join([ "            {}".format(value) for value in values ])
-
-                        return "            {}".format(", ".join(values))
-
-                    # ----------------------------------------------------------------------
-
-                    raise InterfaceException([ textwrap.dedent(
-                                                    # <Wrong hanging indentation> pylint: disable = C0330
-                                                    """\
-                                                    {name}
-                                                            Abstract {abstract_location}
-                                                    {abstract_params}
-                                            
-                                                            Concrete {concrete_location}
-                                                    {concrete_params}
-                                            
-                                                    """).format( name=name,
-                                                                 abstract_location=aentity.LocationString(),
-                                                                 abstract_params=DisplayParams(aparams),
-                                                                 concrete_location=centity.LocationString(),
-                                                                 concrete_params=DisplayParams(cparams),
-                                                               )
-                                               for name, aparams, aentity, cparams, centity in errors
-                                             ])
-
-                Interface._verified_types.add(cls)
+                if cls not in Interface._verified_types:
+                    _OnFirstInstantiation(cls)
 
                 return instance
 
             except InterfaceException as ex:
-                raise InterfaceException(textwrap.dedent(
-                    """\
-                    Can't instantiate class '{class_}' due to:
-                    {errors}
-                    """).format( class_=cls.__name__,
-                                 errors='\n'.join([ "    - {}".format(error) for error in (ex.args[0] if isinstance(ex.args[0], (list, tuple)) else [ ex.args[0], ]) ]),
-                               ))
-
-
-
-
-            
-
-        # ----------------------------------------------------------------------
+                raise InterfaceException(_CreateInstantiationErrorString(cls, ex))
 
 # ----------------------------------------------------------------------
 # |  
@@ -550,6 +249,12 @@ def CreateCulledCallable(func):
 
         culled_method(c=3, a=1) -> MyMethod(a=1)
         culled_method(x=10, z=20) -> MyMethod(a=10)
+
+    The mapping of incoming keyword arguments to func arguments (the "binding plan") is
+    calculated once for each distinct sequence of incoming keyword argument names and
+    cached. `culled_method.GetBindingPlan(names)` returns the plan as a tuple of
+    ( func_arg_name, incoming_arg_name ) pairs, or None if the incoming arguments are
+    forwarded to func without modification.
     """
     
     if _is_python2:
@@ -582,29 +287,84 @@ def CreateCulledCallable(func):
                 return func()
 
             # ----------------------------------------------------------------------
+
+        Invoke.GetBindingPlan = lambda names: None
+
     else:
+        binding_plans = {}
+
         # ----------------------------------------------------------------------
-        def Invoke(kwargs):
-            potential_positional_args = []
+        def GetBindingPlan(names):
+            names = tuple(names)
 
-            invoke_kwargs = {}
+            plan = binding_plans.get(names, None)
+            if plan is None:
+                plan = []
+                potential_positional_args = []
 
-            for k in list(six.iterkeys(kwargs)):
-                if k in arg_names:
-                    invoke_kwargs[k] = kwargs[k]
-                else:
-                    potential_positional_args.append(kwargs[k])
+                for name in names:
+                    if name in arg_names:
+                        plan.append(( name, name ))
+                    else:
+                        potential_positional_args.append(name)
 
-            for name in positional_arg_names:
-                if name not in kwargs and potential_positional_args:
-                    invoke_kwargs[name] = potential_positional_args.pop(0)
+                potential_positional_args.reverse()
 
-            return func(**invoke_kwargs)
+                for name in positional_arg_names:
+                    if name not in names and potential_positional_args:
+                        plan.append(( name, potential_positional_args.pop() ))
+
+                plan = tuple(plan)
+
+                # The number of distinct argument names is small in practice; don't cache
+                # plans indefinitely for callers that generate unique names.
+                if len(binding_plans) < _MAX_NUM_BINDING_PLANS:
+                    binding_plans[names] = plan
+
+            return plan
 
         # ----------------------------------------------------------------------
+        def Invoke(kwargs):
+            plan = binding_plans.get(tuple(kwargs), None)
+            if plan is None:
+                plan = GetBindingPlan(kwargs)
+
+            return func(**{ func_arg_name : kwargs[arg_name] for func_arg_name, arg_name in plan })
+
+        # ----------------------------------------------------------------------
+
+        Invoke.GetBindingPlan = GetBindingPlan
 
     return Invoke
 
+# ----------------------------------------------------------------------
+def VerifyAll():
+    """
+    Verifies all Interface-based types whose verification was deferred or is being
+    performed on a background thread, and raises an InterfaceException if any of them
+    are invalid. Continuous integration environments that use the "deferred" or
+    "background" verification modes should invoke this method before exiting.
+    """
+
+    if not __debug__:
+        return
+
+    _verification_queue.join()
+
+    with _verification_lock:
+        deferred_types = list(_deferred_types)
+        del _deferred_types[:]
+
+    for cls in deferred_types:
+        _VerifyScheduledType(cls)
+
+    with _verification_lock:
+        errors = list(_verification_errors)
+        del _verification_errors[:]
+
+    if errors:
+        raise InterfaceException('\n'.join(errors))
+
 # ----------------------------------------------------------------------
 if _is_python2:
     # ----------------------------------------------------------------------
@@ -677,3 +437,682 @@ def _CheckVariableNameVariants(var, *variants):
             return True
 
     return False
+
+# ----------------------------------------------------------------------
+def _OnFirstInstantiation(cls):
+    # Types that have already been scheduled for verification will be verified later
+    if cls in _scheduled_types:
+        return
+
+    cache = _GetVerificationCache()
+
+    if cache is not None and cache.IsVerified(cls):
+        Interface._verified_types.add(cls)
+        return
+
+    if VERIFICATION_MODE == VERIFICATION_MODE_IMMEDIATE:
+        _VerifyType(cls)
+
+        if cache is not None:
+            cache.Add(cls)
+
+        return
+
+    with _verification_lock:
+        if cls in _scheduled_types:
+            return
+
+        _scheduled_types.add(cls)
+
+        if VERIFICATION_MODE == VERIFICATION_MODE_DEFERRED:
+            _deferred_types.append(cls)
+            return
+
+    _verification_queue.put(cls)
+
+# ----------------------------------------------------------------------
+def _VerifyScheduledType(cls):
+    """Verifies a type scheduled by _OnFirstInstantiation, returning an error string if the type is invalid."""
+
+    # Invalid types remain in _scheduled_types so that they are only reported once
+    try:
+        _VerifyType(cls)
+    except InterfaceException as ex:
+        error = _CreateInstantiationErrorString(cls, ex)
+
+        with _verification_lock:
+            _verification_errors.append(error)
+
+        return error
+
+    cache = _GetVerificationCache()
+    if cache is not None:
+        cache.Add(cls)
+
+    return None
+
+# ----------------------------------------------------------------------
+# <Too many local variables> pylint: disable = R0914
+def _VerifyType(cls):
+    """Raises InterfaceException if the concrete type doesn't correctly implement its abstract items"""
+
+    # If here, ABC has already validated that abstract methods and properties are
+    # present and named correctly. We not need to validate static methods and parameters.
+
+    # Get all the abstract items
+    abstracts = OrderedDict()
+
+    for base in reversed(inspect.getmro(cls)):
+        has_abstracts = False
+
+        for member_name, member_info in _GetMembers(base):
+            if getattr(member_info, "__isabstractmethod__", False):
+                has_abstracts = True
+
+                if member_name not in abstracts:
+                    abstracts[member_name] = _Entity(member_info)
+
+        if has_abstracts:
+            Interface._verified_types.add(base)
+
+    # Ensure that all abstracts exist
+    errors = []
+
+    # ----------------------------------------------------------------------
+    def HasEntity(abstract_name, abstract_entity):
+        if abstract_entity.Type == _Entity.MethodType:
+            value = getattr(cls, abstract_name, None)
+            if value is None:
+                return False
+
+            try:
+                if six.get_function_code(value) == abstract_entity.FuncCode:
+                    return False
+            except AttributeError:
+                return False
+
+        return hasattr(cls, abstract_name)
+
+    # ----------------------------------------------------------------------
+
+    for abstract_name, abstract_entity in six.iteritems(abstracts):
+        if not HasEntity(abstract_name, abstract_entity):
+            errors.append("The abstract {type_} '{name}' is missing {location}".format( type_=abstract_entity.TypeString(),
+                                                                                        name=abstract_name,
+                                                                                        location=abstract_entity.LocationString(),
+                                                                                      ))
+
+    if errors:
+        raise InterfaceException(errors)
+
+    # Ensure that all abstracts are of the correct type
+    errors = []
+
+    for abstract_name, abstract_entity in six.iteritems(abstracts):
+        concrete_value = getattr(cls, abstract_name)
+        concrete_entity = _Entity(concrete_value)
+
+        # Check if the types are the same. Allow for an abstract static
+        # method to be fulfilled by a standard method.
+        if not ( abstract_entity.Type == concrete_entity.Type or
+                 ( abstract_entity.Type in [ _Entity.StaticMethodType, _Entity.ClassMethodType, _Entity.MethodType, ] and
+                   concrete_entity.Type in [ _Entity.StaticMethodType, _Entity.ClassMethodType, _Entity.MethodType, ]
+                 )
+               ):
+            errors.append("'{name}' was expected to be a {abstract_type} but {concrete_type} was found ({abstract_location}, {concrete_location})" \
+                            .format( name=abstract_name,
+                                     abstract_type=abstract_entity.TypeString(),
+                                     abstract_location=abstract_entity.LocationString(),
+                                     concrete_type=concrete_entity.TypeString(),
+                                     concrete_location=concrete_entity.LocationString(),
+                                   ))
+
+    if errors:
+        raise InterfaceException(errors)
+
+    # abc handles methods but not properties, static methods, or class methods. Use the
+    # information associated with the function to ensure that the value defined is not the
+    # same as the abstract value.
+    errors = []
+
+    for abstract_name, abstract_entity in six.iteritems(abstracts):
+        if abstract_entity.Type == _Entity.MethodType:
+            continue
+
+        concrete_value = getattr(cls, abstract_name)
+
+        # ----------------------------------------------------------------------
+        def IsMissing():
+            if abstract_entity.Type == _Entity.PropertyType:
+                return getattr(concrete_value, "__isabstractmethod__", False)
+
+            concrete_value_func_code = six.get_function_code(concrete_value)
+
+            return ( concrete_value_func_code.co_filename == abstract_entity.FuncCode.co_filename and
+                     concrete_value_func_code.co_firstlineno == abstract_entity.FuncCode.co_firstlineno
+                   )
+
+        # ----------------------------------------------------------------------
+
+        if IsMissing():
+            errors.append("The abstract {type_} '{name}' is missing {location}".format( type_=abstract_entity.TypeString(),
+                                                                                        name=abstract_name,
+                                                                                        location=abstract_entity.LocationString(),
+                                                                                      ))
+
+    if errors:
+        raise InterfaceException(errors)
+
+    # Ensure that the items are defined with the correct arguments
+    errors = []
+
+    kwargs_flag = 4
+    var_args_flag = 8
+
+    for abstract_name, abstract_entity in six.iteritems(abstracts):
+        if abstract_entity.Type == _Entity.PropertyType:
+            continue
+
+        concrete_value = getattr(cls, abstract_name)
+        concrete_entity = _Entity(concrete_value)
+        concrete_params = concrete_entity.GetParams()
+
+        abstract_params = abstract_entity.GetParams()
+
+        # We can skip the test if either the abstract or concrete params are
+        # forwarding functions:
+        #   def Func(*args, **kwargs)
+
+        # ----------------------------------------------------------------------
+        def IsForwardingFunction(entity, params):
+            return ( not params and
+                     entity.FuncCode.co_flags & kwargs_flag and
+                     entity.FuncCode.co_flags & var_args_flag
+                   )
+
+        # ----------------------------------------------------------------------
+
+        if IsForwardingFunction(abstract_entity, abstract_params):
+            continue
+
+        if IsForwardingFunction(concrete_entity, concrete_params):
+            continue
+
+        # If the abstract specifies a variable number of args, only check those
+        # that come before them
+        require_exact_match = True
+
+        for flag in [ kwargs_flag, var_args_flag, ]:
+            if abstract_entity.FuncCode.co_flags & flag:
+                require_exact_match = False
+                break
+
+        # This is not standard from an object-oriented perspective, but allow custom parameters
+        # with default values in concrete definitions that weren't specified in the abstract
+        # definition.
+        if len(concrete_params) > len(abstract_params):
+            params_to_remove = min(len(concrete_params) - len(abstract_params), len(concrete_entity.FuncDefaults or []))
+
+            keys = list(six.iterkeys(concrete_params))
+
+            for _ in range(params_to_remove):
+                del concrete_params[keys.pop()]
+
+        if ( (require_exact_match and len(concrete_params) != len(abstract_params)) or
+             not all(k in concrete_params and concrete_params[k] == v for k, v in six.iteritems(abstract_params))
+           ):
+            errors.append(( abstract_name,
+                            abstract_params,
+                            abstract_entity,
+                            concrete_params,
+                            concrete_entity,
+                          ))
+
+    if errors:
+        # ----------------------------------------------------------------------
+        def DisplayParams(params):
+            values = []
+            has_default_value = False
+
+            for name, default_value in six.iteritems(params):
+                if default_value != _Entity.NoDefault:
+                    has_default_value = True
+
+                    values.append("{name:<40}  {default:<20}  {type_}".format( name=name,
+                                                                               default=str(default_value),
+                                                                               type_=type(default_value),
+                                                                             ))
+                else:
+                    values.append(name)
+
+            if has_default_value:
+                return '\n'.join([ "            {}".format(value) for value in values ])
+
+            return "            {}".format(", ".join(values))
+
+        # ----------------------------------------------------------------------
+
+        raise InterfaceException([ textwrap.dedent(
+                                        # <Wrong hanging indentation> pylint: disable = C0330
+                                        """\
+                                        {name}
+                                                Abstract {abstract_location}
+                                        {abstract_params}
+
+                                                Concrete {concrete_location}
+                                        {concrete_params}
+
+                                        """).format( name=name,
+                                                     abstract_location=aentity.LocationString(),
+                                                     abstract_params=DisplayParams(aparams),
+                                                     concrete_location=centity.LocationString(),
+                                                     concrete_params=DisplayParams(cparams),
+                                                   )
+                                   for name, aparams, aentity, cparams, centity in errors
+                                 ])
+
+    Interface._verified_types.add(cls)
+
+# ----------------------------------------------------------------------
+def _CreateInstantiationErrorString(cls, ex):
+    return textwrap.dedent(
+        """\
+        Can't instantiate class '{class_}' due to:
+        {errors}
+        """).format( class_=cls.__name__,
+                     errors='\n'.join([ "    - {}".format(error) for error in (ex.args[0] if isinstance(ex.args[0], (list, tuple)) else [ ex.args[0], ]) ]),
+                   )
+
+# ----------------------------------------------------------------------
+def _GetMembers(cls):
+    """Returns the same information as inspect.getmembers without calculating the lazily-evaluated Interface attributes"""
+
+    results = []
+
+    for member_name in dir(cls):
+        if member_name in _CLASS_ATTRIBUTE_NAMES:
+            continue
+
+        try:
+            member_info = getattr(cls, member_name)
+        except AttributeError:
+            continue
+
+        results.append(( member_name, member_info ))
+
+    return results
+
+# ----------------------------------------------------------------------
+def _GetAbstractItems(cls):
+    # Return the names of the abstract items defined by the most derived abstract type
+    for base in inspect.getmro(cls):
+        abstracts = [ member_name for member_name, member_info in _GetMembers(base) if getattr(member_info, "__isabstractmethod__", False) ]
+        if abstracts:
+            return abstracts
+
+    return []
+
+# ----------------------------------------------------------------------
+def _GetExtensionMethods(cls):
+    extension_methods = {}
+
+    for base in reversed(inspect.getmro(cls)):
+        for member_name, member_info in _GetMembers(base):
+            if getattr(member_info, "__extension_method", False):
+                extension_methods[_Entity(member_info).LocationString()] = "{}.{}".format( cls.__name__,
+                                                                                          member_name,
+                                                                                        )
+
+    extension_method_keys = list(six.iterkeys(extension_methods))
+    extension_method_keys.sort()
+
+    return [ "{0:<50} {1}".format( extension_methods[emk],
+                                   emk,
+                                 )
+             for emk in extension_method_keys
+           ]
+
+# ----------------------------------------------------------------------
+def _GetVerificationCache():
+    global _verification_cache
+
+    if _verification_cache is None:
+        with _verification_lock:
+            if _verification_cache is None:
+                filename = os.getenv(VERIFICATION_CACHE_ENV_VAR_NAME)
+                if filename is None:
+                    # The cache is disabled when running outside of an activated environment
+                    filename = PersistedData.GetGeneratedFilename(_VerificationCache.DEFAULT_FILENAME)
+                    if filename is not None and not os.path.isdir(os.path.dirname(filename)):
+                        filename = None
+
+                # False indicates that the cache has been disabled
+                _verification_cache = _VerificationCache(filename) if filename else False
+
+    return _verification_cache or None
+
+# ----------------------------------------------------------------------
+def _VerificationThreadProc():
+    while True:
+        cls = _verification_queue.get()
+
+        try:
+            error = _VerifyScheduledType(cls)
+            if error is not None:
+                sys.stderr.write("\n{}\n".format(error))
+
+        except:                                                             # <No exception type(s) specified> pylint: disable = W0702
+            # Errors that aren't InterfaceExceptions are unexpected; report them without
+            # terminating the thread.
+            with _verification_lock:
+                _verification_errors.append(traceback.format_exc())
+
+        finally:
+            _verification_queue.task_done()
+
+# ----------------------------------------------------------------------
+class _LazyVerificationQueue(object):
+    """Queue processed by a daemon thread that is started when the first item is added"""
+
+    # ----------------------------------------------------------------------
+    def __init__(self):
+        self._queue                         = None
+        self._lock                          = threading.Lock()
+
+    # ----------------------------------------------------------------------
+    def put(self, item):
+        with self._lock:
+            if self._queue is None:
+                self._queue = six.moves.queue.Queue()
+
+                thread = threading.Thread(target=_VerificationThreadProc)
+                thread.daemon = True
+                thread.start()
+
+        self._queue.put(item)
+
+    # ----------------------------------------------------------------------
+    def get(self):
+        return self._queue.get()
+
+    # ----------------------------------------------------------------------
+    def task_done(self):
+        self._queue.task_done()
+
+    # ----------------------------------------------------------------------
+    def join(self):
+        if self._queue is not None:
+            self._queue.join()
+
+# ----------------------------------------------------------------------
+class _Entity(object):
+    """Information about a method or property used when comparing abstract and concrete items"""
+
+    # ----------------------------------------------------------------------
+    # |  Public Types
+
+    # Enumeration values used to indicate type (not using enum, as this code has to be
+    # backwards compatible with 2.7).
+    ( StaticMethodType,
+      ClassMethodType,
+      MethodType,
+      PropertyType,
+    ) = six.moves.range(4)
+
+    # ----------------------------------------------------------------------
+    # <Too few public methods> pylint: disable = R0903
+    class NoDefault(object):
+        """
+        Placeholder to indicate that a default value was not provided; we
+        can't use None, as None may be the actual default value provided.
+        """
+        pass
+
+    # ----------------------------------------------------------------------
+    # |  Public Methods
+    def __init__(self, item):
+        if not _is_python2:
+            while hasattr(item, "__func__"):
+                item = item.__func__
+
+        if IsStaticMethod(item):
+            typ = _Entity.StaticMethodType
+        elif IsClassMethod(item):
+            typ = _Entity.ClassMethodType
+        elif IsStandardMethod(item):
+            typ = _Entity.MethodType
+        else:
+            typ = _Entity.PropertyType
+
+        self.Type               = typ
+        self.FuncCode           = getattr(item, "__code__", None)
+        self.FuncDefaults       = getattr(item, "__defaults__", None)
+
+    # ----------------------------------------------------------------------
+    def TypeString(self):
+        if self.Type == _Entity.StaticMethodType:
+            return "staticmethod"
+        if self.Type == _Entity.ClassMethodType:
+            return "classmethod"
+        if self.Type == _Entity.MethodType:
+            return "method"
+        if self.Type == _Entity.PropertyType:
+            return "property"
+
+        assert False, self.Type
+        return None
+
+    # ----------------------------------------------------------------------
+    def LocationString(self):
+        if self.FuncCode is not None:
+            filename = self.FuncCode.co_filename
+            line = self.FuncCode.co_firstlineno
+        else:
+            filename = "Unknown"
+            line = 0
+
+        return "<{filename} [{line}]>".format( filename=filename,
+                                               line=line,
+                                             )
+
+    # ----------------------------------------------------------------------
+    def GetParams(self):
+        assert self.Type != _Entity.PropertyType
+
+        params = OrderedDict()
+
+        var_names = self.FuncCode.co_varnames[:self.FuncCode.co_argcount]
+        default_value_offset = len(var_names) - len(self.FuncDefaults or [])
+
+        for index, name in enumerate(var_names):
+            # Skip the 'self' or 'cls' value as they aren't interesting when
+            # it comes to argument comparison.
+            if index == 0 and self.Type in [ _Entity.MethodType, _Entity.ClassMethodType, ]:
+                continue
+
+            if index >= default_value_offset:
+                params[name] = self.FuncDefaults[index - default_value_offset]
+            else:
+                params[name] = _Entity.NoDefault
+
+        return params
+
+# ----------------------------------------------------------------------
+class _ClassAttribute(object):
+    """Non-data descriptor whose value is calculated for each class when it is first requested"""
+
+    # ----------------------------------------------------------------------
+    def __init__(self, func):
+        self._func                          = func
+        self._values                        = weakref.WeakKeyDictionary()
+
+    # ----------------------------------------------------------------------
+    def __get__(self, instance, owner):
+        value = self._values.get(owner, None)
+        if value is None:
+            value = self._func(owner)
+            self._values[owner] = value
+
+        return value
+
+# ----------------------------------------------------------------------
+class _VerificationCache(object):
+    """
+    Persisted names of Interface-based types that have been verified. A type is only
+    considered to be verified when the contents of the files that define the type and
+    its bases match their contents when the type was verified.
+    """
+
+    DEFAULT_FILENAME                        = "InterfaceVerification.pickle"
+
+    _VERSION                                = 1
+
+    # ----------------------------------------------------------------------
+    def __init__(self, filename):
+        self.Filename                       = filename
+
+        self._lock                          = threading.Lock()
+        self._entries                       = self._Load(filename)
+        self._is_modified                   = False
+        self._file_hashes                   = {}
+
+        atexit.register(self.Save)
+
+    # ----------------------------------------------------------------------
+    def IsVerified(self, cls):
+        key = self._GetKey(cls)
+        if key is None:
+            return False
+
+        with self._lock:
+            signature = self._entries.get(key, None)
+
+        return signature is not None and signature == self._GetSignature(cls)
+
+    # ----------------------------------------------------------------------
+    def Add(self, cls):
+        key = self._GetKey(cls)
+        if key is None:
+            return
+
+        signature = self._GetSignature(cls)
+        if signature is None:
+            return
+
+        with self._lock:
+            self._entries[key] = signature
+            self._is_modified = True
+
+    # ----------------------------------------------------------------------
+    def Save(self):
+        """Persists the cache if it has been modified; errors are ignored, as the cache is an optimization."""
+
+        with self._lock:
+            if not self._is_modified:
+                return
+
+            try:
+                # Merge with changes made by other processes since the file was loaded
+                entries = self._Load(self.Filename)
+                entries.update(self._entries)
+
+                PersistedData.SavePickle(self.Filename, ( self._VERSION, sys.version_info[:2], entries ))
+
+            except (IOError, OSError):
+                pass
+
+            self._is_modified = False
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _Load(cls, filename):
+        if os.path.isfile(filename):
+            try:
+                with open(filename, 'rb') as f:
+                    version, python_version, entries = pickle.load(f)
+
+                if version == cls._VERSION and python_version == sys.version_info[:2]:
+                    return entries
+
+            except Exception:
+                # The cache will be rebuilt
+                pass
+
+        return {}
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _GetKey(cls):
+        # Only cache types that are uniquely identified by name; types defined within
+        # functions may share a name but not an implementation.
+        name = getattr(cls, "__qualname__", None)
+
+        if name is None:
+            # Python 2 doesn't provide qualified names, so ensure that the type can be
+            # found by name (which isn't the case for @staticderived types, as they are
+            # instantiated before their names are bound).
+            name = cls.__name__
+
+            if getattr(sys.modules.get(cls.__module__, None), name, None) is not cls:
+                return None
+
+        elif "<locals>" in name:
+            return None
+
+        return "{}.{}".format(cls.__module__, name)
+
+    # ----------------------------------------------------------------------
+    def _GetSignature(self, cls):
+        signature = []
+
+        for base in inspect.getmro(cls):
+            if base.__module__ in sys.builtin_module_names or base.__module__ in [ "builtins", "__builtin__", ]:
+                continue
+
+            file_hash = self._GetFileHash(getattr(sys.modules.get(base.__module__, None), "__file__", None))
+            if file_hash is None:
+                return None
+
+            signature.append(( base.__module__, base.__name__, file_hash ))
+
+        return tuple(signature)
+
+    # ----------------------------------------------------------------------
+    def _GetFileHash(self, filename):
+        if filename is None:
+            return None
+
+        if os.path.splitext(filename)[1] in [ ".pyc", ".pyo", ]:
+            filename = filename[:-1]
+
+        with self._lock:
+            if filename in self._file_hashes:
+                return self._file_hashes[filename]
+
+        try:
+            with open(filename, 'rb') as f:
+                file_hash = hashlib.sha1(f.read()).hexdigest()
+        except (IOError, OSError):
+            file_hash = None
+
+        with self._lock:
+            self._file_hashes[filename] = file_hash
+
+        return file_hash
+
+# ----------------------------------------------------------------------
+_CLASS_ATTRIBUTE_NAMES                      = set([ "AbstractItems", "ExtensionMethods", ])
+
+_verification_lock                          = threading.RLock()
+_verification_queue                         = _LazyVerificationQueue()
+_verification_cache                         = None
+
+_scheduled_types                            = set()
+_deferred_types                             = []
+_verification_errors                        = []
+
+if __debug__:
+    Interface.AbstractItems                 = _ClassAttribute(_GetAbstractItems)
+    Interface.ExtensionMethods              = _ClassAttribute(_GetExtensionMethods)
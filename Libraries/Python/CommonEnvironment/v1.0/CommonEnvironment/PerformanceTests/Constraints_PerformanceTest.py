@@ -0,0 +1,139 @@
+# ----------------------------------------------------------------------
+# |  
+# |  Constraints_PerformanceTest.py
+# |  
+# |  David Brownell <db@DavidBrownell.com>
+# |      2018-06-17 09:12:44
+# |  
+# ----------------------------------------------------------------------
+# |  
+# |  Copyright David Brownell 2018.
+# |  Distributed under the Boost Software License, Version 1.0.
+# |  (See accompanying file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+# |  
+# ----------------------------------------------------------------------
+"""Measures the per-call overhead of functions decorated with Constraints"""
+
+import os
+import sys
+import textwrap
+import time
+import unittest
+
+import six
+
+from CommonEnvironment import Constraints as ConstraintsMod
+from CommonEnvironment.Constraints import Constraints
+from CommonEnvironment.TypeInfo import ValidationException
+from CommonEnvironment.TypeInfo.FundamentalTypes.All import *
+
+# ----------------------------------------------------------------------
+_script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower() else sys.executable
+_script_dir, _script_name = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+NUM_CALLS                                   = 100000
+
+# ----------------------------------------------------------------------
+class StandardSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def test_Fundamental(self):
+        self._Compare( { "a" : IntTypeInfo(min=0, max=100),
+                         "b" : StringTypeInfo(),
+                         "c" : BoolTypeInfo(arity='?'),
+                       },
+                       ( 10, "value" ),
+                       { "c" : True, },
+                     )
+
+    # ----------------------------------------------------------------------
+    def test_Collection(self):
+        self._Compare( { "a" : IntTypeInfo(arity='*'),
+                         "b" : EnumTypeInfo([ "one", "two", "three", ]),
+                       },
+                       ( [ 1, 2, 3, ], "two" ),
+                       {},
+                     )
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _Compare(self, preconditions, args, kwargs):
+        arg_names = sorted(preconditions.keys())
+
+        # ----------------------------------------------------------------------
+        def Func(**kwargs):
+            return len(kwargs)
+
+        # ----------------------------------------------------------------------
+        def Uncompiled(*args, **kwargs):
+            # The implementation prior to the introduction of generated validators
+            for index, arg in enumerate(args):
+                kwargs[arg_names[index]] = arg
+
+            for k, v in six.iteritems(kwargs):
+                result = preconditions[k].ValidateNoThrow(v)
+                if result is not None:
+                    raise ValidationException("Validation for the arg '{}' failed - {}".format(k, result))
+
+            return Func(**kwargs)
+
+        # ----------------------------------------------------------------------
+        def Decorate():
+            # Func is invoked with a signature that matches the preconditions
+            exec_globals = { "Func" : Func, }
+            six.exec_("def Decorated({args}): return Func({kwargs})".format( args=", ".join(arg_names),
+                                                                             kwargs=", ".join([ "{0}={0}".format(arg) for arg in arg_names ]),
+                                                                           ), exec_globals)
+
+            return Constraints(**dict(preconditions))(exec_globals["Decorated"])
+
+        # ----------------------------------------------------------------------
+
+        compiled = Decorate()
+
+        prev_value = ConstraintsMod.VALIDATION_ENABLED
+        ConstraintsMod.VALIDATION_ENABLED = False
+
+        try:
+            disabled = Decorate()
+
+            # The validator is generated when the function is first invoked
+            disabled(*args, **kwargs)
+        finally:
+            ConstraintsMod.VALIDATION_ENABLED = prev_value
+
+        durations = []
+
+        for func in [ Uncompiled, compiled, disabled, ]:
+            start = time.time()
+
+            for _ in range(NUM_CALLS):
+                result = func(*args, **kwargs)
+
+            durations.append(time.time() - start)
+            self.assertEqual(result, len(preconditions))
+
+        sys.stdout.write(textwrap.dedent(
+            """\
+
+            {name} ({num_calls} calls)
+                Uncompiled:             {uncompiled:.3f}s
+                Compiled:               {compiled:.3f}s ({compiled_speedup:.1f}x)
+                Disabled:               {disabled:.3f}s ({disabled_speedup:.1f}x)
+            """).format( name=self.id(),
+                         num_calls=NUM_CALLS,
+                         uncompiled=durations[0],
+                         compiled=durations[1],
+                         compiled_speedup=durations[0] / durations[1],
+                         disabled=durations[2],
+                         disabled_speedup=durations[0] / durations[2],
+                       ))
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try: sys.exit(unittest.main(verbosity=2))
+    except KeyboardInterrupt: pass
@@ -0,0 +1,233 @@
+# ----------------------------------------------------------------------
+# |  
+# |  FileSystem_PerformanceTest.py
+# |  
+# |  David Brownell <db@DavidBrownell.com>
+# |      2018-06-14 08:12:36
+# |  
+# ----------------------------------------------------------------------
+# |  
+# |  Copyright David Brownell 2018.
+# |  Distributed under the Boost Software License, Version 1.0.
+# |  (See accompanying file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+# |  
+# ----------------------------------------------------------------------
+"""Measures the performance of functionality in FileSystem.py"""
+
+import os
+import re
+import sys
+import textwrap
+import time
+import unittest
+
+import six
+
+from CommonEnvironment.DirectoryIndex import DirectoryIndex
+from CommonEnvironment import FileSystem
+from CommonEnvironment.Shell.All import CurrentShell
+
+# ----------------------------------------------------------------------
+_script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower() else sys.executable
+_script_dir, _script_name = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+NUM_SMALL_FILES                             = 2000
+SMALL_FILE_SIZE                             = 16 * 1024
+
+NUM_LARGE_FILES                             = 16
+LARGE_FILE_SIZE                             = 32 * 1024 * 1024
+
+NUM_WALK_DIRS                               = 500
+NUM_WALK_FILES_PER_DIR                      = 100
+
+# ----------------------------------------------------------------------
+class CalculateHashesSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        cls._temp_dir = CurrentShell.CreateTempDirectory()
+
+        cls._small_filenames = cls._CreateFiles("Small", NUM_SMALL_FILES, SMALL_FILE_SIZE)
+        cls._large_filenames = cls._CreateFiles("Large", NUM_LARGE_FILES, LARGE_FILE_SIZE)
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def tearDownClass(cls):
+        FileSystem.RemoveTree(cls._temp_dir)
+
+    # ----------------------------------------------------------------------
+    def test_SmallFiles(self):
+        self._Compare(self._small_filenames)
+
+    # ----------------------------------------------------------------------
+    def test_LargeFiles(self):
+        self._Compare(self._large_filenames)
+
+    # ----------------------------------------------------------------------
+    def test_MixedFiles(self):
+        self._Compare(self._small_filenames + self._large_filenames)
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _CreateFiles(cls, prefix, num_files, file_size):
+        filenames = []
+
+        for index in six.moves.range(num_files):
+            filename = os.path.join(cls._temp_dir, "{}{}".format(prefix, index))
+
+            with open(filename, 'wb') as f:
+                f.write(os.urandom(file_size))
+
+            filenames.append(filename)
+
+        return filenames
+
+    # ----------------------------------------------------------------------
+    def _Compare(self, filenames):
+        results = {}
+
+        for num_concurrent_tasks in [ 1, None, ]:
+            start = time.time()
+            hashes = FileSystem.CalculateHashes(filenames, None, num_concurrent_tasks=num_concurrent_tasks)
+            duration = time.time() - start
+
+            results[num_concurrent_tasks] = ( duration, hashes )
+
+        self.assertEqual(results[None][1], results[1][1])
+
+        num_bytes = sum(os.path.getsize(filename) for filename in filenames)
+
+        sys.stdout.write(textwrap.dedent(
+            """\
+
+            {name} ({num_files} files, {size})
+                Sequential:             {sequential_throughput:.2f} MB/s ({sequential_duration:.3f}s)
+                Concurrent:             {concurrent_throughput:.2f} MB/s ({concurrent_duration:.3f}s)
+                Speedup:                {speedup:.1f}x
+            """).format( name=self.id(),
+                         num_files=len(filenames),
+                         size=FileSystem.GetSizeDisplay(num_bytes),
+                         sequential_throughput=num_bytes / results[1][0] / (1024 * 1024),
+                         sequential_duration=results[1][0],
+                         concurrent_throughput=num_bytes / results[None][0] / (1024 * 1024),
+                         concurrent_duration=results[None][0],
+                         speedup=results[1][0] / results[None][0],
+                       ))
+
+# ----------------------------------------------------------------------
+class WalkSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        cls._temp_dir = CurrentShell.CreateTempDirectory()
+
+        for dir_index in six.moves.range(NUM_WALK_DIRS):
+            dirname = os.path.join(cls._temp_dir, *[ "Dir{}".format(dir_index % (10 ** (depth + 1))) for depth in six.moves.range(3) ])
+            FileSystem.MakeDirs(dirname)
+
+            for file_index in six.moves.range(NUM_WALK_FILES_PER_DIR):
+                with open(os.path.join(dirname, "File{}{}".format(file_index, ".py" if file_index % 2 else ".txt")), 'w'):
+                    pass
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def tearDownClass(cls):
+        FileSystem.RemoveTree(cls._temp_dir)
+
+    # ----------------------------------------------------------------------
+    def test_WalkDirs(self):
+        self._Compare(FileSystem.WalkDirs)
+
+    # ----------------------------------------------------------------------
+    def test_WalkFiles(self):
+        self._Compare(FileSystem.WalkFiles)
+
+    # ----------------------------------------------------------------------
+    def test_WalkFilesWithFilters(self):
+        self._Compare( FileSystem.WalkFiles,
+                       include_file_extensions=[ ".py", ],
+                       traverse_exclude_dir_names=[ "Dir7", re.compile(r"Dir1\d"), lambda value: value == "Dir42", ],
+                       exclude_file_names=[ re.compile(r"File1.*"), re.compile(r"File2.*"), ],
+                     )
+
+    # ----------------------------------------------------------------------
+    def test_DirectoryIndex(self):
+        index_filename = CurrentShell.CreateTempFilename(".pickle")
+
+        try:
+            expected = list(FileSystem.WalkFiles(self._temp_dir))
+
+            durations = []
+
+            for _ in six.moves.range(3):
+                index = DirectoryIndex(index_filename)
+                index.RECENT_MODIFICATION_SECONDS = 0
+
+                start = time.time()
+                results = list(FileSystem.WalkFiles(self._temp_dir, directory_index=index))
+                index.Save()
+                durations.append(time.time() - start)
+
+                self.assertEqual(results, expected)
+
+        finally:
+            FileSystem.RemoveFile(index_filename)
+
+        sys.stdout.write(textwrap.dedent(
+            """\
+
+            {name} ({num_items} items)
+                Cold:                   {cold:.3f}s
+                Warm:                   {warm:.3f}s
+                Speedup:                {speedup:.1f}x
+            """).format( name=self.id(),
+                         num_items=len(expected),
+                         cold=durations[0],
+                         warm=min(durations[1:]),
+                         speedup=durations[0] / min(durations[1:]),
+                       ))
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _Compare(self, walk_func, **kwargs):
+        results = {}
+
+        for use_scandir in [ False, True, ]:
+            FileSystem._USE_SCANDIR = use_scandir
+            try:
+                start = time.time()
+                items = list(walk_func(self._temp_dir, **kwargs))
+                duration = time.time() - start
+            finally:
+                FileSystem._USE_SCANDIR = hasattr(os, "scandir")
+
+            results[use_scandir] = ( duration, items )
+
+        self.assertEqual(results[True][1], results[False][1])
+
+        sys.stdout.write(textwrap.dedent(
+            """\
+
+            {name} ({num_items} items)
+                os.walk:                {walk_duration:.3f}s
+                os.scandir:             {scandir_duration:.3f}s
+                Speedup:                {speedup:.1f}x
+            """).format( name=self.id(),
+                         num_items=len(results[True][1]),
+                         walk_duration=results[False][0],
+                         scandir_duration=results[True][0],
+                         speedup=results[False][0] / results[True][0],
+                       ))
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try: sys.exit(unittest.main(verbosity=2))
+    except KeyboardInterrupt: pass
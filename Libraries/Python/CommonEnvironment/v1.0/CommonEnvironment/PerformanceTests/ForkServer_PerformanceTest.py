@@ -0,0 +1,91 @@
+# ----------------------------------------------------------------------
+# |  
+# |  ForkServer_PerformanceTest.py
+# |  
+# |  David Brownell <db@DavidBrownell.com>
+# |      2018-06-18 11:02:48
+# |  
+# ----------------------------------------------------------------------
+# |  
+# |  Copyright David Brownell 2018.
+# |  Distributed under the Boost Software License, Version 1.0.
+# |  (See accompanying file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+# |  
+# ----------------------------------------------------------------------
+"""Compares the time to run this repository's unit tests in new processes and via ForkServer.py"""
+
+import os
+import sys
+import textwrap
+import time
+import unittest
+
+from CommonEnvironment import FileSystem
+from CommonEnvironment.ForkServer import ForkServer
+from CommonEnvironment import Process
+
+# ----------------------------------------------------------------------
+_script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower() else sys.executable
+_script_dir, _script_name = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+# ----------------------------------------------------------------------
+@unittest.skipUnless(ForkServer.IsSupported(), "Processes can't be forked on this platform")
+class StandardSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def test_UnitTests(self):
+        filenames = sorted( filename for filename in FileSystem.WalkFiles( os.path.dirname(_script_dir),
+                                                                           include_file_extensions=[ ".py", ],
+                                                                         )
+                            if filename.endswith("_UnitTest.py")
+                          )
+
+        # Process.Execute
+        start = time.time()
+
+        process_results = [ Process.Execute('"{}" "{}"'.format(sys.executable, filename)) for filename in filenames ]
+
+        process_duration = time.time() - start
+
+        # ForkServer (including the time to start the zygote and preload modules)
+        start = time.time()
+
+        with ForkServer() as server:
+            server_results = [ server.Execute(filename) for filename in filenames ]
+
+        server_duration = time.time() - start
+
+        for filename, process_result, server_result in zip(filenames, process_results, server_results):
+            self.assertEqual(server_result[0], process_result[0], filename)
+            self.assertEqual(self._GetSummaryLine(server_result[1]), self._GetSummaryLine(process_result[1]), filename)
+
+        sys.stdout.write(textwrap.dedent(
+            """\
+
+            {name} ({num_files} files)
+                Process.Execute:        {process_duration:.3f}s
+                ForkServer:             {server_duration:.3f}s ({speedup:.1f}x)
+            """).format( name=self.id(),
+                         num_files=len(filenames),
+                         process_duration=process_duration,
+                         server_duration=server_duration,
+                         speedup=process_duration / server_duration,
+                       ))
+
+        self.assertLess(server_duration, process_duration)
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _GetSummaryLine(output):
+        # The summary line ('OK' or 'FAILED (...)') is parsed by PyUnittestTestParser
+        return output.rstrip().split('\n')[-1]
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try: sys.exit(unittest.main(verbosity=2))
+    except KeyboardInterrupt: pass
@@ -0,0 +1,191 @@
+# ----------------------------------------------------------------------
+# |  
+# |  Interface_PerformanceTest.py
+# |  
+# |  David Brownell <db@DavidBrownell.com>
+# |      2018-06-18 13:22:40
+# |  
+# ----------------------------------------------------------------------
+# |  
+# |  Copyright David Brownell 2018.
+# |  Distributed under the Boost Software License, Version 1.0.
+# |  (See accompanying file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+# |  
+# ----------------------------------------------------------------------
+"""Measures the performance of functionality in Interface.py"""
+
+import inspect
+import os
+import sys
+import textwrap
+import time
+import unittest
+
+from collections import OrderedDict
+
+import six
+
+from CommonEnvironment import FileSystem
+from CommonEnvironment.Interface import CreateCulledCallable, \
+                                        VERIFICATION_CACHE_ENV_VAR_NAME, \
+                                        VERIFICATION_MODE_DEFERRED, \
+                                        VERIFICATION_MODE_ENV_VAR_NAME, \
+                                        VERIFICATION_MODE_IMMEDIATE
+from CommonEnvironment import Process
+from CommonEnvironment.Shell.All import CurrentShell
+
+# ----------------------------------------------------------------------
+_script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower() else sys.executable
+_script_dir, _script_name = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+NUM_CALLS                                   = 200000
+NUM_IMPORTS                                 = 5
+
+# ----------------------------------------------------------------------
+class CreateCulledCallableSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def test_Named(self):
+        self._Compare( lambda task_index, output_stream, on_status_update: task_index,
+                       OrderedDict([ ( "task_index", 1 ), ( "output_stream", None ), ( "on_status_update", None ), ( "is_debug", False ), ]),
+                     )
+
+    # ----------------------------------------------------------------------
+    def test_Positional(self):
+        self._Compare( lambda a, b, c=30: a,
+                       OrderedDict([ ( "task_index", 1 ), ( "output_stream", None ), ( "c", 3 ), ]),
+                     )
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _Compare(self, func, kwargs):
+        if sys.version_info[0] == 2:
+            arg_spec = inspect.getargspec(func)
+        else:
+            arg_spec = inspect.getfullargspec(func)
+
+        arg_names = { arg for arg in arg_spec.args }
+        positional_arg_names = arg_spec.args[:len(arg_spec.args) - len(arg_spec.defaults or [])]
+
+        # ----------------------------------------------------------------------
+        def Unplanned(kwargs):
+            # The implementation prior to the introduction of binding plans
+            potential_positional_args = []
+
+            invoke_kwargs = {}
+
+            for k in list(six.iterkeys(kwargs)):
+                if k in arg_names:
+                    invoke_kwargs[k] = kwargs[k]
+                else:
+                    potential_positional_args.append(kwargs[k])
+
+            for name in positional_arg_names:
+                if name not in kwargs and potential_positional_args:
+                    invoke_kwargs[name] = potential_positional_args.pop(0)
+
+            return func(**invoke_kwargs)
+
+        # ----------------------------------------------------------------------
+
+        durations = []
+        results = []
+
+        for invoke_func in [ Unplanned, CreateCulledCallable(func), ]:
+            start = time.time()
+
+            for _ in range(NUM_CALLS):
+                result = invoke_func(kwargs)
+
+            durations.append(time.time() - start)
+            results.append(result)
+
+        self.assertEqual(results[1], results[0])
+
+        sys.stdout.write(textwrap.dedent(
+            """\
+
+            {name} ({num_calls} calls)
+                Unplanned:              {unplanned:.3f}s
+                Planned:                {planned:.3f}s ({speedup:.1f}x)
+            """).format( name=self.id(),
+                         num_calls=NUM_CALLS,
+                         unplanned=durations[0],
+                         planned=durations[1],
+                         speedup=durations[0] / durations[1],
+                       ))
+
+# ----------------------------------------------------------------------
+@unittest.skipUnless(os.getenv("DEVELOPMENT_ENVIRONMENT_FUNDAMENTAL"), "Scripts/Tester.py can only be imported within an activated environment")
+class TesterImportSuite(unittest.TestCase):
+    """Measures the time required to import Scripts/Tester.py (and instantiate its plugins) with different verification settings"""
+
+    # ----------------------------------------------------------------------
+    def test_Import(self):
+        temp_dir = CurrentShell.CreateTempDirectory()
+
+        try:
+            cache_filename = os.path.join(temp_dir, "InterfaceVerification.pickle")
+
+            uncached = self._Measure(VERIFICATION_MODE_IMMEDIATE, "")
+
+            # Populate the cache
+            self._Measure(VERIFICATION_MODE_IMMEDIATE, cache_filename, num_imports=1)
+            self.assertTrue(os.path.isfile(cache_filename))
+
+            cached = self._Measure(VERIFICATION_MODE_IMMEDIATE, cache_filename)
+            deferred = self._Measure(VERIFICATION_MODE_DEFERRED, "")
+
+        finally:
+            FileSystem.RemoveTree(temp_dir)
+
+        sys.stdout.write(textwrap.dedent(
+            """\
+
+            {name} (best of {num_imports} imports)
+                Immediate:              {uncached:.3f}s
+                Immediate (cached):     {cached:.3f}s ({cached_speedup:.1f}x)
+                Deferred:               {deferred:.3f}s ({deferred_speedup:.1f}x)
+            """).format( name=self.id(),
+                         num_imports=NUM_IMPORTS,
+                         uncached=uncached,
+                         cached=cached,
+                         cached_speedup=uncached / cached,
+                         deferred=deferred,
+                         deferred_speedup=uncached / deferred,
+                       ))
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _Measure(self, verification_mode, cache_filename, num_imports=NUM_IMPORTS):
+        environment = dict(os.environ)
+
+        environment[VERIFICATION_MODE_ENV_VAR_NAME] = verification_mode
+        environment[VERIFICATION_CACHE_ENV_VAR_NAME] = cache_filename
+        environment["PYTHONPATH"] = os.pathsep.join([ os.path.join(os.getenv("DEVELOPMENT_ENVIRONMENT_FUNDAMENTAL"), "Scripts"),
+                                                      environment.get("PYTHONPATH", ""),
+                                                    ])
+
+        command_line = '"{}" -c "import Tester"'.format(sys.executable)
+
+        durations = []
+
+        for _ in range(num_imports):
+            start = time.time()
+
+            result, output = Process.Execute(command_line, environment=environment)
+            self.assertEqual(result, 0, output)
+
+            durations.append(time.time() - start)
+
+        return min(durations)
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try: sys.exit(unittest.main(verbosity=2))
+    except KeyboardInterrupt: pass
@@ -0,0 +1,138 @@
+# ----------------------------------------------------------------------
+# |  
+# |  Process_PerformanceTest.py
+# |  
+# |  David Brownell <db@DavidBrownell.com>
+# |      2018-06-12 09:55:02
+# |  
+# ----------------------------------------------------------------------
+# |  
+# |  Copyright David Brownell 2018.
+# |  Distributed under the Boost Software License, Version 1.0.
+# |  (See accompanying file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+# |  
+# ----------------------------------------------------------------------
+"""Compares the throughput of block-buffered and character-by-character output in Process.py"""
+
+import os
+import sys
+import textwrap
+import time
+import unittest
+
+import six
+
+from CommonEnvironment import FileSystem
+from CommonEnvironment import Process
+from CommonEnvironment.Shell.All import CurrentShell
+from CommonEnvironment.StreamDecorator import StreamDecorator
+
+# ----------------------------------------------------------------------
+_script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower() else sys.executable
+_script_dir, _script_name = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+NUM_LINES                                   = 20000
+
+# ----------------------------------------------------------------------
+class StandardSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        cls._temp_filename = CurrentShell.CreateTempFilename(".py")
+
+        with open(cls._temp_filename, 'w') as f:
+            f.write(textwrap.dedent(
+                """\
+                import sys
+
+                for index in range({num_lines}):
+                    sys.stdout.write("Line {{}}: \\033[32m{{}}\\033[0m\\r\\n".format(index, "x" * 60))
+                """).format(num_lines=NUM_LINES))
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def tearDownClass(cls):
+        FileSystem.RemoveFile(cls._temp_filename)
+
+    # ----------------------------------------------------------------------
+    def test_Sink(self):
+        self._Compare(lambda: None)
+
+    # ----------------------------------------------------------------------
+    def test_LineDelimited(self):
+        self._Compare(lambda: [], line_delimited_output=True)
+
+    # ----------------------------------------------------------------------
+    def test_StreamDecorator(self):
+        self._Compare(lambda: six.moves.StringIO(), wrap_in_stream_decorator=True)
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _Compare( self,
+                  create_output_func,
+                  line_delimited_output=False,
+                  wrap_in_stream_decorator=False,
+                ):
+        command_line = '"{}" "{}"'.format(sys.executable, self._temp_filename)
+
+        results = {}
+
+        for block_buffered in [ False, True, ]:
+            output = create_output_func()
+
+            if isinstance(output, list):
+                sink = output.append
+            elif wrap_in_stream_decorator:
+                sink = StreamDecorator(output, line_prefix="  ")
+            else:
+                sink = output
+
+            start = time.time()
+            result = Process.Execute( command_line,
+                                      sink,
+                                      line_delimited_output=line_delimited_output,
+                                      block_buffered=block_buffered,
+                                    )
+            duration = time.time() - start
+
+            if output is None:
+                result, content = result
+            elif isinstance(output, list):
+                content = ''.join(output)
+            else:
+                content = output.getvalue()
+
+            self.assertEqual(result, 0)
+
+            results[block_buffered] = ( duration, content )
+
+        self.assertEqual(results[True][1], results[False][1])
+
+        num_bytes = len(results[True][1])
+
+        sys.stdout.write(textwrap.dedent(
+            """\
+
+            {name}
+                Characters:             {character_throughput:.2f} MB/s ({character_duration:.3f}s)
+                Blocks:                 {block_throughput:.2f} MB/s ({block_duration:.3f}s)
+                Speedup:                {speedup:.1f}x
+            """).format( name=self.id(),
+                         character_throughput=num_bytes / results[False][0] / (1024 * 1024),
+                         character_duration=results[False][0],
+                         block_throughput=num_bytes / results[True][0] / (1024 * 1024),
+                         block_duration=results[True][0],
+                         speedup=results[False][0] / results[True][0],
+                       ))
+
+        self.assertLess(results[True][0], results[False][0])
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try: sys.exit(unittest.main(verbosity=2))
+    except KeyboardInterrupt: pass
@@ -0,0 +1,118 @@
+# ----------------------------------------------------------------------
+# |  
+# |  StreamDecorator_PerformanceTest.py
+# |  
+# |  David Brownell <db@DavidBrownell.com>
+# |      2018-06-18 09:05:52
+# |  
+# ----------------------------------------------------------------------
+# |  
+# |  Copyright David Brownell 2018.
+# |  Distributed under the Boost Software License, Version 1.0.
+# |  (See accompanying file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+# |  
+# ----------------------------------------------------------------------
+"""Measures the performance of writing large amounts of content through nested StreamDecorators"""
+
+import os
+import sys
+import textwrap
+import time
+import unittest
+
+from CommonEnvironment.StreamDecorator import StreamDecorator
+
+# ----------------------------------------------------------------------
+_script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower() else sys.executable
+_script_dir, _script_name = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+NUM_LINES                                   = 200000
+LINES_PER_WRITE                             = 100
+
+# ----------------------------------------------------------------------
+class StandardSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def test_Constant(self):
+        self._Test(lambda stream: StreamDecorator(stream, line_prefix="  "))
+
+    # ----------------------------------------------------------------------
+    def test_Callable(self):
+        self._Test(lambda stream: StreamDecorator(stream, line_prefix=lambda column: "  "))
+
+    # ----------------------------------------------------------------------
+    def test_DoneManager(self):
+        sink = self._Stream()
+
+        start = time.time()
+
+        with StreamDecorator(sink).DoneManager() as dm1:
+            with dm1.stream.DoneManager() as dm2:
+                with dm2.stream.DoneManager() as dm3:
+                    with dm3.stream.DoneManager() as dm4:
+                        self._WriteContent(dm4.stream)
+
+        self._Display("DoneManager", 4, time.time() - start, sink)
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    class _Stream(object):
+        def __init__(self):
+            self.NumWrites = 0
+            self.NumBytes = 0
+
+        def write(self, content):
+            self.NumWrites += 1
+            self.NumBytes += len(content)
+
+        def flush(self):
+            pass
+
+    # ----------------------------------------------------------------------
+    def _Test(self, create_decorator_func):
+        for num_layers in [ 1, 2, 4, ]:
+            sink = self._Stream()
+
+            stream = sink
+            for _ in range(num_layers):
+                stream = create_decorator_func(stream)
+
+            start = time.time()
+            self._WriteContent(stream)
+
+            self._Display(self.id(), num_layers, time.time() - start, sink)
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _WriteContent(stream):
+        content = "This is a line of test output\n" * LINES_PER_WRITE
+
+        for _ in range(NUM_LINES // LINES_PER_WRITE):
+            stream.write(content)
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _Display(name, num_layers, duration, sink):
+        sys.stdout.write(textwrap.dedent(
+            """\
+
+            {name} ({num_layers} layers, {num_lines} lines)
+                Duration:               {duration:.3f}s
+                Writes:                 {num_writes}
+                Bytes:                  {num_bytes}
+            """).format( name=name,
+                         num_layers=num_layers,
+                         num_lines=NUM_LINES,
+                         duration=duration,
+                         num_writes=sink.NumWrites,
+                         num_bytes=sink.NumBytes,
+                       ))
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try: sys.exit(unittest.main(verbosity=2))
+    except KeyboardInterrupt: pass
@@ -0,0 +1,84 @@
+# ----------------------------------------------------------------------
+# |  
+# |  PersistedData.py
+# |  
+# |  David Brownell <db@DavidBrownell.com>
+# |      2018-06-21 08:47:12
+# |  
+# ----------------------------------------------------------------------
+# |  
+# |  Copyright David Brownell 2018.
+# |  Distributed under the Boost Software License, Version 1.0.
+# |  (See accompanying file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+# |  
+# ----------------------------------------------------------------------
+"""
+Functionality helpful when persisting data (such as caches) across invocations.
+
+This module is imported by CommonEnvironment.Interface, so it must not import modules
+that depend upon Interface.
+"""
+
+import os
+import sys
+
+import six.moves.cPickle as pickle
+
+from CommonEnvironment.CallOnExit import CallOnExit
+
+# ----------------------------------------------------------------------
+_script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower() else sys.executable
+_script_dir, _script_name = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+# ----------------------------------------------------------------------
+# |  
+# |  Public Methods
+# |  
+# ----------------------------------------------------------------------
+def GetGeneratedFilename(name):
+    """
+    Returns the name of a file within the activated repository's Generated directory,
+    or None if a repository has not been activated.
+    """
+
+    fundamental_repo = os.getenv("DEVELOPMENT_ENVIRONMENT_FUNDAMENTAL")
+    if not fundamental_repo:
+        return None
+
+    sys.path.insert(0, fundamental_repo)
+    with CallOnExit(lambda: sys.path.pop(0)):
+        try:
+            from RepositoryBootstrap import Constants as RepositoryBootstrapConstants
+        except ImportError:
+            return None
+
+    generated_dir = os.getenv(RepositoryBootstrapConstants.DE_REPO_GENERATED_NAME)
+    if not generated_dir:
+        return None
+
+    return os.path.join(generated_dir, name)
+
+# ----------------------------------------------------------------------
+def SavePickle(filename, data):
+    """
+    Pickles the data to a temporary file and moves it into place, so that concurrent
+    readers never see a partially written file.
+    """
+
+    dirname = os.path.dirname(filename)
+    if dirname and not os.path.isdir(dirname):
+        os.makedirs(dirname)
+
+    temp_filename = "{}.{}.tmp".format(filename, os.getpid())
+
+    with open(temp_filename, 'wb') as f:
+        pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
+
+    if hasattr(os, "replace"):
+        os.replace(temp_filename, filename)
+    else:
+        if os.path.isfile(filename):
+            os.remove(filename)
+
+        os.rename(temp_filename, filename)
@@ -14,7 +14,9 @@
 # ----------------------------------------------------------------------
 """Contains methods usefull when interacting with processes"""
 
+import codecs
 import os
+import re
 import subprocess
 import string
 import sys
@@ -28,15 +30,27 @@ _script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower
 _script_dir, _script_name = os.path.split(_script_fullpath)
 # ----------------------------------------------------------------------
 
+# Number of bytes read from the process at a time when 'block_buffered' is True
+BLOCK_SIZE                                  = 64 * 1024
+
+_newlines_regex                             = re.compile(r"[\r\n]+")
+_escape_sequence_regex                      = re.compile(r"\033[^A-Za-z]*[A-Za-z]")
+
+# ----------------------------------------------------------------------
 def Execute( command_line,
              optional_output_stream_or_functor=None,    # def Func(content) -> Bool
              convert_newlines=True,                     # Converts '\r\n' into '\n'
              line_delimited_output=False,               # Buffer calls to the provided functor by lines
              environment=None,                          # Environment vars to make available to the process
+             block_buffered=True,                       # Read output in large blocks rather than character by character
            ):
     """
     Invokes the given command line.
 
+    Output is read from the process in large blocks by default; each call to the
+    output functor receives at most a single line (including its newline characters)
+    and escape sequences are never split across calls. Set 'block_buffered' to False
+    to read (and output) the content one character at a time.
 
 
     Returns the exit code if output_output_stream_or_functor is not None, otherwise
@@ -136,7 +150,120 @@ def Execute( command_line,
                                stderr=subprocess.STDOUT,
                                env=environment,
                              )
-    
+
+    with CallOnExit(Flush):
+        try:
+            if block_buffered:
+                _ReadBlocks(result.stdout, output)
+            else:
+                _ReadCharacters(result.stdout, output)
+
+            result = result.wait() or 0
+
+        except IOError:
+            result = -1
+
+    if sink is None:
+        return result
+
+    return result, sink.getvalue()
+
+# ----------------------------------------------------------------------
+# |  
+# |  Private Methods
+# |  
+# ----------------------------------------------------------------------
+def _ReadBlocks(stream, output):
+    """Reads blocks of content from the stream, invoking output once per line."""
+
+    fileno = stream.fileno()
+
+    # Handle differences between bytes and strings in Python 3
+    if sys.version_info[0] == 2:
+        decode = lambda data, is_final: data
+    else:
+        decoder = codecs.getincrementaldecoder("utf-8")()
+
+        # ----------------------------------------------------------------------
+        def Decode(data, is_final):
+            pending_data = decoder.getstate()[0]
+
+            try:
+                return decoder.decode(data, is_final)
+            except UnicodeDecodeError:
+                decoder.reset()
+
+                data = pending_data + data
+
+                for codec in [ "ansi",
+                               "latin-1",
+                             ]:
+                    try:
+                        return data.decode(codec)
+                    except (LookupError, UnicodeDecodeError):
+                        pass
+
+                raise
+
+        # ----------------------------------------------------------------------
+
+        decode = Decode
+
+    content = ''
+
+    while True:
+        data = os.read(fileno, BLOCK_SIZE)
+        is_final = not data
+
+        content += decode(data, is_final)
+        if not content:
+            if is_final:
+                break
+
+            continue
+
+        # Output each line along with its newlines. A run of newline characters at the
+        # end of the block may continue in the next block, so wait for more content
+        # before writing it (this matches the behavior when reading character by
+        # character).
+        content_start = 0
+
+        for match in _newlines_regex.finditer(content):
+            if not is_final and match.end() == len(content):
+                break
+
+            if output(content[content_start:match.end()]) == False:
+                return
+
+            content_start = match.end()
+
+        content = content[content_start:]
+
+        if content and (is_final or not _newlines_regex.match(content[-1])):
+            # Don't split an escape sequence across calls
+            escape_index = content.rfind('\033')
+
+            if ( not is_final 
+                 and escape_index != -1 
+                 and not _escape_sequence_regex.match(content, escape_index)
+               ):
+                remaining_content = content[escape_index:]
+                content = content[:escape_index]
+            else:
+                remaining_content = ''
+
+            if content and output(content) == False:
+                return
+
+            content = remaining_content
+
+        if is_final:
+            break
+
+# ----------------------------------------------------------------------
+def _ReadCharacters(stream, output):
+    """Reads content from the stream one character at a time."""
+
     ( CharacterStack_Escape,
       CharacterStack_LineReset,
       CharacterStack_Buffered,
@@ -173,82 +300,70 @@ def Execute( command_line,
 
         to_ascii_string = ToAsciiString
 
-    with CallOnExit(Flush):
-        try:
-            character_stack = []
-            character_stack_type = None
-
-            hard_stop = False
+    character_stack = []
+    character_stack_type = None
 
-            while True:
-                if character_stack_type == CharacterStack_Buffered:
-                    value = character_stack.pop()
+    hard_stop = False
 
-                    assert not character_stack
-                    character_stack_type = None
+    while True:
+        if character_stack_type == CharacterStack_Buffered:
+            value = character_stack.pop()
 
-                else:
-                    c = result.stdout.read(1)
-                    if not c:
-                        break
-
-                    value = char_to_value(c)
-
-                content = None
-
-                if character_stack_type == CharacterStack_Escape:
-                    character_stack.append(value)
+            assert not character_stack
+            character_stack_type = None
 
-                    if not is_ascii_letter(value):
-                        continue
+        else:
+            c = stream.read(1)
+            if not c:
+                break
 
-                    content = character_stack
+            value = char_to_value(c)
 
-                    character_stack = []
-                    character_stack_type = None
+        content = None
 
-                elif character_stack_type == CharacterStack_LineReset:
-                    if is_newline(value):
-                        character_stack.append(value)
-                        continue
+        if character_stack_type == CharacterStack_Escape:
+            character_stack.append(value)
 
-                    content = character_stack
+            if not is_ascii_letter(value):
+                continue
 
-                    character_stack = [ value, ]
-                    character_stack_type = CharacterStack_Buffered
+            content = character_stack
 
-                else:
-                    assert character_stack_type is None, character_stack_type
+            character_stack = []
+            character_stack_type = None
 
-                    if is_esc(value):
-                        character_stack.append(value)
-                        character_stack_type = CharacterStack_Escape
+        elif character_stack_type == CharacterStack_LineReset:
+            if is_newline(value):
+                character_stack.append(value)
+                continue
 
-                        continue
+            content = character_stack
 
-                    elif is_newline(value):
-                        character_stack.append(value)
-                        character_stack_type = CharacterStack_LineReset
+            character_stack = [ value, ]
+            character_stack_type = CharacterStack_Buffered
 
-                        continue
+        else:
+            assert character_stack_type is None, character_stack_type
 
-                    content = [ value, ]
+            if is_esc(value):
+                character_stack.append(value)
+                character_stack_type = CharacterStack_Escape
 
-                assert content
+                continue
 
-                if output(to_ascii_string(content)) == False:
-                    hard_stop = True
-                    break
+            elif is_newline(value):
+                character_stack.append(value)
+                character_stack_type = CharacterStack_LineReset
 
-            if not hard_stop and character_stack:
-                output(to_ascii_string(character_stack))
+                continue
 
-            result = result.wait() or 0
+            content = [ value, ]
 
-        except IOError:
-            result = -1
+        assert content
 
-    if sink is None:
-        return result
+        if output(to_ascii_string(content)) == False:
+            hard_stop = True
+            break
 
-    return result, sink.getvalue()
+    if not hard_stop and character_stack:
+        output(to_ascii_string(character_stack))
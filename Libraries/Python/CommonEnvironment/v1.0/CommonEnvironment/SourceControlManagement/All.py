@@ -14,11 +14,17 @@
 # ----------------------------------------------------------------------
 """All items from this module"""
 
+import multiprocessing
 import os
 import sys
 import textwrap
+import threading
 
+import six
+
+from CommonEnvironment import Nonlocals
 from CommonEnvironment.CallOnExit import CallOnExit
+from CommonEnvironment import FileSystem
 
 from CommonEnvironment.SourceControlManagement.GitSourceControlManagement import GitSourceControlManagement
 from CommonEnvironment.SourceControlManagement.MercurialSourceControlManagement import MercurialSourceControlManagement
@@ -37,6 +43,16 @@ ALL_TYPES                                   = [ GitSourceControlManagement,
                                                 MercurialSourceControlManagement,
                                               ]
 
+# Names of directories that EnumSCMs doesn't search by default; these directories
+# are large, are created by tools, and don't contain repositories of interest. Names
+# that are commonly used for other purposes (such as "build") are not included.
+DEFAULT_PRUNE_DIRECTORY_NAMES               = [ "node_modules",
+                                                "venv",
+                                                ".venv",
+                                                "__pycache__",
+                                                ".tox",
+                                              ]
+
 # ----------------------------------------------------------------------
 # |  
 # |  Public Methods
@@ -112,10 +128,15 @@ def GetAnySCM( path,
     raise Exception("No SCMs are active for '{}' or its ancestors.".format(path))
 
 # ----------------------------------------------------------------------
-def EnumSCMs(path):
+def EnumSCMs( path,
+              prune_directory_names=None,   # Names of directories that aren't searched; defaults to DEFAULT_PRUNE_DIRECTORY_NAMES
+              num_concurrent_tasks=None,    # Defaults to 5 * the number of processors
+            ):
     """
     Enumerates all SCMs that are active in the provided path or its descendants.
-    
+    Directories are searched in parallel and repositories are yielded as soon as
+    they are found, so the order of the results is not deterministic.
+
     Yields (scm, repo_root)
     """
 
@@ -123,15 +144,109 @@ def EnumSCMs(path):
     with CallOnExit(lambda: sys.path.pop(0)):
         from RepositoryBootstrap import Constants as RepositoryBootstrapConstants
 
-    for root, directories, _ in os.walk(path):
-        for scm in ALL_TYPES:
-            if scm.IsRoot(root):
-                yield scm, root
+    # A repository is identified by its working directory (for example, '.git'), which
+    # may be a symbolic link to a directory; this is equivalent to the Git and Mercurial
+    # implementations of IsRoot without the overhead of invoking IsRoot for every type
+    # in every directory.
+    working_directories = [ ( working_directory, scm ) for scm in ALL_TYPES for working_directory in scm.WorkingDirectories ]
+
+    prune_directory_names = set(DEFAULT_PRUNE_DIRECTORY_NAMES if prune_directory_names is None else prune_directory_names)
+
+    # Don't search in generated dirs, as the symlinks will cause recursive enumerations
+    prune_directory_names.add(RepositoryBootstrapConstants.GENERATED_DIRECTORY_NAME)
+
+    # Directories are processed by worker threads; repositories (or exceptions) are
+    # sent to this thread via the results queue, and None is sent when all directories
+    # have been processed.
+    directories = six.moves.queue.Queue()
+    results = six.moves.queue.Queue()
+
+    nonlocals = Nonlocals( num_pending=1,
+                           is_cancelled=False,
+                         )
+    nonlocals_lock = threading.Lock()
+
+    # ----------------------------------------------------------------------
+    def ProcessDirectory(directory):
+        try:
+            dirs, _ = FileSystem.EnumerateDirectory(directory)
+        except OSError:
+            return
 
-                # Don't search in subdirs, as there won't be any
-                directories[:] = []
+        dir_names = set([ dir_name for dir_name, _ in dirs ])
+
+        is_root = False
+
+        for working_directory, scm in working_directories:
+            if working_directory in dir_names:
+                results.put(( scm, directory ))
+                is_root = True
+
+        # Don't search in subdirs, as there won't be any
+        if is_root:
+            return
+
+        for dir_name, is_symlink in dirs:
+            # Symbolic links aren't followed (as is the case with os.walk)
+            if is_symlink or dir_name in prune_directory_names:
                 continue
 
-        if RepositoryBootstrapConstants.GENERATED_DIRECTORY_NAME in directories:
-            # Don't search in generated dirs, as the symlinks will cause recursive enumerations
-            directories.remove(RepositoryBootstrapConstants.GENERATED_DIRECTORY_NAME)
+            with nonlocals_lock:
+                nonlocals.num_pending += 1
+
+            directories.put(os.path.join(directory, dir_name))
+
+    # ----------------------------------------------------------------------
+    def ThreadProc():
+        while True:
+            directory = directories.get()
+            if directory is None:
+                break
+
+            try:
+                if not nonlocals.is_cancelled:
+                    ProcessDirectory(directory)
+
+            except Exception as ex:
+                results.put(ex)
+
+            finally:
+                with nonlocals_lock:
+                    nonlocals.num_pending -= 1
+                    is_complete = nonlocals.num_pending == 0
+
+                if is_complete:
+                    results.put(None)
+
+    # ----------------------------------------------------------------------
+
+    num_concurrent_tasks = num_concurrent_tasks or (multiprocessing.cpu_count() * 5)
+
+    threads = [ threading.Thread(target=ThreadProc) for _ in six.moves.range(num_concurrent_tasks) ]
+
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+
+    directories.put(path)
+
+    try:
+        while True:
+            result = results.get()
+            if result is None:
+                break
+
+            if isinstance(result, Exception):
+                raise result
+
+            yield result
+
+    finally:
+        # Stop searching if the caller didn't consume all of the results
+        nonlocals.is_cancelled = True
+
+        for _ in threads:
+            directories.put(None)
+
+        for thread in threads:
+            thread.join()
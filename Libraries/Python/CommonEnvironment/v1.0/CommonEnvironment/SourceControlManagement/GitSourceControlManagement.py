@@ -14,10 +14,14 @@
 # ----------------------------------------------------------------------
 """Contains the GitSourceControlManagement object"""
 
+import atexit
+import multiprocessing
 import os
 import re
+import subprocess
 import sys
 import textwrap
+import threading
 
 import six
 
@@ -267,14 +271,7 @@ class GitSourceControlManagement(DistributedSourceControlManagement):
                                     )
         assert result == 0, (result, output)
 
-        for line in output.split('\n'):
-            parts = line.split('/')
-
-            if parts[1] == "remotes" and parts[2] == "origin":
-                return parts[3]
-
-        assert False, output
-        return None
+        return cls._GetMostRecentBranchFromRefnames([ line for line in output.split('\n') if line ])
     
     # ----------------------------------------------------------------------
     @classmethod
@@ -314,8 +311,8 @@ class GitSourceControlManagement(DistributedSourceControlManagement):
         lines = output.split('\n')
         assert len(lines) >= 3, (len(lines), output)
 
-        d = { "user" : lines[0].lstrip(),
-              "date" : lines[1].lstrip(),
+        d = { "user" : lines[0].strip(),
+              "date" : lines[1].strip(),
               "summary" : lines[2].lstrip(),
             }
 
@@ -323,6 +320,81 @@ class GitSourceControlManagement(DistributedSourceControlManagement):
 
         return d
 
+    # ----------------------------------------------------------------------
+    @classmethod
+    def GetChangeInfos(cls, repo_root, changes):
+        changes = cls._ResolveChanges(repo_root, changes)
+        if not changes:
+            return
+
+        # Information for all of the changes is written by a single process; each change
+        # begins with a line that contains a null character followed by its hash. Root
+        # commits are not shown as adding all of their files for consistency with
+        # GetChangedFiles.
+        process = subprocess.Popen( [ "git", "-c", "log.showRoot=false", "--no-pager", "log", "--stdin", "--no-walk=unsorted", "--name-only", "--format=%x00%H%n%aN <%ae>%n%cd%n%s", ],
+                                    cwd=repo_root,
+                                    stdin=subprocess.PIPE,
+                                    stdout=subprocess.PIPE,
+                                    env=os.environ,
+                                  )
+
+        # Git reads all of the changes before writing any output
+        process.stdin.write(''.join([ "{}\n".format(change) for change in set(changes) ]).encode("utf-8"))
+        process.stdin.close()
+
+        infos = {}
+
+        # ----------------------------------------------------------------------
+        def EnumInfos():
+            info = None
+
+            for line in process.stdout:
+                line = line.decode("utf-8", "replace").rstrip("\r\n")
+
+                if line.startswith('\0'):
+                    if info is not None:
+                        yield info
+
+                    info = { "hash" : line[1:],
+                             "lines" : [],
+                           }
+
+                elif line:
+                    assert info is not None, line
+                    info["lines"].append(line)
+
+                elif len(info["lines"]) < 3:
+                    # The summary may be empty
+                    info["lines"].append(line)
+
+            if info is not None:
+                yield info
+
+        # ----------------------------------------------------------------------
+
+        info_generator = EnumInfos()
+
+        try:
+            for change in changes:
+                while change not in infos:
+                    info = next(info_generator, None)
+                    assert info is not None, ("The change was not found", change)
+
+                    lines = info["lines"]
+                    assert len(lines) >= 3, (len(lines), lines)
+
+                    infos[info["hash"]] = { "user" : lines[0],
+                                            "date" : lines[1],
+                                            "summary" : lines[2],
+                                            "files" : sorted([ os.path.join(repo_root, line) for line in lines[3:] ]),
+                                          }
+
+                yield dict(infos[change])
+
+        finally:
+            process.stdout.close()
+            process.wait()
+
     # ----------------------------------------------------------------------
     _Commit_regex                           = re.compile(r"(?P<username>.+?)\s+\<(?P<email>.+?)\>")
 
@@ -537,6 +609,122 @@ class GitSourceControlManagement(DistributedSourceControlManagement):
 
             yield match.group("revision"), match.group("line_number")
 
+    # ----------------------------------------------------------------------
+    _EnumBlameInfos_regex                   = re.compile(r"^(?P<revision>[0-9a-f]{40,64}) \d+ (?P<line_number>\d+) (?P<num_lines>\d+)$")
+
+    @classmethod
+    def EnumBlameInfos(cls, repo_root, filenames):
+        """
+        Revisions are abbreviated in the same way as EnumBlameInfo. Git can only blame
+        one file at a time, so processes for the files that follow are started while the
+        current file's results are being parsed.
+        """
+
+        filenames = list(filenames)
+
+        max_num_processes = multiprocessing.cpu_count() + 1
+        processes = []
+
+        abbrev_lengths = {}
+
+        # ----------------------------------------------------------------------
+        def GetAbbrevLength(revisions):
+            # 'git blame' uses a length one greater than the longest unique abbreviation of
+            # the file's revisions (including uncommitted changes, which are all zeros).
+            new_revisions = [ revision for revision in revisions if revision not in abbrev_lengths ]
+
+            if new_revisions:
+                commits = [ revision for revision in new_revisions if revision.strip('0') ]
+
+                if commits:
+                    process = subprocess.Popen( [ "git", "--no-pager", "log", "--stdin", "--no-walk=unsorted", "--format=%H %h", ],
+                                                cwd=repo_root,
+                                                stdin=subprocess.PIPE,
+                                                stdout=subprocess.PIPE,
+                                                env=os.environ,
+                                              )
+
+                    output = process.communicate(''.join([ "{}\n".format(commit) for commit in commits ]).encode("utf-8"))[0]
+                    assert process.returncode == 0, process.returncode
+
+                    for line in output.decode("utf-8").split('\n'):
+                        if line:
+                            revision, abbrev = line.split(' ')
+                            abbrev_lengths[revision] = len(abbrev)
+
+                for revision in new_revisions:
+                    if revision not in abbrev_lengths:
+                        result, output = cls.Execute(repo_root, 'git rev-parse --short "{}"'.format(revision))
+                        assert result == 0, (result, output)
+
+                        abbrev_lengths[revision] = len(output.strip())
+
+            return max(abbrev_lengths[revision] for revision in revisions) + 1
+
+        # ----------------------------------------------------------------------
+        def StartProcess(filename):
+            processes.append(subprocess.Popen( [ "git", "--no-pager", "blame", "--incremental", "--", filename, ],
+                                               cwd=repo_root,
+                                               stdout=subprocess.PIPE,
+                                               stderr=subprocess.PIPE,
+                                               env=os.environ,
+                                             ))
+
+        # ----------------------------------------------------------------------
+
+        try:
+            for index, filename in enumerate(filenames):
+                while len(processes) < max_num_processes and index + len(processes) < len(filenames):
+                    StartProcess(filenames[index + len(processes)])
+
+                process = processes.pop(0)
+                output, error = process.communicate()
+
+                if process.returncode != 0:
+                    # Don't produce an error if we are looking at a file that has been renamed/removed.
+                    error = error.decode("utf-8", "replace")
+                    if "No such file or directory" in error:
+                        yield filename, []
+                        continue
+
+                    assert False, error
+
+                revisions = {}
+                boundaries = set()
+
+                revision = None
+
+                for line in output.decode("utf-8", "replace").split('\n'):
+                    if line == "boundary":
+                        boundaries.add(revision)
+                        continue
+
+                    match = cls._EnumBlameInfos_regex.match(line)
+                    if not match:
+                        continue
+
+                    revision = match.group("revision")
+                    line_number = int(match.group("line_number"))
+
+                    for offset in six.moves.range(int(match.group("num_lines"))):
+                        revisions[line_number + offset] = revision
+
+                if not revisions:
+                    yield filename, []
+                    continue
+
+                abbrev_length = GetAbbrevLength(set(six.itervalues(revisions)))
+
+                # Boundary commits are prefixed with '^' without changing the length
+                abbrevs = { revision : "^{}".format(revision[:abbrev_length - 1]) if revision in boundaries else revision[:abbrev_length] for revision in set(six.itervalues(revisions)) }
+
+                yield filename, [ ( abbrevs[revisions[line_number]], str(line_number) ) for line_number in sorted(six.iterkeys(revisions)) ]
+
+        finally:
+            for process in processes:
+                process.kill()
+                process.communicate()
+
     # ----------------------------------------------------------------------
     @classmethod
     def EnumTrackedFiles(cls, repo_root):
@@ -642,7 +830,7 @@ class GitSourceControlManagement(DistributedSourceControlManagement):
     # ----------------------------------------------------------------------
     @classmethod
     def GetLocalChanges(cls, repo_root):
-        result, output = cls.Execute(repo_root, 'git remote update')
+        result, output = cls.RefreshRemote(repo_root)
         assert result == 0, (result, output)
 
         result, output = cls.Execute(repo_root, 'git --no-pager log "origin/{}..HEAD" --format="%H"'.format(cls.GetCurrentBranch(repo_root)))
@@ -653,7 +841,7 @@ class GitSourceControlManagement(DistributedSourceControlManagement):
     # ----------------------------------------------------------------------
     @classmethod
     def HasRemoteChanges(cls, repo_root):
-        result, output = cls.Execute(repo_root, 'git remote update')
+        result, output = cls.RefreshRemote(repo_root)
         assert result == 0, (result, output)
         
         return cls.HasUpdateChanges(repo_root)
@@ -661,7 +849,7 @@ class GitSourceControlManagement(DistributedSourceControlManagement):
     # ----------------------------------------------------------------------
     @classmethod
     def GetRemoteChanges(cls, repo_root):
-        result, output = cls.Execute(repo_root, 'git remote update')
+        result, output = cls.RefreshRemote(repo_root)
         assert result == 0, (result, output)
 
         result, output = cls.Execute(repo_root, 'git --no-pager log "HEAD..origin/{}" --format="%H"'.format(cls.GetCurrentBranch(repo_root)))
@@ -669,6 +857,113 @@ class GitSourceControlManagement(DistributedSourceControlManagement):
 
         return [ line.strip() for line in output.split('\n') if line.strip() ]
 
+    # ----------------------------------------------------------------------
+    _remote_refreshes                       = {}
+    _remote_refreshes_lock                  = threading.Lock()
+
+    @classmethod
+    def RefreshRemote(cls, repo_root, force=False):
+        """
+        Updates the remote tracking branches via 'git remote update'. The remote is only
+        contacted once for each repository during the lifetime of this process (concurrent
+        callers wait for the same update); subsequent calls return the original result
+        unless force is True.
+        """
+
+        key = os.path.normcase(os.path.realpath(repo_root))
+
+        with cls._remote_refreshes_lock:
+            if force:
+                cls._remote_refreshes.pop(key, None)
+
+            refresh = cls._remote_refreshes.get(key, None)
+            if refresh is None:
+                refresh = ( threading.Lock(), [] )
+                cls._remote_refreshes[key] = refresh
+
+        refresh_lock, refresh_results = refresh
+
+        with refresh_lock:
+            if not refresh_results:
+                refresh_results.append(cls.Execute(repo_root, "git remote update"))
+
+        return refresh_results[0]
+
+    # ----------------------------------------------------------------------
+    _GetChangeStatus_branch_ab_regex        = re.compile(r"^# branch\.ab \+(?P<ahead>\d+) -(?P<behind>\d+)$")
+    _GetChangeStatus_track_ahead_regex      = re.compile(r"\bahead \d+")
+
+    @classmethod
+    def GetChangeStatus(cls, repo_root):
+        # The remote is refreshed first so that the remote, update, and branch values
+        # reflect the remote's current state.
+        result, output = cls.RefreshRemote(repo_root)
+        assert result == 0, (result, output)
+
+        result, output = cls.Execute(repo_root, "git status --porcelain=v2 --branch")
+        assert result == 0, (result, output)
+
+        has_untracked = False
+        has_working = False
+        num_behind = 0
+
+        for line in output.split('\n'):
+            if not line:
+                continue
+
+            if line.startswith("# "):
+                match = cls._GetChangeStatus_branch_ab_regex.match(line)
+                if match:
+                    num_behind = int(match.group("behind"))
+
+            elif line.startswith("? "):
+                has_untracked = True
+
+            elif line[0] in [ '1', '2', 'u', ]:
+                # Changed, renamed/copied, or unmerged tracked file
+                has_working = True
+
+        result, output = cls.Execute( repo_root,
+                                      'git for-each-ref --sort=-committerdate --format="%(refname)%09%(upstream)%09%(upstream:track)"',
+                                    )
+        assert result == 0, (result, output)
+
+        refnames = []
+        has_local = False
+        has_branches_without_upstream = False
+
+        for line in output.split('\n'):
+            if not line:
+                continue
+
+            refname, upstream, track = line.split('\t')
+
+            refnames.append(refname)
+
+            if not refname.startswith("refs/heads/"):
+                continue
+
+            if not upstream:
+                has_branches_without_upstream = True
+            elif cls._GetChangeStatus_track_ahead_regex.search(track):
+                has_local = True
+
+        if not has_local and has_branches_without_upstream:
+            # Only the commits themselves can tell us if a branch without an upstream branch
+            # contains changes that haven't been pushed.
+            result, output = cls.Execute(repo_root, "git rev-list --branches --not --remotes -n 1")
+            assert result == 0, (result, output)
+
+            has_local = bool(output.strip())
+
+        return cls.GetChangeStatusResult( has_untracked,
+                                          has_working,
+                                          has_local,
+                                          num_behind != 0,
+                                          num_behind != 0,
+                                          cls._GetMostRecentBranchFromRefnames(refnames),
+                                        )
+
     # ----------------------------------------------------------------------
     @classmethod
     def Push(cls, repo_root, create_remote_branch=False):
@@ -716,14 +1011,7 @@ class GitSourceControlManagement(DistributedSourceControlManagement):
 
         # ----------------------------------------------------------------------
         def NormalizeChange(change):
-            result, output = cls.Execute(repo_root, 'git --no-pager log {} -n 1 --format="%H"'.format(change))
-            assert result == 0, (result, output)
-
-            output = output.strip()
-            if output.startswith("* "):
-                output = output[len("* "):]
-
-            return output
+            return cls._ResolveChanges(repo_root, [ change, ])[0]
 
         # ----------------------------------------------------------------------
         def DateAndBranch(date, branch, operator):
@@ -772,6 +1060,88 @@ class GitSourceControlManagement(DistributedSourceControlManagement):
         assert type(update_arg) in dispatch_map, type(update_arg)
         return dispatch_map[type(update_arg)]()
 
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _GetMostRecentBranchFromRefnames(refnames):
+        """Returns the name of the first remote branch in refnames, which are sorted by commit date"""
+
+        for refname in refnames:
+            parts = refname.split('/')
+
+            if parts[1] == "remotes" and parts[2] == "origin":
+                return parts[3]
+
+        assert False, refnames
+        return None
+
+    # ----------------------------------------------------------------------
+    _cat_file_processes                     = {}
+    _cat_file_processes_lock                = threading.Lock()
+
+    @classmethod
+    def _ResolveChanges(cls, repo_root, changes):
+        """
+        Returns the commit hash for each change. Changes are resolved by a 'git cat-file --batch-check'
+        process that is started once for each repository and reused by subsequent calls.
+        """
+
+        with cls._cat_file_processes_lock:
+            if repo_root not in cls._cat_file_processes:
+                cls._cat_file_processes[repo_root] = ( threading.Lock(),
+                                                       subprocess.Popen( [ "git", "cat-file", "--batch-check", ],
+                                                                         cwd=repo_root,
+                                                                         stdin=subprocess.PIPE,
+                                                                         stdout=subprocess.PIPE,
+                                                                         env=os.environ,
+                                                                       ),
+                                                     )
+
+                if len(cls._cat_file_processes) == 1:
+                    atexit.register(cls._CloseCatFileProcesses)
+
+            lock, process = cls._cat_file_processes[repo_root]
+
+        results = []
+
+        with lock:
+            try:
+                for change in changes:
+                    # A line is written for each request, so requests can't be written before
+                    # the response to the previous request has been read.
+                    process.stdin.write("{}^{{commit}}\n".format(change).encode("utf-8"))
+                    process.stdin.flush()
+
+                    output = process.stdout.readline().decode("utf-8", "replace").rstrip()
+                    if not output:
+                        raise Exception("The 'git cat-file' process terminated unexpectedly")
+
+                    parts = output.split(' ')
+                    assert len(parts) == 3 and parts[1] == "commit", (change, output)
+
+                    results.append(parts[0])
+
+            except:
+                if process.poll() is not None:
+                    with cls._cat_file_processes_lock:
+                        if cls._cat_file_processes.get(repo_root, (None, None))[1] is process:
+                            del cls._cat_file_processes[repo_root]
+
+                raise
+
+        return results
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _CloseCatFileProcesses(cls):
+        with cls._cat_file_processes_lock:
+            processes = [ process for _, process in six.itervalues(cls._cat_file_processes) ]
+            cls._cat_file_processes.clear()
+
+        for process in processes:
+            process.stdin.close()
+            process.wait()
+            process.stdout.close()
+
     # ----------------------------------------------------------------------
     @classmethod
     def _GetBranchAssociatedWithChange(cls, repo_root, change):
@@ -0,0 +1,190 @@
+# ----------------------------------------------------------------------
+# |  
+# |  MercurialCommandServer.py
+# |  
+# |  David Brownell <db@DavidBrownell.com>
+# |      2018-06-19 09:12:41
+# |  
+# ----------------------------------------------------------------------
+# |  
+# |  Copyright David Brownell 2018.
+# |  Distributed under the Boost Software License, Version 1.0.
+# |  (See accompanying file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+# |  
+# ----------------------------------------------------------------------
+"""Contains the MercurialCommandServer object"""
+
+import os
+import struct
+import subprocess
+import sys
+import threading
+
+# ----------------------------------------------------------------------
+_script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower() else sys.executable
+_script_dir, _script_name = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+# Each message sent by the server is a channel character followed by the length of the data
+_CHANNEL_HEADER                             = struct.Struct(">cI")
+_LENGTH                                     = struct.Struct(">I")
+_RESULT                                     = struct.Struct(">i")
+
+# ----------------------------------------------------------------------
+# |  
+# |  Public Types
+# |  
+# ----------------------------------------------------------------------
+class CommandNotSentException(Exception):
+    """Raised when a command could not be sent to the command server; the command was not run."""
+    pass
+
+# ----------------------------------------------------------------------
+class MercurialCommandServer(object):
+    """
+    Long-lived Mercurial process ('hg serve --cmdserver pipe') that runs commands sent
+    via the command server protocol [https://www.mercurial-scm.org/wiki/CommandServer].
+    Commands avoid the cost of starting Mercurial (and loading its extensions) for
+    each invocation.
+
+    Commands are run one at a time. Exceptions are raised if the server can't be started
+    or doesn't respond as expected; the server should not be used after an exception.
+    """
+
+    DEFAULT_COMMAND_LINE                    = [ "hg", "serve", "--cmdserver", "pipe", ]
+
+    # ----------------------------------------------------------------------
+    def __init__( self,
+                  working_dir,
+                  command_line=None,            # Defaults to DEFAULT_COMMAND_LINE
+                  environment=None,             # Defaults to os.environ
+                ):
+        with open(os.devnull, 'w') as null:
+            self._process                   = subprocess.Popen( command_line or self.DEFAULT_COMMAND_LINE,
+                                                                cwd=working_dir,
+                                                                env=environment,
+                                                                stdin=subprocess.PIPE,
+                                                                stdout=subprocess.PIPE,
+                                                                stderr=null,
+                                                                shell=sys.platform.startswith("win"),
+                                                              )
+
+        self._lock                          = threading.Lock()
+
+        try:
+            channel, data = self._ReadMessage()
+            if channel != b'o':
+                raise Exception("The command server did not send a hello message")
+
+            hello = dict( line.split(": ", 1) for line in data.decode("ascii").split('\n') if ": " in line )
+
+            if "runcommand" not in hello.get("capabilities", '').split():
+                raise Exception("The command server does not support 'runcommand'")
+
+            self.Encoding                   = hello.get("encoding", "UTF-8")
+
+        except:
+            self.Close()
+            raise
+
+    # ----------------------------------------------------------------------
+    def __enter__(self):
+        return self
+
+    # ----------------------------------------------------------------------
+    def __exit__(self, *args):
+        self.Close()
+
+    # ----------------------------------------------------------------------
+    def Close(self):
+        with self._lock:
+            if self._process.stdin.closed:
+                return
+
+            try:
+                self._process.stdin.close()
+            except (IOError, OSError):
+                # Data that couldn't be sent to a server that has exited
+                pass
+
+        self._process.wait()
+        self._process.stdout.close()
+
+    # ----------------------------------------------------------------------
+    def Execute(self, args):
+        """
+        Runs the Mercurial command, where args are the arguments that would follow 'hg'
+        on the command line.
+
+        Returns ( <exit_code>, <output> ); output contains the content written to both
+        stdout and stderr with newlines converted.
+
+        CommandNotSentException is raised if the command could not be sent to the server.
+        Other exceptions indicate that the command may have been run.
+        """
+
+        try:
+            data = b'\0'.join([ arg.encode(self.Encoding) for arg in args ])
+        except UnicodeError as ex:
+            raise CommandNotSentException(str(ex))
+
+        output = []
+
+        with self._lock:
+            try:
+                self._Write(b"runcommand\n" + _LENGTH.pack(len(data)) + data)
+            except (IOError, OSError, ValueError) as ex:
+                # The server doesn't run a command until all of its data has been received
+                raise CommandNotSentException(str(ex))
+
+            while True:
+                channel, data = self._ReadMessage()
+
+                if channel in [ b'o', b'e', ]:
+                    output.append(data)
+
+                elif channel == b'r':
+                    result = _RESULT.unpack(data)[0]
+                    break
+
+                elif channel in [ b'I', b'L', ]:
+                    # The command is requesting input; there isn't any
+                    self._Write(_LENGTH.pack(0))
+
+                elif channel.isupper():
+                    raise Exception("The required channel '{}' is not supported".format(channel.decode("ascii")))
+
+                # Unknown optional channels are ignored
+
+        return result, b''.join(output).decode(self.Encoding, "replace").replace('\r\n', '\n')
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _Write(self, data):
+        self._process.stdin.write(data)
+        self._process.stdin.flush()
+
+    # ----------------------------------------------------------------------
+    def _ReadMessage(self):
+        channel, length = _CHANNEL_HEADER.unpack(self._ReadBytes(_CHANNEL_HEADER.size))
+
+        # Input requests contain the requested length rather than data
+        if channel in [ b'I', b'L', ]:
+            return channel, None
+
+        return channel, self._ReadBytes(length)
+
+    # ----------------------------------------------------------------------
+    def _ReadBytes(self, num_bytes):
+        content = []
+
+        while num_bytes:
+            data = self._process.stdout.read(num_bytes)
+            if not data:
+                raise Exception("The command server terminated unexpectedly")
+
+            content.append(data)
+            num_bytes -= len(data)
+
+        return b''.join(content)
@@ -23,10 +23,13 @@
 #
 # These commands will return errors if the extensions are not installed.
 
+import atexit
 import os
 import re
+import shlex
 import sys
 import textwrap
+import threading
 
 from collections import OrderedDict
 
@@ -39,6 +42,7 @@ from CommonEnvironment import Process
 from CommonEnvironment.Shell.All import CurrentShell
 
 from CommonEnvironment.SourceControlManagement import DistributedSourceControlManagement
+from CommonEnvironment.SourceControlManagement.MercurialCommandServer import MercurialCommandServer, CommandNotSentException
 from CommonEnvironment.SourceControlManagement.UpdateMergeArgs import *
 
 from CommonEnvironment.TypeInfo.FundamentalTypes.DateTimeTypeInfo import DateTimeTypeInfo
@@ -64,6 +68,10 @@ class MercurialSourceControlManagement(DistributedSourceControlManagement):
     WorkingDirectories                      = [ ".hg", ]
     IgnoreFilename                          = ".hgignore"
 
+    # Set this environment variable to "1" to run commands via a command server for each
+    # repository rather than in a new process (see MercurialCommandServer.py).
+    COMMAND_SERVER_ENV_VAR_NAME             = "DEVELOPMENT_ENVIRONMENT_MERCURIAL_COMMAND_SERVER"
+
     # ----------------------------------------------------------------------
     # |  
     # |  Public Methods
@@ -76,14 +84,19 @@ class MercurialSourceControlManagement(DistributedSourceControlManagement):
                  strip=False,
                  newline=False,
                ):
-        command = command.replace("hg ", 'hg --cwd "{}" '.format(repo_root))
+        result_and_content = cls._ExecuteViaCommandServer(repo_root, command)
 
-        if cls.Diagnostics:
-            sys.stdout.write("VERBOSE: {}\n".format(command))
+        if result_and_content is not None:
+            result, content = result_and_content
+        else:
+            command = command.replace("hg ", 'hg --cwd "{}" '.format(repo_root))
 
-        result, content = Process.Execute( command,
-                                           environment=os.environ,
-                                         )
+            if cls.Diagnostics:
+                sys.stdout.write("VERBOSE: {}\n".format(command))
+
+            result, content = Process.Execute( command,
+                                               environment=os.environ,
+                                             )
 
         if strip:
             content = content.strip()
@@ -92,6 +105,21 @@ class MercurialSourceControlManagement(DistributedSourceControlManagement):
 
         return result, content
 
+    # ----------------------------------------------------------------------
+    _command_servers                        = {}
+    _command_servers_lock                   = threading.Lock()
+
+    @classmethod
+    def CloseCommandServers(cls):
+        """Closes the command servers started by Execute; they are closed automatically when the process exits."""
+
+        with cls._command_servers_lock:
+            command_servers = [ command_server for command_server in six.itervalues(cls._command_servers) if command_server is not None ]
+            cls._command_servers.clear()
+
+        for command_server in command_servers:
+            command_server.Close()
+
     # ----------------------------------------------------------------------
     @classmethod
     def IsAvailable(cls):
@@ -587,6 +615,89 @@ class MercurialSourceControlManagement(DistributedSourceControlManagement):
 
         return output.strip()
 
+    # ----------------------------------------------------------------------
+    # Commands that contain these characters are interpreted by the shell
+    _shell_characters_regex                 = re.compile(r"[&|<>;`$]")
+
+    @classmethod
+    def _ExecuteViaCommandServer(cls, repo_root, command):
+        """
+        Runs the command via the command server associated with the repository when
+        command servers are enabled. Returns None if the command must be run in a new
+        process (command servers are disabled, the command isn't a single Mercurial command,
+        or the command couldn't be sent to the command server). Failures that happen after
+        the command was sent are raised, as the command may have been run.
+        """
+
+        if os.getenv(cls.COMMAND_SERVER_ENV_VAR_NAME) != "1":
+            return None
+
+        if not command.startswith("hg ") or cls._shell_characters_regex.search(command):
+            return None
+
+        try:
+            args = shlex.split(command)[1:]
+        except ValueError:
+            return None
+
+        # Find the repository's root without invoking Mercurial
+        root = os.path.realpath(repo_root)
+
+        while not os.path.isdir(os.path.join(root, cls.WorkingDirectories[0])):
+            parent = os.path.dirname(root)
+            if parent == root:
+                return None
+
+            root = parent
+
+        with cls._command_servers_lock:
+            if root not in cls._command_servers:
+                try:
+                    cls._command_servers[root] = MercurialCommandServer(root, environment=os.environ)
+                except Exception as ex:
+                    if cls.Diagnostics:
+                        sys.stdout.write("VERBOSE: The command server for '{}' could not be started ({})\n".format(root, str(ex)))
+
+                    # Don't attempt to start the command server again
+                    cls._command_servers[root] = None
+
+                if len(cls._command_servers) == 1:
+                    atexit.register(cls.CloseCommandServers)
+
+            command_server = cls._command_servers[root]
+
+        if command_server is None:
+            return None
+
+        args = [ "--cwd", repo_root, ] + args
+
+        if cls.Diagnostics:
+            sys.stdout.write("VERBOSE: [command server] hg {}\n".format(' '.join(args)))
+
+        try:
+            return command_server.Execute(args)
+
+        except Exception as ex:
+            exc_info = sys.exc_info()
+
+            if cls.Diagnostics:
+                sys.stdout.write("VERBOSE: The command server for '{}' failed ({})\n".format(root, str(ex)))
+
+            with cls._command_servers_lock:
+                cls._command_servers[root] = None
+
+            try:
+                command_server.Close()
+            except:
+                pass
+
+            # Only run the command again if it wasn't sent to the command server, as
+            # commands like 'commit' or 'push' must not be run twice.
+            if isinstance(ex, CommandNotSentException):
+                return None
+
+            six.reraise(*exc_info)
+
     # ----------------------------------------------------------------------
     @classmethod
     def _UpdateMergeArgToCommandLine(cls, repo_root, arg):
@@ -0,0 +1,214 @@
+# ----------------------------------------------------------------------
+# |  
+# |  MercurialCommandServer_UnitTest.py
+# |  
+# |  David Brownell <db@DavidBrownell.com>
+# |      2018-06-19 10:31:05
+# |  
+# ----------------------------------------------------------------------
+# |  
+# |  Copyright David Brownell 2018.
+# |  Distributed under the Boost Software License, Version 1.0.
+# |  (See accompanying file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+# |  
+# ----------------------------------------------------------------------
+"""Unit test for MercurialCommandServer.py"""
+
+import os
+import sys
+import textwrap
+import unittest
+
+from CommonEnvironment import FileSystem
+from CommonEnvironment.Shell.All import CurrentShell
+from CommonEnvironment.SourceControlManagement.MercurialCommandServer import MercurialCommandServer, CommandNotSentException
+from CommonEnvironment.SourceControlManagement.MercurialSourceControlManagement import MercurialSourceControlManagement
+
+# ----------------------------------------------------------------------
+_script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower() else sys.executable
+_script_dir, _script_name = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+# Stand-in for 'hg serve --cmdserver pipe' that implements the command server framing.
+# Commands echo their arguments and return the value of the last argument if it is a number.
+_SERVER_CONTENT                             = textwrap.dedent(
+    """\
+    import struct
+    import sys
+
+    input_stream = getattr(sys.stdin, "buffer", sys.stdin)
+    output_stream = getattr(sys.stdout, "buffer", sys.stdout)
+
+    def Write(channel, data):
+        output_stream.write(struct.pack(">cI", channel, len(data)) + data)
+        output_stream.flush()
+
+    def Read(num_bytes):
+        data = input_stream.read(num_bytes)
+        assert len(data) == num_bytes, data
+        return data
+
+    Write(b'o', b"capabilities: getencoding {capabilities}\\nencoding: UTF-8\\npid: 1234")
+
+    while True:
+        line = input_stream.readline()
+        if not line:
+            break
+
+        assert line == b"runcommand\\n", line
+
+        args = Read(struct.unpack(">I", Read(4))[0]).split(b'\\0')
+
+        if args[0] == b"exit":
+            sys.exit(1)
+
+        elif args[0] == b"prompt":
+            # Request input
+            output_stream.write(struct.pack(">cI", b'L', 4096))
+            output_stream.flush()
+
+            Write(b'o', b"input: '" + Read(struct.unpack(">I", Read(4))[0]) + b"'\\n")
+
+        elif args[0] == b"debug":
+            # Optional channels should be ignored
+            Write(b'd', b"Debug information\\n")
+            Write(b'o', b"Output\\n")
+
+        elif args[0] == b"required":
+            Write(b'X', b"Required")
+
+        else:
+            Write(b'o', b' '.join(args) + b"\\r\\n")
+            Write(b'e', b"error\\n")
+
+        Write(b'r', struct.pack(">i", int(args[-1]) if args[-1].isdigit() else 0))
+    """)
+
+# ----------------------------------------------------------------------
+class StandardSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def setUp(self):
+        self._temp_dir = CurrentShell.CreateTempDirectory()
+
+    # ----------------------------------------------------------------------
+    def tearDown(self):
+        FileSystem.RemoveTree(self._temp_dir)
+
+    # ----------------------------------------------------------------------
+    def test_Execute(self):
+        with self._CreateServer() as server:
+            self.assertEqual(server.Encoding, "UTF-8")
+
+            self.assertEqual(server.Execute([ "status", ]), ( 0, "status\nerror\n" ))
+            self.assertEqual(server.Execute([ "--cwd", "one two", "log", "3", ]), ( 3, "--cwd one two log 3\nerror\n" ))
+            self.assertEqual(server.Execute([ "status", ]), ( 0, "status\nerror\n" ))
+
+    # ----------------------------------------------------------------------
+    def test_Unicode(self):
+        with self._CreateServer() as server:
+            self.assertEqual(server.Execute([ u"café", ]), ( 0, u"café\nerror\n" ))
+
+    # ----------------------------------------------------------------------
+    def test_Input(self):
+        with self._CreateServer() as server:
+            self.assertEqual(server.Execute([ "prompt", ]), ( 0, "input: ''\n" ))
+
+    # ----------------------------------------------------------------------
+    def test_Channels(self):
+        with self._CreateServer() as server:
+            self.assertEqual(server.Execute([ "debug", ]), ( 0, "Output\n" ))
+
+            self.assertRaises(Exception, lambda: server.Execute([ "required", ]))
+
+    # ----------------------------------------------------------------------
+    def test_Terminated(self):
+        with self._CreateServer() as server:
+            # The command was sent, so the exception doesn't indicate that it wasn't run
+            try:
+                server.Execute([ "exit", ])
+                self.fail()
+            except CommandNotSentException:
+                self.fail()
+            except Exception:
+                pass
+
+    # ----------------------------------------------------------------------
+    def test_Closed(self):
+        server = self._CreateServer()
+        server.Close()
+
+        self.assertRaises(CommandNotSentException, lambda: server.Execute([ "status", ]))
+
+    # ----------------------------------------------------------------------
+    def test_Capabilities(self):
+        self.assertRaises(Exception, lambda: self._CreateServer("getencoding"))
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _CreateServer(self, capabilities="runcommand"):
+        filename = os.path.join(self._temp_dir, "Server.py")
+
+        with open(filename, 'w') as f:
+            f.write(_SERVER_CONTENT.format(capabilities=capabilities))
+
+        return MercurialCommandServer( self._temp_dir,
+                                       command_line=[ sys.executable, filename, ],
+                                     )
+
+# ----------------------------------------------------------------------
+class SourceControlManagementSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    class FailingServer(object):
+        def __init__(self, exception):
+            self.Exception                  = exception
+
+        def Execute(self, args):
+            raise self.Exception
+
+        def Close(self):
+            pass
+
+    # ----------------------------------------------------------------------
+    def setUp(self):
+        self._temp_dir = os.path.realpath(CurrentShell.CreateTempDirectory())
+        os.mkdir(os.path.join(self._temp_dir, ".hg"))
+
+        self._prev_env_value = os.getenv(MercurialSourceControlManagement.COMMAND_SERVER_ENV_VAR_NAME)
+        os.environ[MercurialSourceControlManagement.COMMAND_SERVER_ENV_VAR_NAME] = "1"
+
+    # ----------------------------------------------------------------------
+    def tearDown(self):
+        if self._prev_env_value is None:
+            os.environ.pop(MercurialSourceControlManagement.COMMAND_SERVER_ENV_VAR_NAME)
+        else:
+            os.environ[MercurialSourceControlManagement.COMMAND_SERVER_ENV_VAR_NAME] = self._prev_env_value
+
+        MercurialSourceControlManagement._command_servers.pop(self._temp_dir, None)
+
+        FileSystem.RemoveTree(self._temp_dir)
+
+    # ----------------------------------------------------------------------
+    def test_NotSent(self):
+        # Commands that weren't sent are run in a new process
+        MercurialSourceControlManagement._command_servers[self._temp_dir] = self.FailingServer(CommandNotSentException("Not sent"))
+
+        self.assertEqual(MercurialSourceControlManagement._ExecuteViaCommandServer(self._temp_dir, "hg status"), None)
+        self.assertEqual(MercurialSourceControlManagement._command_servers[self._temp_dir], None)
+
+    # ----------------------------------------------------------------------
+    def test_Sent(self):
+        # Commands that were sent may have been run, so the error is raised
+        MercurialSourceControlManagement._command_servers[self._temp_dir] = self.FailingServer(Exception("Terminated"))
+
+        self.assertRaises(Exception, lambda: MercurialSourceControlManagement._ExecuteViaCommandServer(self._temp_dir, "hg commit"))
+        self.assertEqual(MercurialSourceControlManagement._command_servers[self._temp_dir], None)
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try: sys.exit(unittest.main(verbosity=2))
+    except KeyboardInterrupt: pass
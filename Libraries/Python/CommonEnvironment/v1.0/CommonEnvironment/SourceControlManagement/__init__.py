@@ -257,6 +257,18 @@ class SourceControlManagement(Interface):
         """
         raise Exception("Abstract method")
 
+    # ----------------------------------------------------------------------
+    @classmethod
+    @extensionmethod
+    def GetChangeInfos(cls, repo_root, changes):
+        """
+        Generates information about each change (see GetChangeInfo), in the order in
+        which the changes were provided. Derived implementations should override this
+        method if it is possible to implement it in a more efficient manner.
+        """
+        for change in changes:
+            yield cls.GetChangeInfo(repo_root, change)
+
     # ----------------------------------------------------------------------
     @classmethod
     def AddFiles( cls,
@@ -352,6 +364,18 @@ class SourceControlManagement(Interface):
         """Returns blame information for lines in the provided filename."""
         raise Exception("Abstract method")
 
+    # ----------------------------------------------------------------------
+    @classmethod
+    @extensionmethod
+    def EnumBlameInfos(cls, repo_root, filenames):
+        """
+        Generates ( <filename>, [ <blame info>, ... ] ) for each filename, in the order
+        in which the filenames were provided. Derived implementations should override this
+        method if it is possible to implement it in a more efficient manner.
+        """
+        for filename in filenames:
+            yield filename, list(cls.EnumBlameInfo(repo_root, filename))
+
     # ----------------------------------------------------------------------
     @staticmethod
     @abstractmethod
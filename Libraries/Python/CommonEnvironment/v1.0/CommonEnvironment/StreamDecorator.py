@@ -16,7 +16,6 @@
 
 import datetime
 import os
-import re
 import sys
 import time
 
@@ -176,6 +175,12 @@ class StreamDecorator(object):
 
         self._line_prefix                   = ToFunctor(line_prefix)
         self._line_suffix                   = ToFunctor(line_suffix)
+
+        # Constant line prefixes and suffixes allow content to be decorated without
+        # processing each line individually.
+        self._line_prefix_string            = None if callable(line_prefix) else (line_prefix or '')
+        self._line_suffix_string            = None if callable(line_suffix) else (line_suffix or '')
+
         self._prefix                        = ToFunctor(prefix)
         self._suffix                        = ToFunctor(suffix)
         self._one_time_prefix               = ToFunctor(one_time_prefix)
@@ -211,46 +216,94 @@ class StreamDecorator(object):
         if not self._streams or not content:
             return self
 
+        # The decorated content is generated in its entirety so that each stream
+        # receives a single write, regardless of the number of lines in the content.
+        output = []
+
+        if not self._displayed_one_time_prefix:
+            output.append(self._one_time_prefix(self._column))
+            self._displayed_one_time_prefix = True
+
+        if not self._displayed_prefix:
+            output.append(self._prefix(self._column))
+            self._displayed_prefix = True
+
         # ----------------------------------------------------------------------
-        def Impl(content, eol=None):
+        def GetLinePrefix():
+            if self._skip_first_line_prefix:
+                self._skip_first_line_prefix = False
+                return ''
+
+            line_prefix = self._line_prefix(self._column)
+
+            if custom_line_prefix:
+                line_prefix += custom_line_prefix
+
+            return line_prefix
+
+        # ----------------------------------------------------------------------
+
+        lines = content.split('\n')
+
+        if ( self._line_prefix_string is not None and
+             self._line_suffix_string is not None and
+             '\r' not in content
+           ):
+            # The line prefix and suffix don't depend upon the column, so all of
+            # the lines can be decorated at once.
             if self._column == 0:
-                if self._skip_first_line_prefix:
-                    self._skip_first_line_prefix = False
-                else:
-                    self.write_raw(self._line_prefix(self._column))
+                output.append(GetLinePrefix())
 
-                    if custom_line_prefix:
-                        self.write_raw(custom_line_prefix)
+            if len(lines) == 1:
+                output.append(content)
+                self._column += len(content) + (content.count('\t') * (self._tab_length - 1))
+            else:
+                last_line = lines.pop()
 
-            self.write_raw(content)
-            self._column += len(content) + (content.count('\t') * (self._tab_length - 1))
+                line_prefix = self._line_prefix_string
+                if custom_line_prefix:
+                    line_prefix += custom_line_prefix
 
-            if eol:
-                self.write_raw(self._line_suffix(self._column))
-                self.write_raw(eol)
+                output.append("{}\n{}".format(self._line_suffix_string, line_prefix).join(lines))
+                output.append(self._line_suffix_string)
+                output.append('\n')
 
-                self._column = 0
+                if last_line:
+                    output.append(line_prefix)
+                    output.append(last_line)
 
-        # ----------------------------------------------------------------------
+                self._column = len(last_line) + (last_line.count('\t') * (self._tab_length - 1))
 
-        if not self._displayed_one_time_prefix:
-            self.write_raw(self._one_time_prefix(self._column))
-            self._displayed_one_time_prefix = True
+        else:
+            last_line_index = len(lines) - 1
 
-        if not self._displayed_prefix:
-            self.write_raw(self._prefix(self._column))
-            self._displayed_prefix = True
+            for index, line in enumerate(lines):
+                if index == last_line_index:
+                    if not line:
+                        break
+
+                    eol = None
+                elif line.endswith('\r'):
+                    line = line[:-1]
+                    eol = "\r\n"
+                else:
+                    eol = '\n'
+
+                if self._column == 0:
+                    output.append(GetLinePrefix())
 
-        while True:
-            match = self._eol_regex.search(content)
-            if not match:
-                break
+                output.append(line)
+                self._column += len(line) + (line.count('\t') * (self._tab_length - 1))
 
-            Impl(content[:match.start()], eol=match.group("eol"))
-            content = content[match.end():]
+                if eol is not None:
+                    output.append(self._line_suffix(self._column))
+                    output.append(eol)
 
-        if content:
-            Impl(content)
+                    self._column = 0
+
+        output = ''.join(output)
+        if output:
+            self.write_raw(output)
 
         self._wrote_content = True
 
@@ -284,9 +337,10 @@ class StreamDecorator(object):
                     one_time_suffix = self._one_time_suffix(self._column)
                     self._displayed_one_time_suffix = True
 
-                for stream in self._streams:
-                    stream.write(suffix)
-                    stream.write(one_time_suffix)
+                suffix += one_time_suffix
+                if suffix:
+                    for stream in self._streams:
+                        stream.write(suffix)
 
                 self._displayed_prefix = False
                 self._wrote_content = False
@@ -634,13 +688,6 @@ class StreamDecorator(object):
                 nonlocals.reset_content = False
                 raise
 
-    # ----------------------------------------------------------------------
-    # |  
-    # |  Private Data
-    # |  
-    # ----------------------------------------------------------------------
-    _eol_regex                              = re.compile(r"(?P<eol>\r?\n)")
-
     # ----------------------------------------------------------------------
     # |  
     # |  Private Types
@@ -24,7 +24,8 @@ import threading
 import traceback
 
 from collections import OrderedDict
-from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import six
 
@@ -57,12 +58,21 @@ class Task(object):
                                             #           core_index          # Technically speaking, this isn't the core index but is sufficient to simulate thread local storage
                                             #           output_stream
                                             #           on_status_update    # def Func(content)
+                  dependencies=None,        # Tasks that must complete successfully before this task is started
                 ):
         assert name
         assert functor
 
         self.Name                           = name
         self.Functor                        = functor
+        self.Dependencies                   = dependencies or []
+
+# ----------------------------------------------------------------------
+# |  Executors
+EXECUTOR_THREAD                             = "thread"      # Tasks are invoked on threads within this process
+EXECUTOR_PROCESS                            = "process"     # Tasks are invoked within a pool of processes
+
+EXECUTORS                                   = [ EXECUTOR_THREAD, EXECUTOR_PROCESS, ]
 
 # ----------------------------------------------------------------------
 class ExecuteException(Exception):
@@ -88,6 +98,7 @@ def Transform( items,
                display_errors=True,
                num_concurrent_tasks=None,
                name_functor=None,           # def Func(index, item) -> string
+               executor=EXECUTOR_THREAD,    # See Execute
              ):
     """
     Applies the functor to each item in the list of items, returning a list of
@@ -97,28 +108,44 @@ def Transform( items,
 
     assert items
     assert functor
+    assert executor in EXECUTORS, executor
 
-    functor = Interface.CreateCulledCallable(functor)
     name_functor = name_functor or (lambda index, item: "Results from {} [{}]".format(str(item), index))
 
     transformed_items = [ None, ] * len(items)
 
-    # ----------------------------------------------------------------------
-    def Impl(task_index, on_status_update):
-        transformed_items[task_index] = functor(OrderedDict([ ( "item", items[task_index] ),
-                                                              ( "on_status_update", on_status_update ),
-                                                            ]))
+    with _ProcessExecutorContext(executor, num_concurrent_tasks) as process_executor:
+        if process_executor is not None:
+            # ----------------------------------------------------------------------
+            def Impl(task_index, on_status_update):
+                transformed_items[task_index] = process_executor.Invoke( functor,
+                                                                         OrderedDict([ ( "item", items[task_index] ),
+                                                                                       ( "on_status_update", None ),
+                                                                                     ]),
+                                                                         on_status_update=on_status_update,
+                                                                       )
 
-    # ----------------------------------------------------------------------
+            # ----------------------------------------------------------------------
 
-    Execute( [ Task(name_functor(index, item), Impl) for index, item in enumerate(items) ],
-             output_stream=optional_output_stream,
-             progress_bar=bool(optional_output_stream),
-             raise_on_error=True,
-             display_exception_callstack=display_exception_callstack,
-             display_errors=display_errors,
-             num_concurrent_tasks=num_concurrent_tasks,
-           )
+        else:
+            culled_functor = Interface.CreateCulledCallable(functor)
+
+            # ----------------------------------------------------------------------
+            def Impl(task_index, on_status_update):
+                transformed_items[task_index] = culled_functor(OrderedDict([ ( "item", items[task_index] ),
+                                                                             ( "on_status_update", on_status_update ),
+                                                                           ]))
+
+            # ----------------------------------------------------------------------
+
+        Execute( [ Task(name_functor(index, item), Impl) for index, item in enumerate(items) ],
+                 optional_output_stream,
+                 progress_bar=bool(optional_output_stream),
+                 raise_on_error=True,
+                 display_exception_callstack=display_exception_callstack,
+                 display_errors=display_errors,
+                 num_concurrent_tasks=num_concurrent_tasks,
+               )
 
     return transformed_items
 
@@ -132,13 +159,33 @@ def Execute( tasks,
              display_exception_callstack=True,
              display_errors=True,
              num_concurrent_tasks=None,
+             executor=EXECUTOR_THREAD,
            ):
-    """Invokes each task in parallel"""
+    """
+    Invokes each task in parallel.
+
+    A task is started as soon as all of the tasks that it depends upon have
+    completed successfully; tasks that depend upon a task that fails (either
+    directly or indirectly) are cancelled.
+
+    By default, tasks are invoked on threads within this process, which is
+    appropriate for tasks that spend most of their time waiting on other processes.
+    CPU-bound tasks should use EXECUTOR_PROCESS, where tasks are invoked within
+    a pool of processes; functors (and their return values) must be picklable in
+    this mode. Output and status updates are sent from the worker processes to
+    this process via a queue.
+    """
 
     assert tasks
+    assert executor in EXECUTORS, executor
+
+    tasks = _CreateInternalTasks(tasks)
+
+    if executor == EXECUTOR_PROCESS:
+        num_concurrent_tasks = num_concurrent_tasks or multiprocessing.cpu_count()
+    else:
+        num_concurrent_tasks = num_concurrent_tasks or (multiprocessing.cpu_count() * 5)
 
-    tasks = [ _InternalTask(task) for task in tasks ]
-    num_concurrent_tasks = num_concurrent_tasks or (multiprocessing.cpu_count() * 5)
     output_stream = optional_output_stream or StreamDecorator(None)
 
     prev_statuses = []
@@ -160,7 +207,8 @@ def Execute( tasks,
         nonlocals = Nonlocals(thread_index=0)
         thread_index_mutex = threading.Lock()
 
-        futures = []
+        futures = [ None, ] * len(tasks)
+        futures_lock = threading.Lock()
 
         initialized_event = threading.Event()
         terminate_event = threading.Event()
@@ -206,7 +254,9 @@ def Execute( tasks,
             initialized_event.wait()
 
             start_time = time.time()
-            future = futures[task_index]
+
+            with futures_lock:
+                future = futures[task_index]
 
             sink = six.moves.StringIO()
 
@@ -217,11 +267,22 @@ def Execute( tasks,
             # ----------------------------------------------------------------------
 
             try:
-                result = task.Functor(OrderedDict([ ( "task_index", task_index ),
-                                                    ( "output_stream", sink ),
-                                                    ( "core_index", this_thread_index ),
-                                                    ( "on_status_update", OnStatusUpdate ),
-                                                  ]))
+                if process_executor is not None:
+                    result = process_executor.Invoke( task.OriginalFunctor,
+                                                      OrderedDict([ ( "task_index", task_index ),
+                                                                    ( "output_stream", None ),
+                                                                    ( "core_index", this_thread_index ),
+                                                                    ( "on_status_update", None ),
+                                                                  ]),
+                                                      on_status_update=OnStatusUpdate,
+                                                      output_stream=sink,
+                                                    )
+                else:
+                    result = task.Functor(OrderedDict([ ( "task_index", task_index ),
+                                                        ( "output_stream", sink ),
+                                                        ( "core_index", this_thread_index ),
+                                                        ( "on_status_update", OnStatusUpdate ),
+                                                      ]))
 
                 if result is None:
                     task.result = 0
@@ -258,22 +319,91 @@ def Execute( tasks,
             task.complete.set()
 
         # ----------------------------------------------------------------------
+        def Submit(task_index):
+            task = tasks[task_index]
+
+            # Func reads the future while holding the lock, so it will not see a partially
+            # constructed list of futures.
+            with futures_lock:
+                future = thread_executor.submit(Func, task, task_index)
+                futures[task_index] = future
+
+            future.add_done_callback(lambda ignore, future=future, task_index=task_index: OnTaskDone(future, task_index))
+
+        # ----------------------------------------------------------------------
+        def OnTaskDone(future, task_index):
+            task = tasks[task_index]
+
+            UpdateStatus(future, task, StatusUpdate_Stop, None)
+
+            if future.exception() is not None:
+                task.complete.set()
+
+            succeeded = task.result == 0 and future.exception() is None
+
+            ready_task_indexes = []
+
+            with dependencies_lock:
+                for dependent_index in task.dependent_indexes:
+                    if not succeeded:
+                        Cancel(dependent_index, task)
+                        continue
+
+                    dependent = tasks[dependent_index]
+
+                    dependent.num_pending_dependencies -= 1
+                    if dependent.num_pending_dependencies == 0 and not dependent.is_cancelled:
+                        ready_task_indexes.append(dependent_index)
+
+            for ready_task_index in ready_task_indexes:
+                Submit(ready_task_index)
+
+        # ----------------------------------------------------------------------
+        def Cancel(task_index, failed_task):
+            task = tasks[task_index]
+
+            if task.is_cancelled:
+                return
+
+            task.is_cancelled = True
+            task.result = -1
+            task.output = "This task was cancelled because the task '{}' did not complete successfully.\n".format(failed_task.Name)
+            task.time_delta_string = str(datetime.timedelta(seconds=0))
+
+            task.complete.set()
+
+            UpdateStatus(None, task, StatusUpdate_Stop, None)
+
+            for dependent_index in task.dependent_indexes:
+                Cancel(dependent_index, failed_task)
+
+        # ----------------------------------------------------------------------
+
+        dependencies_lock = threading.Lock()
+
+        with ThreadPoolExecutor(min(num_concurrent_tasks, len(tasks))) as thread_executor, \
+             _ProcessExecutorContext(executor, min(num_concurrent_tasks, len(tasks))) as process_executor:
+            for task in tasks:
+                UpdateStatus(None, task, StatusUpdate_Start, None)
 
-        with ThreadPoolExecutor(min(num_concurrent_tasks, len(tasks))) as executor:
-            futures += [ executor.submit(Func, task, index) for index, task in enumerate(tasks) ]
-            
-            # We can't combine this loop with the comprehension above, as the
-            # update status functor expects a fully constructed list of futures.
-            for future, task in six.moves.zip(futures, tasks):
-                UpdateStatus(future, task, StatusUpdate_Start, None)
-                future.add_done_callback(lambda ignore, future=future, task=task: UpdateStatus(future, task, StatusUpdate_Stop, None))
+            for index, task in enumerate(tasks):
+                if task.num_pending_dependencies == 0:
+                    Submit(index)
 
             display_thread = threading.Thread(target=DisplayStatusesThreadProc)
             display_thread.start()
 
+            # Tasks are submitted as their dependencies complete, so wait for all of
+            # them to complete (or be cancelled) before looking at the futures.
+            for task in tasks:
+                task.complete.wait()
+
             exceptions = OrderedDict()
 
             for index, future in enumerate(futures):
+                if future is None:
+                    continue
+
                 try:
                     future.result()
                 except Exception as ex:
@@ -363,9 +493,11 @@ def Execute( tasks,
 
         # ----------------------------------------------------------------------
         def GetStatus(future, task, update_type, optional_content):
-            if task.complete.is_set():
+            if task.is_cancelled:
+                suffix = "Cancelled"
+            elif task.complete.is_set():
                 suffix = "DONE! ({}, {})".format(task.result, task.time_delta_string)
-            elif future.running():
+            elif future is not None and future.running():
                 suffix = "Running"
             else:
                 suffix = "Queued"
@@ -450,6 +582,12 @@ class _InternalTask(Task):
                                              Interface.CreateCulledCallable(task.Functor),
                                            )
 
+        self.OriginalFunctor                = task.Functor
+
+        # Populated in _CreateInternalTasks
+        self.dependent_indexes              = []
+        self.num_pending_dependencies       = 0
+
         # Working data
         self.output                         = ''
         self.result                         = 0
@@ -459,3 +597,183 @@ class _InternalTask(Task):
         self.status_lock                    = threading.Lock()
 
         self.complete                       = threading.Event()
+        self.is_cancelled                   = False
+
+# ----------------------------------------------------------------------
+class _ProcessExecutor(object):
+    """Invokes functors within a pool of processes, forwarding output and status updates via a queue"""
+
+    # ----------------------------------------------------------------------
+    # |  Message Types
+    ( _Message_Output,
+      _Message_Status,
+      _Message_Flush,
+    ) = range(3)
+
+    # ----------------------------------------------------------------------
+    def __init__(self, num_processes=None):
+        self._manager                       = multiprocessing.Manager()
+        self._queue                         = self._manager.Queue()
+        self._executor                      = ProcessPoolExecutor(num_processes or multiprocessing.cpu_count())
+
+        self._invocations                   = {}
+        self._invocations_lock              = threading.Lock()
+        self._next_invocation_id            = 0
+
+        self._listener_thread               = threading.Thread(target=self._ListenerThreadProc)
+        self._listener_thread.start()
+
+    # ----------------------------------------------------------------------
+    def Shutdown(self):
+        self._executor.shutdown()
+
+        self._queue.put(None)
+        self._listener_thread.join()
+
+        self._manager.shutdown()
+
+    # ----------------------------------------------------------------------
+    def Invoke( self,
+                functor,
+                kwargs,                     # "output_stream" and "on_status_update" values are provided within the worker process
+                on_status_update=None,      # def Func(content)
+                output_stream=None,
+              ):
+        """Invokes the functor in a worker process and returns its result."""
+
+        complete_event = threading.Event()
+
+        with self._invocations_lock:
+            invocation_id = self._next_invocation_id
+            self._next_invocation_id += 1
+
+            self._invocations[invocation_id] = ( on_status_update, output_stream, complete_event )
+
+        try:
+            return self._executor.submit(_ProcessExecutorWorker, functor, kwargs, invocation_id, self._queue).result()
+
+        finally:
+            # Messages sent by the worker have been added to the queue by the time
+            # the result is available; wait for the listener to process them all.
+            self._queue.put(( invocation_id, self._Message_Flush, None ))
+            complete_event.wait()
+
+            with self._invocations_lock:
+                del self._invocations[invocation_id]
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _ListenerThreadProc(self):
+        while True:
+            message = self._queue.get()
+            if message is None:
+                break
+
+            invocation_id, message_type, content = message
+
+            with self._invocations_lock:
+                on_status_update, output_stream, complete_event = self._invocations[invocation_id]
+
+            if message_type == self._Message_Output:
+                if output_stream is not None:
+                    output_stream.write(content)
+
+            elif message_type == self._Message_Status:
+                if on_status_update is not None:
+                    on_status_update(content)
+
+            elif message_type == self._Message_Flush:
+                complete_event.set()
+
+            else:
+                assert False, message_type
+
+# ----------------------------------------------------------------------
+class _QueueStream(object):
+    """Stream that sends written content to a _ProcessExecutor"""
+
+    # ----------------------------------------------------------------------
+    def __init__(self, queue, invocation_id):
+        self._queue                         = queue
+        self._invocation_id                 = invocation_id
+
+    # ----------------------------------------------------------------------
+    def write(self, content):
+        if content:
+            self._queue.put(( self._invocation_id, _ProcessExecutor._Message_Output, content ))
+
+    # ----------------------------------------------------------------------
+    def flush(self):
+        pass
+
+# ----------------------------------------------------------------------
+# |  
+# |  Private Methods
+# |  
+# ----------------------------------------------------------------------
+def _CreateInternalTasks(tasks):
+    internal_tasks = [ _InternalTask(task) for task in tasks ]
+
+    task_indexes = { id(task) : index for index, task in enumerate(tasks) }
+
+    for index, task in enumerate(tasks):
+        for dependency in task.Dependencies:
+            dependency_index = task_indexes.get(id(dependency), None)
+            if dependency_index is None:
+                raise Exception("The task '{}' depends on the task '{}', which is not being executed".format(task.Name, dependency.Name))
+
+            internal_tasks[dependency_index].dependent_indexes.append(index)
+            internal_tasks[index].num_pending_dependencies += 1
+
+    # Ensure that there aren't any cycles
+    num_pending_dependencies = [ task.num_pending_dependencies for task in internal_tasks ]
+    ready_indexes = [ index for index, value in enumerate(num_pending_dependencies) if value == 0 ]
+    num_ready = 0
+
+    while ready_indexes:
+        index = ready_indexes.pop()
+        num_ready += 1
+
+        for dependent_index in internal_tasks[index].dependent_indexes:
+            num_pending_dependencies[dependent_index] -= 1
+            if num_pending_dependencies[dependent_index] == 0:
+                ready_indexes.append(dependent_index)
+
+    if num_ready != len(internal_tasks):
+        raise Exception("The task dependencies contain a cycle: {}".format(", ".join([ "'{}'".format(internal_tasks[index].Name) for index, value in enumerate(num_pending_dependencies) if value ])))
+
+    return internal_tasks
+
+# ----------------------------------------------------------------------
+@contextmanager
+def _ProcessExecutorContext(executor, num_processes):
+    if executor != EXECUTOR_PROCESS:
+        yield None
+        return
+
+    process_executor = _ProcessExecutor(num_processes)
+
+    try:
+        yield process_executor
+    finally:
+        process_executor.Shutdown()
+
+# ----------------------------------------------------------------------
+def _ProcessExecutorWorker(functor, kwargs, invocation_id, queue):
+    """Invoked within a worker process"""
+
+    # ----------------------------------------------------------------------
+    def OnStatusUpdate(content):
+        queue.put(( invocation_id, _ProcessExecutor._Message_Status, content ))
+
+    # ----------------------------------------------------------------------
+
+    kwargs = OrderedDict(kwargs)
+
+    if "output_stream" in kwargs:
+        kwargs["output_stream"] = _QueueStream(queue, invocation_id)
+    if "on_status_update" in kwargs:
+        kwargs["on_status_update"] = OnStatusUpdate
+
+    return Interface.CreateCulledCallable(functor)(kwargs)
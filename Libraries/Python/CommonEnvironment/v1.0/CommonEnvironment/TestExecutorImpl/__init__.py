@@ -100,6 +100,19 @@ class TestExecutorImpl(Interface):
         # No validation by default
         pass 
 
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @extensionmethod
+    def IsParallelExecutionSupported():
+        """
+        Returns True if the test executor is able to execute multiple tests at the same time.
+        Test executors that write data to shared locations (for example, code coverage data
+        written to the current working directory) should return False.
+        """
+
+        # Tests are executed serially by default
+        return False
+
     # ----------------------------------------------------------------------
     @staticmethod
     @abstractmethod
@@ -119,3 +132,17 @@ class TestExecutorImpl(Interface):
                ):
         """Returns ExecuteResult"""
         raise Exception("Abstract method")
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    @extensionmethod
+    def CreateCombinedReport(execute_results, output_dir):
+        """
+        Invoked after all tests have been executed (when a combined report is requested)
+        to create a report that combines the information in the ExecuteResults produced
+        by Execute. Returns the name of the report or None if combined reports aren't
+        supported.
+        """
+
+        # No combined report by default
+        return None
@@ -120,6 +120,54 @@ class DictTypeInfo(TypeInfo):
 
         return None
 
+    # ----------------------------------------------------------------------
+    def _ValidateItemsNoThrowImpl(self, items, **custom_args):
+        if not custom_args.get("recurse", True):
+            return super(DictTypeInfo, self)._ValidateItemsNoThrowImpl(items, **custom_args)
+
+        # Validate the structure of each item without validating attribute values...
+        these_custom_args = dict(custom_args)
+        these_custom_args["recurse"] = False
+
+        result = super(DictTypeInfo, self)._ValidateItemsNoThrowImpl(items, **these_custom_args)
+        num_valid_items = len(items) if result is None else result[0]
+
+        # ...and then validate the values of each attribute across all of the items at once
+        exclude = custom_args.get("exclude", None)
+        if exclude is None:
+            exclude = custom_args.get("exclude_names", None)
+
+        exclude = exclude or set()
+
+        for attribute_name, type_info in six.iteritems(self.Items):
+            if attribute_name in exclude:
+                continue
+
+            indexes = []
+            values = []
+
+            for index in six.moves.range(num_valid_items):
+                item = items[index]
+
+                if attribute_name not in self._GetAttributes(item):
+                    continue
+
+                indexes.append(index)
+                values.append(self._GetAttributeValue(item, attribute_name, type_info))
+
+            index = self._GetFirstInvalidIndex(type_info, values)
+            if index is not None:
+                num_valid_items = indexes[index]
+
+        if num_valid_items == len(items):
+            return None
+
+        # Generate the error string for the first invalid item
+        result = self._ValidateItemNoThrowImpl(items[num_valid_items], **custom_args)
+        assert result is not None
+
+        return num_valid_items, result
+
     # ----------------------------------------------------------------------
     @staticmethod
     @extensionmethod
@@ -76,3 +76,12 @@ class EnumTypeInfo(TypeInfo):
                                                                      ', '.join([ '"{}"'.format(value) for value in self.Values ]),
                                                                    )
 
+    # ----------------------------------------------------------------------
+    def _ValidateItemsNoThrowImpl(self, items):
+        # Items are only validated individually (to find the first invalid item)
+        # when one or more of the items isn't a valid value.
+        if set(items).issubset(self.Values):
+            return None
+
+        return super(EnumTypeInfo, self)._ValidateItemsNoThrowImpl(items)
+
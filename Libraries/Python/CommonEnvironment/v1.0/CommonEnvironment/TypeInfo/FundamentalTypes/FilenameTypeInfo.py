@@ -88,3 +88,29 @@ class FilenameTypeInfo(TypeInfo):
 
             if not self._validation_regex.match(item):
                 return "'{}' does not match the validation expression '{}'".format(item, self.ValidationExpression)
+
+    # ----------------------------------------------------------------------
+    def _ValidateItemsNoThrowImpl(self, items):
+        if self.EnsureExists:
+            exists_func = os.path.exists if self.MatchAny else os.path.isfile
+        else:
+            exists_func = None
+
+        if self.ValidationExpression:
+            if not hasattr(self, "_validation_regex"):
+                self._validation_regex = re.compile("^{}$".format(self.ValidationExpression))
+
+            match_func = self._validation_regex.match
+        else:
+            match_func = None
+
+        if exists_func is None and match_func is None:
+            return None
+
+        for index, item in enumerate(items):
+            if ( (exists_func is not None and not exists_func(item)) or
+                 (match_func is not None and not match_func(item))
+               ):
+                return index, self._ValidateItemNoThrowImpl(item)
+
+        return None
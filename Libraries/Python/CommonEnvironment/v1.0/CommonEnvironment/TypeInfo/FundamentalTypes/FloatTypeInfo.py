@@ -72,3 +72,14 @@ class FloatTypeInfo(TypeInfo):
 
         if self.Max is not None and item > self.Max:
             return "{} is not <= {}".format(item, self.Max)
+
+    # ----------------------------------------------------------------------
+    def _ValidateItemsNoThrowImpl(self, items, **custom_args):
+        # Check the bounds of all items at once; items are only validated
+        # individually (to find the first invalid item) when a bound is exceeded.
+        if ( (self.Min is None or min(items) >= self.Min) and
+             (self.Max is None or max(items) <= self.Max)
+           ):
+            return None
+
+        return super(FloatTypeInfo, self)._ValidateItemsNoThrowImpl(items, **custom_args)
@@ -102,4 +102,14 @@ class IntTypeInfo(TypeInfo):
             return "{} is not <= {}".format(item, self.Max)
 
         return None
-        
\ No newline at end of file
+
+    # ----------------------------------------------------------------------
+    def _ValidateItemsNoThrowImpl(self, items, **custom_args):
+        # Check the bounds of all items at once; items are only validated
+        # individually (to find the first invalid item) when a bound is exceeded.
+        if ( (self.Min is None or min(items) >= self.Min) and
+             (self.Max is None or max(items) <= self.Max)
+           ):
+            return None
+
+        return super(IntTypeInfo, self)._ValidateItemsNoThrowImpl(items, **custom_args)
@@ -0,0 +1,161 @@
+# ----------------------------------------------------------------------
+# |  
+# |  StringSerialization_PerformanceTest.py
+# |  
+# |  David Brownell <db@DavidBrownell.com>
+# |      2018-06-16 11:04:37
+# |  
+# ----------------------------------------------------------------------
+# |  
+# |  Copyright David Brownell 2018.
+# |  Distributed under the Boost Software License, Version 1.0.
+# |  (See accompanying file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+# |  
+# ----------------------------------------------------------------------
+"""Measures the performance of deserializing large lists of items in StringSerialization.py"""
+
+import os
+import re
+import sys
+import textwrap
+import time
+import unittest
+
+from CommonEnvironment.TypeInfo.FundamentalTypes.All import *
+from CommonEnvironment.TypeInfo.FundamentalTypes.Serialization.StringSerialization import RegularExpressionVisitor, \
+                                                                                          StringSerialization, \
+                                                                                          _DeserializationVisitor
+
+# ----------------------------------------------------------------------
+_script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower() else sys.executable
+_script_dir, _script_name = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+NUM_ITEMS                                   = 100000
+
+# ----------------------------------------------------------------------
+class StandardSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def test_Bool(self):
+        self._Compare(BoolTypeInfo(arity="*"), [ "true", "False", "yes", "0", ])
+
+    # ----------------------------------------------------------------------
+    def test_DateTime(self):
+        self._Compare(DateTimeTypeInfo(arity="*"), [ "2018-06-16 11:04:37", "2018-06-16T11:04:37.123456", "@1529147077 +0800", "1529147077.5", ])
+
+    # ----------------------------------------------------------------------
+    def test_Date(self):
+        self._Compare(DateTypeInfo(arity="*"), [ "2018-06-16", "06/16/2018", "18.06.16", ])
+
+    # ----------------------------------------------------------------------
+    def test_Directory(self):
+        self._Compare(DirectoryTypeInfo(ensure_exists=False, arity="*"), [ "one/two", "three", ], normalize=False)
+
+    # ----------------------------------------------------------------------
+    def test_Duration(self):
+        self._Compare(DurationTypeInfo(arity="*"), [ "1.02:03:04", "10:20:30.5", "1:00:00:00", ])
+
+    # ----------------------------------------------------------------------
+    def test_Enum(self):
+        self._Compare(EnumTypeInfo([ "one", "two", "three", ], arity="*"), [ "one", "two", "three", ])
+
+    # ----------------------------------------------------------------------
+    def test_Filename(self):
+        self._Compare(FilenameTypeInfo(ensure_exists=False, arity="*"), [ "one/two.txt", "three.txt", ], normalize=False)
+
+    # ----------------------------------------------------------------------
+    def test_Float(self):
+        self._Compare(FloatTypeInfo(arity="*"), [ "1.0", "-3.14", "42", ])
+
+    # ----------------------------------------------------------------------
+    def test_Guid(self):
+        self._Compare(GuidTypeInfo(arity="*"), [ "{54465641-ADF2-43B1-98EB-66BBD208622C}", "54465641ADF243B198EB66BBD208622C", ])
+
+    # ----------------------------------------------------------------------
+    def test_Int(self):
+        self._Compare(IntTypeInfo(arity="*"), [ "1", "-20", "300", ])
+
+    # ----------------------------------------------------------------------
+    def test_String(self):
+        self._Compare(StringTypeInfo(arity="*"), [ "one", "two words", ])
+
+    # ----------------------------------------------------------------------
+    def test_Time(self):
+        self._Compare(TimeTypeInfo(arity="*"), [ "11:04:37", "11:04:37.123", ])
+
+    # ----------------------------------------------------------------------
+    def test_Uri(self):
+        self._Compare(UriTypeInfo(arity="*"), [ "https://one.two.three/four", "http://five", ])
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _Compare(self, type_info, values, **custom_kwargs):
+        items = [ values[index % len(values)] for index in range(NUM_ITEMS) ]
+
+        # ----------------------------------------------------------------------
+        def Uncompiled():
+            # The implementation prior to the introduction of deserialization plans
+            results = []
+
+            for item in items:
+                for regex_index, regex_string in enumerate(RegularExpressionVisitor.Accept(type_info)):
+                    if isinstance(regex_string, tuple):
+                        regex_string, regex_flags = regex_string
+                    else:
+                        regex_flags = re.DOTALL | re.MULTILINE
+
+                    if not regex_string.startswith('^'):
+                        regex_string = "^{}".format(regex_string)
+                    if not regex_string.endswith('$'):
+                        regex_string = "{}$".format(regex_string)
+
+                    potential_match = re.match(regex_string, item, regex_flags)
+                    if potential_match:
+                        item = _DeserializationVisitor.Accept(type_info, item, custom_kwargs, potential_match, regex_index)
+                        break
+
+                type_info.ValidateItem(item)
+                results.append(item)
+
+            return results
+
+        # ----------------------------------------------------------------------
+
+        durations = []
+        results = []
+
+        for func in [ Uncompiled,
+                      lambda: [ StringSerialization.DeserializeItem(type_info, item, **custom_kwargs) for item in items ],
+                      lambda: StringSerialization.DeserializeItems(type_info, items, **custom_kwargs),
+                    ]:
+            start = time.time()
+            results.append(func())
+            durations.append(time.time() - start)
+
+        self.assertEqual(results[1], results[0])
+        self.assertEqual(results[2], results[0])
+
+        sys.stdout.write(textwrap.dedent(
+            """\
+
+            {name} ({num_items} items)
+                Uncompiled:             {uncompiled:.3f}s
+                DeserializeItem:        {item:.3f}s ({item_speedup:.1f}x)
+                DeserializeItems:       {items:.3f}s ({items_speedup:.1f}x)
+            """).format( name=self.id(),
+                         num_items=len(items),
+                         uncompiled=durations[0],
+                         item=durations[1],
+                         item_speedup=durations[0] / durations[1],
+                         items=durations[2],
+                         items_speedup=durations[0] / durations[2],
+                       ))
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try: sys.exit(unittest.main(verbosity=2))
+    except KeyboardInterrupt: pass
@@ -21,6 +21,9 @@ import re
 import sys
 import textwrap
 import uuid
+import weakref
+
+import six
 
 from CommonEnvironment.Interface import staticderived
 from CommonEnvironment import RegularExpression
@@ -42,6 +45,10 @@ _script_dir, _script_name = os.path.split(_script_fullpath)
 # <Parameters differ from overridden '<...>' method> pylint: disable = W0221
 # <Unused argument> pylint: disable = W0613
 
+# Name of the custom_kwargs value used by _DeserializeItemsImpl to provide a deserialization plan
+# to _DeserializeItemImpl, so that the plan is only retrieved once for a collection of items.
+_PLAN_CUSTOM_KWARG_NAME                     = "__deserialization_plan"
+
 # ----------------------------------------------------------------------
 @staticderived
 class RegularExpressionVisitor(Visitor):
@@ -274,9 +281,54 @@ class StringSerialization(Serialization):
         #   DirectoryTypeInfo       normalize   Boolean     True                Applies os.path.realpath and os.path.normpath to the string
         #   FilenameTypeInfo        normalize   Boolean     True                Applies os.path.realpath and os.path.normpath to the string
 
-        regex_strings = RegularExpressionVisitor.Accept(type_info)
+        plan = custom_kwargs.pop(_PLAN_CUSTOM_KWARG_NAME, None) or _DeserializationPlan.Get(type_info)
+
+        return plan.Deserialize(type_info, item, custom_kwargs)
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _DeserializeItemsImpl(cls, type_info, items, **custom_kwargs):
+        # Retrieve the plan once for all of the items
+        custom_kwargs[_PLAN_CUSTOM_KWARG_NAME] = _DeserializationPlan.Get(type_info)
+
+        deserialize_func = cls._DeserializeItemImpl
+        validate_func = type_info.ValidateItem
+
+        results = []
+
+        for item in items:
+            item = deserialize_func(type_info, item, **custom_kwargs)
 
-        for regex_index, regex_string in enumerate(regex_strings):
+            validate_func(item)
+            results.append(item)
+
+        return results
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+class _DeserializationPlan(object):
+    """Compiled regular expressions used to deserialize strings for a specific TypeInfo instance."""
+
+    _plans                                  = weakref.WeakKeyDictionary()
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Get(cls, type_info):
+        """Returns the cached plan for the type_info, creating a new one if the type_info has changed since the plan was created."""
+
+        plan = cls._plans.get(type_info, None)
+        if plan is None or plan.Signature != vars(type_info):
+            plan = cls(type_info, cls._CreateSignature(type_info))
+            cls._plans[type_info] = plan
+
+        return plan
+
+    # ----------------------------------------------------------------------
+    def __init__(self, type_info, signature):
+        regexes = []
+
+        for regex_string in RegularExpressionVisitor.Accept(type_info):
             if isinstance(regex_string, tuple):
                 regex_string, regex_flags = regex_string
             else:
@@ -287,7 +339,15 @@ class StringSerialization(Serialization):
             if not regex_string.endswith('$'):
                 regex_string = "{}$".format(regex_string)
 
-            potential_match = re.match(regex_string, item, regex_flags)
+            regexes.append(re.compile(regex_string, regex_flags))
+
+        self.Signature                      = signature
+        self.Regexes                        = regexes
+
+    # ----------------------------------------------------------------------
+    def Deserialize(self, type_info, item, custom_kwargs):
+        for regex_index, regex in enumerate(self.Regexes):
+            potential_match = regex.match(item)
             if potential_match:
                 return _DeserializationVisitor.Accept(type_info, item, custom_kwargs, potential_match, regex_index)
 
@@ -299,8 +359,14 @@ class StringSerialization(Serialization):
 
         raise ValidationException(error)
 
-# ----------------------------------------------------------------------
-# ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateSignature(type_info):
+        # Copy mutable values so that in-place modifications are detected
+        return dict([ ( k, v[:] if isinstance(v, list) else dict(v) if isinstance(v, dict) else v ) for k, v in six.iteritems(vars(type_info)) ])
+
 # ----------------------------------------------------------------------
 @staticderived
 class _SerializationVisitor(Visitor):
@@ -44,6 +44,12 @@ class StandardSuite(unittest.TestCase):
         self.assertEqual(JsonSerialization.DeserializeItem(IntTypeInfo(), 100), 100)
         self.assertEqual(JsonSerialization.DeserializeItem(DurationTypeInfo(), "0:02:10.0"), datetime.timedelta(seconds=130))
 
+    # ----------------------------------------------------------------------
+    def test_DeserializeItems(self):
+        self.assertEqual(JsonSerialization.DeserializeItems(IntTypeInfo(arity='*'), [ 1, 2, 3, ]), [ 1, 2, 3, ])
+        self.assertEqual(JsonSerialization.DeserializeItems(BoolTypeInfo(arity='+'), [ True, False, ]), [ True, False, ])
+        self.assertEqual(JsonSerialization.DeserializeItems(DurationTypeInfo(arity='*'), [ "0:02:10.0", "0:00:01.0", ]), [ datetime.timedelta(seconds=130), datetime.timedelta(seconds=1), ])
+
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
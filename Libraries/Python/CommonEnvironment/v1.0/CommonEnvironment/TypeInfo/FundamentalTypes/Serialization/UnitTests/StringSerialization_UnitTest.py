@@ -328,6 +328,33 @@ class DeserializationSuite(unittest.TestCase):
 
         self.assertRaises(ValidationException, lambda: StringSerialization.DeserializeItem(UriTypeInfo(), "not a valid uri"))
 
+    # ----------------------------------------------------------------------
+    def test_Items(self):
+        self.assertEqual(StringSerialization.DeserializeItems(IntTypeInfo(arity="*"), [ "1", "2", "-3", ]), [ 1, 2, -3, ])
+        self.assertEqual(StringSerialization.DeserializeItems(StringTypeInfo(arity="+"), [ "one", "two", ]), [ "one", "two", ])
+        self.assertEqual(StringSerialization.DeserializeItems(BoolTypeInfo(arity="?"), None), None)
+
+        self.assertRaises(ValidationException, lambda: StringSerialization.DeserializeItems(IntTypeInfo(arity="*"), [ "1", "not an int", ]))
+        self.assertRaises(ValidationException, lambda: StringSerialization.DeserializeItems(IntTypeInfo(max=10, arity="*"), [ "1", "20", ]))
+        self.assertRaises(ValidationException, lambda: StringSerialization.DeserializeItems(IntTypeInfo(arity="+"), []))
+
+    # ----------------------------------------------------------------------
+    def test_ModifiedTypeInfo(self):
+        type_info = EnumTypeInfo([ "one", "two", ])
+
+        self.assertEqual(StringSerialization.DeserializeItem(type_info, "two"), "two")
+        self.assertRaises(ValidationException, lambda: StringSerialization.DeserializeItem(type_info, "three"))
+
+        type_info.Values.append("three")
+        self.assertEqual(StringSerialization.DeserializeItem(type_info, "three"), "three")
+
+        type_info = IntTypeInfo(min=0)
+
+        self.assertRaises(ValidationException, lambda: StringSerialization.DeserializeItem(type_info, "-1"))
+
+        type_info.Min = -10
+        self.assertEqual(StringSerialization.DeserializeItem(type_info, "-1"), -1)
+
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
@@ -50,7 +50,7 @@ class Serialization(Interface):
         if type_info.Arity.IsOptional and item_or_items is None:
             return None
         elif type_info.Arity.IsCollection:
-            return [ cls.DeserializeItems(type_info, item, **custom_args) for item in item_or_items ]
+            return cls._DeserializeItemsImpl(type_info, item_or_items, **custom_args)
 
         return cls.DeserializeItem(type_info, item_or_items, **custom_args)
 
@@ -70,6 +70,12 @@ class Serialization(Interface):
         type_info.ValidateItem(item)
         return item
 
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _DeserializeItemsImpl(cls, type_info, items, **custom_args):
+        """Deserializes a collection of items; derived classes may override this method to provide a more efficient implementation."""
+        return [ cls.DeserializeItem(type_info, item, **custom_args) for item in items ]
+
     # ----------------------------------------------------------------------
     @staticmethod
     @abstractmethod
@@ -109,3 +109,27 @@ class StringTypeInfo(TypeInfo):
                                                                              inflect.no("character", self.MaxLength),
                                                                            )
 
+    # ----------------------------------------------------------------------
+    def _ValidateItemsNoThrowImpl(self, items):
+        # Check all of the items at once; items are only validated individually
+        # (to find the first invalid item) when a check fails.
+        is_valid = True
+
+        if self.ValidationExpression:
+            if not hasattr(self, "_validation_regex"):
+                self._validation_regex = re.compile(self.ValidationExpression)
+
+            is_valid = all(self._validation_regex.match(item) for item in items)
+
+        if is_valid and (self.MinLength is not None or self.MaxLength is not None):
+            lengths = [ len(item) for item in items ]
+
+            is_valid = ( (self.MinLength is None or min(lengths) >= self.MinLength) and
+                         (self.MaxLength is None or max(lengths) <= self.MaxLength)
+                       )
+
+        if is_valid:
+            return None
+
+        return super(StringTypeInfo, self)._ValidateItemsNoThrowImpl(items)
+
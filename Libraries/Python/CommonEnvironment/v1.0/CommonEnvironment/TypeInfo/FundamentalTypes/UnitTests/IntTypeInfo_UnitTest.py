@@ -91,6 +91,14 @@ class StandardSuite(unittest.TestCase):
         self.assertEqual(IntTypeInfo(bytes=8, unsigned=True).Min, 0)
         self.assertEqual(IntTypeInfo(bytes=8, unsigned=True).Max, 18446744073709551615)
 
+    # ----------------------------------------------------------------------
+    def test_ValidateItems(self):
+        iti = IntTypeInfo(-10, 20)
+
+        self.assertEqual(iti.ValidateItemsNoThrow(list(range(-10, 21))), None)
+        self.assertEqual(iti.ValidateItemsNoThrow([ 0, 21, -11, ]), ( 1, "21 is not <= 20" ))
+        self.assertEqual(iti.ValidateItemsNoThrow([ 0, -11, 21, ]), ( 1, "-11 is not >= -10" ))
+
     # ----------------------------------------------------------------------
     def test_ConstructErrors(self):
         self.assertRaises(Exception, lambda: IntTypeInfo(20, 10))
@@ -118,20 +118,25 @@ class Visitor(Interface):
     def Accept(cls, type_info, *args, **kwargs):
         """Calls the appropriate On___ method based on the type_info's type."""
 
-        lookup = { BoolTypeInfo             : cls.OnBool,
-                   DateTimeTypeInfo         : cls.OnDateTime,
-                   DateTypeInfo             : cls.OnDate,
-                   DirectoryTypeInfo        : cls.OnDirectory,
-                   DurationTypeInfo         : cls.OnDuration,
-                   EnumTypeInfo             : cls.OnEnum,
-                   FilenameTypeInfo         : cls.OnFilename,
-                   FloatTypeInfo            : cls.OnFloat,
-                   GuidTypeInfo             : cls.OnGuid,
-                   IntTypeInfo              : cls.OnInt,
-                   StringTypeInfo           : cls.OnString,
-                   TimeTypeInfo             : cls.OnTime,
-                   UriTypeInfo              : cls.OnUri,
-                 }
+        # The lookup is created once for each visitor class
+        lookup = cls.__dict__.get("_accept_lookup", None)
+        if lookup is None:
+            lookup = { BoolTypeInfo             : cls.OnBool,
+                       DateTimeTypeInfo         : cls.OnDateTime,
+                       DateTypeInfo             : cls.OnDate,
+                       DirectoryTypeInfo        : cls.OnDirectory,
+                       DurationTypeInfo         : cls.OnDuration,
+                       EnumTypeInfo             : cls.OnEnum,
+                       FilenameTypeInfo         : cls.OnFilename,
+                       FloatTypeInfo            : cls.OnFloat,
+                       GuidTypeInfo             : cls.OnGuid,
+                       IntTypeInfo              : cls.OnInt,
+                       StringTypeInfo           : cls.OnString,
+                       TimeTypeInfo             : cls.OnTime,
+                       UriTypeInfo              : cls.OnUri,
+                     }
+
+            cls._accept_lookup = lookup
 
         typ = type(type_info)
 
@@ -58,3 +58,23 @@ class ListTypeInfo(TypeInfo):
     # ----------------------------------------------------------------------
     def _ValidateItemNoThrowImpl(self, item):
         return self.ElementTypeInfo.ValidateNoThrow(item)
+
+    # ----------------------------------------------------------------------
+    def _ValidateItemsNoThrowImpl(self, items):
+        # Validate the arity of each list and then validate the elements of all of the
+        # lists at once.
+        num_valid_items = len(items)
+
+        for index, item in enumerate(items):
+            if self.ElementTypeInfo.ValidateArityNoThrow(item) is not None:
+                num_valid_items = index
+                break
+
+        index = self._GetFirstInvalidIndex(self.ElementTypeInfo, items[:num_valid_items])
+        if index is not None:
+            num_valid_items = index
+
+        if num_valid_items == len(items):
+            return None
+
+        return num_valid_items, self._ValidateItemNoThrowImpl(items[num_valid_items])
@@ -0,0 +1,112 @@
+# ----------------------------------------------------------------------
+# |  
+# |  __init___PerformanceTest.py
+# |  
+# |  David Brownell <db@DavidBrownell.com>
+# |      2018-06-17 14:27:03
+# |  
+# ----------------------------------------------------------------------
+# |  
+# |  Copyright David Brownell 2018.
+# |  Distributed under the Boost Software License, Version 1.0.
+# |  (See accompanying file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+# |  
+# ----------------------------------------------------------------------
+"""Measures the performance of validating large collections of items"""
+
+import os
+import sys
+import textwrap
+import time
+import unittest
+
+from CommonEnvironment.TypeInfo.DictTypeInfo import DictTypeInfo
+from CommonEnvironment.TypeInfo.ListTypeInfo import ListTypeInfo
+from CommonEnvironment.TypeInfo.FundamentalTypes.All import *
+
+# ----------------------------------------------------------------------
+_script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower() else sys.executable
+_script_dir, _script_name = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+NUM_ITEMS                                   = 100000
+
+# ----------------------------------------------------------------------
+class StandardSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def test_Int(self):
+        self._Compare(IntTypeInfo(min=0, max=NUM_ITEMS, arity='*'), list(range(NUM_ITEMS)))
+
+    # ----------------------------------------------------------------------
+    def test_Float(self):
+        self._Compare(FloatTypeInfo(min=0.0, arity='*'), [ index / 2.0 for index in range(NUM_ITEMS) ])
+
+    # ----------------------------------------------------------------------
+    def test_String(self):
+        self._Compare(StringTypeInfo(max_length=10, arity='*'), [ str(index) for index in range(NUM_ITEMS) ])
+
+    # ----------------------------------------------------------------------
+    def test_Enum(self):
+        self._Compare(EnumTypeInfo([ "one", "two", "three", ], arity='*'), [ [ "one", "two", "three", ][index % 3] for index in range(NUM_ITEMS) ])
+
+    # ----------------------------------------------------------------------
+    def test_Dict(self):
+        self._Compare( DictTypeInfo( a=IntTypeInfo(min=0),
+                                     b=StringTypeInfo(),
+                                     c=EnumTypeInfo([ "one", "two", ], arity='*'),
+                                     arity='*',
+                                   ),
+                       [ { "a" : index, "b" : str(index), "c" : [ "one", "two", ], } for index in range(NUM_ITEMS // 10) ],
+                     )
+
+    # ----------------------------------------------------------------------
+    def test_List(self):
+        self._Compare( ListTypeInfo(IntTypeInfo(min=0, arity='+'), arity='*'),
+                       [ list(range(10)) for _ in range(NUM_ITEMS // 10) ],
+                     )
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _Compare(self, type_info, items):
+        # ----------------------------------------------------------------------
+        def PerItem():
+            # The implementation prior to the introduction of batch validation
+            for item in items:
+                result = type_info.ValidateItemNoThrow(item)
+                if result is not None:
+                    return result
+
+            return None
+
+        # ----------------------------------------------------------------------
+
+        durations = []
+
+        for func in [ PerItem,
+                      lambda: type_info.ValidateNoThrow(items),
+                    ]:
+            start = time.time()
+            self.assertEqual(func(), None)
+            durations.append(time.time() - start)
+
+        sys.stdout.write(textwrap.dedent(
+            """\
+
+            {name} ({num_items} items)
+                Per item:               {per_item:.3f}s
+                Batch:                  {batch:.3f}s ({speedup:.1f}x)
+            """).format( name=self.id(),
+                         num_items=len(items),
+                         per_item=durations[0],
+                         batch=durations[1],
+                         speedup=durations[0] / durations[1],
+                       ))
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try: sys.exit(unittest.main(verbosity=2))
+    except KeyboardInterrupt: pass
@@ -48,6 +48,21 @@ class StandardSuite(unittest.TestCase):
         self.assertFalse(self.ti.IsValidItem({ "a" : 20, "b" : "", }))
         self.assertFalse(self.ti.IsValidItem({ "a" : 20, "b" : 0, }))
 
+    # ----------------------------------------------------------------------
+    def test_ValidateItems(self):
+        items = [ { "a" : 10 + index, "b" : "test", } for index in range(10) ]
+
+        self.assertEqual(self.ti.ValidateItemsNoThrow(items), None)
+
+        items[7]["a"] = 5
+        items[8]["c"] = None
+
+        self.assertEqual(self.ti.ValidateItemsNoThrow(items), ( 7, "The attribute 'a' is not valid - 5 is not >= 10" ))
+        self.assertEqual(self.ti.ValidateItemsNoThrow(items, recurse=False), ( 8, "The item contains extraneous data: 'c'" ))
+
+        items[3]["b"] = ""
+        self.assertEqual(self.ti.ValidateItemsNoThrow(items, require_exact_match=False), ( 3, "The attribute 'b' is not valid - no characters found in the item '' (At least 1 character expected)" ))
+
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
@@ -62,6 +62,17 @@ class StandardSuite(unittest.TestCase):
         self.assertFalse(self.ti.IsValid(l))
         l[0][0] = "abc"
 
+    # ----------------------------------------------------------------------
+    def test_ValidateItems(self):
+        items = [ [ "abc", "def", "ghi", ] for _ in range(5) ]
+
+        self.assertEqual(self.ti.ValidateItemsNoThrow(items), None)
+
+        items[3] = [ "abc", "d", "ghi", ]
+        items[4] = [ "abc", ]
+
+        self.assertEqual(self.ti.ValidateItemsNoThrow(items), ( 3, "1 character found in the item 'd' (At least 2 characters expected)" ))
+
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
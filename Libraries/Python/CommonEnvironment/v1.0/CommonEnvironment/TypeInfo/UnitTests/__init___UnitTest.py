@@ -202,6 +202,24 @@ class TypeInfoSuite(unittest.TestCase):
         self.assertRaises(ValidationException, lambda: self.TeenTypeInfo('?').ValidateArity([ 13, ]))
         self.assertRaises(ValidationException, lambda: self.TeenTypeInfo('{2}').ValidateArity([ 13, ]))
 
+    # ----------------------------------------------------------------------
+    def test_ValidateItems(self):
+        self.TeenTypeInfo().ValidateItems([])
+        self.TeenTypeInfo().ValidateItems([ 13, 14, 15, ])
+        self.TeenTypeInfo('?').ValidateItems([ 13, None, 15, ])
+
+        self.assertEqual(self.TeenTypeInfo().ValidateItemsNoThrow([ 13, 20, 12, ]), ( 1, "item > 19" ))
+        self.assertEqual(self.TeenTypeInfo().ValidateItemsNoThrow([ 13, 12, "string", ]), ( 1, "item < 13" ))
+        self.assertEqual(self.TeenTypeInfo().ValidateItemsNoThrow([ 13, "string", 12, ]), ( 1, "'string' is not an int" ))
+        self.assertEqual(self.TeenTypeInfo('?').ValidateItemsNoThrow([ None, 13, 20, ]), ( 2, "item > 19" ))
+        self.assertEqual(self.TeenTypeInfo(validation_func=lambda item: "Invalid" if item == 14 else None).ValidateItemsNoThrow([ 13, 14, 20, ]), ( 1, "Invalid" ))
+
+        try:
+            self.TeenTypeInfo().ValidateItems([ 13, 14, 20, ])
+            self.fail()
+        except ValidationException as ex:
+            self.assertEqual(str(ex), "The item at index 2 is not valid - item > 19")
+
     # ----------------------------------------------------------------------
     # TypeInfo.ValidateNoThrow is covered by the previous tests
     # TypeInfo.ValidateItemNoThrow is covered by the previous tests
@@ -22,7 +22,8 @@ import six
 
 from CommonEnvironment.Interface import Interface, \
                                         abstractmethod, \
-                                        abstractproperty
+                                        abstractproperty, \
+                                        extensionmethod
 
 # ----------------------------------------------------------------------
 _script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower() else sys.executable
@@ -317,6 +318,18 @@ class TypeInfo(Interface):
         if result is not None:
             raise ValidationException(result)
 
+    # ----------------------------------------------------------------------
+    def ValidateItems(self, items, **custom_args):
+        """
+        Raises ValidationException if any of the items are considered invalid.
+
+        This method is NOT aware of collections; each item is validated
+        as if it were passed to ValidateItem.
+        """
+        result = self.ValidateItemsNoThrow(items, **custom_args)
+        if result is not None:
+            raise ValidationException("The item at index {} is not valid - {}".format(*result))
+
     # ----------------------------------------------------------------------
     def ValidateArity(self, item_or_items):
         """
@@ -365,19 +378,20 @@ class TypeInfo(Interface):
             return result
 
         if not self.Arity.IsCollection:
-            item_or_items = [ item_or_items, ]
-        elif item_or_items is None:
-            item_or_items = []
+            return self.ValidateItemNoThrow(item_or_items, **custom_args)
 
-        result = (self.CollectionValidationFunc or (lambda item_or_items: None))(item_or_items)
-        if result is not None:
-            return result
+        if item_or_items is None:
+            item_or_items = []
 
-        for item in item_or_items:
-            result = self.ValidateItemNoThrow(item, **custom_args)
+        if self.CollectionValidationFunc is not None:
+            result = self.CollectionValidationFunc(item_or_items)
             if result is not None:
                 return result
 
+        result = self.ValidateItemsNoThrow(item_or_items, **custom_args)
+        if result is not None:
+            return result[1]
+
         return None
 
     # ----------------------------------------------------------------------
@@ -394,12 +408,67 @@ class TypeInfo(Interface):
         if result is not None:
             return result
 
-        result = (self.ValidationFunc or (lambda item: None))(item)
-        if result is not None:
-            return result
+        if self.ValidationFunc is not None:
+            result = self.ValidationFunc(item)
+            if result is not None:
+                return result
 
         return None
 
+    # ----------------------------------------------------------------------
+    def ValidateItemsNoThrow(self, items, **custom_args):
+        """
+        Validates a sequence of items in a single pass; returns ( index, error string )
+        for the first invalid item or None if all of the items are valid. The results
+        are the same as calling ValidateItemNoThrow for each item.
+
+        This method is NOT aware of collections.
+        """
+
+        if not isinstance(items, (list, tuple)):
+            items = list(items)
+
+        indexes = None
+
+        if self.Arity.IsOptional and any(item is None for item in items):
+            indexes = [ index for index, item in enumerate(items) if item is not None ]
+            items = [ items[index] for index in indexes ]
+
+        # Each stage only validates the items that precede the first invalid item found by a
+        # previous stage, so that the first invalid item is reported with the same error
+        # string generated when validating items one at a time.
+        result = None
+
+        if self.ExpectedTypeIsCallable:
+            is_expected_type_func = self.ExpectedType                                    # <Class '<name>' has no '<attr>' member> pylint: disable = E1101
+        else:
+            expected_type = self.ExpectedType                                           # <Class '<name>' has no '<attr>' member> pylint: disable = E1101
+            is_expected_type_func = lambda item: isinstance(item, expected_type)
+
+        for index, item in enumerate(items):
+            if not is_expected_type_func(item):
+                result = ( index, "'{}' is not {}".format(item, inflect.a(self._GetExpectedTypeString())) )
+                items = items[:index]
+                break
+
+        if items:
+            this_result = self._ValidateItemsNoThrowImpl(items, **custom_args)
+            if this_result is not None:
+                result = this_result
+                items = items[:result[0]]
+
+        if self.ValidationFunc is not None:
+            for index, item in enumerate(items):
+                this_result = self.ValidationFunc(item)
+                if this_result is not None:
+                    result = ( index, this_result )
+                    break
+
+        if result is not None and indexes is not None:
+            result = ( indexes[result[0]], result[1] )
+
+        return result
+
     # ----------------------------------------------------------------------
     def ValidateArityNoThrow(self, item_or_items):
         """Returns an error string if the input's arity is not valid."""
@@ -464,3 +533,59 @@ class TypeInfo(Interface):
     def _ValidateItemNoThrowImpl(item, **custom_args):
         """Returns a string on error"""
         raise Exception("Abstract method")
+
+    # ----------------------------------------------------------------------
+    @extensionmethod
+    def _ValidateItemsNoThrowImpl(self, items, **custom_args):
+        """
+        Returns ( index, error string ) for the first invalid item or None if all of the items
+        are valid. Items are of the expected type and are not None.
+
+        Derived types can override this method to validate all of the items at once; the
+        default implementation invokes _ValidateItemNoThrowImpl for each item.
+        """
+
+        for index, item in enumerate(items):
+            result = self._ValidateItemNoThrowImpl(item, **custom_args)
+            if result is not None:
+                return index, result
+
+        return None
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _GetFirstInvalidIndex(type_info, values):
+        """
+        Returns the index of the first value that is not valid according to the
+        provided TypeInfo's ValidateNoThrow method, or None if all of the values are
+        valid. The arity of each value must have been validated before invoking this method.
+        """
+
+        if type_info.Arity.IsCollection:
+            if type_info.CollectionValidationFunc is not None:
+                for index, value in enumerate(values):
+                    if type_info.ValidateNoThrow(value) is not None:
+                        return index
+
+                return None
+
+            # Validate the elements of all of the collections at once
+            elements = []
+            element_indexes = []
+
+            for index, value in enumerate(values):
+                if value:
+                    elements += value
+                    element_indexes += [ index, ] * len(value)
+
+            result = type_info.ValidateItemsNoThrow(elements)
+            if result is None:
+                return None
+
+            return element_indexes[result[0]]
+
+        result = type_info.ValidateItemsNoThrow(values)
+        if result is None:
+            return None
+
+        return result[0]
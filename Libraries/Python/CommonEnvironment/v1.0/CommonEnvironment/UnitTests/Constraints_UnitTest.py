@@ -19,6 +19,7 @@ import sys
 import unittest
 
 from CommonEnvironment import Nonlocals
+from CommonEnvironment import Constraints as ConstraintsMod
 from CommonEnvironment.Constraints import *
 from CommonEnvironment.TypeInfo import ValidationException
 from CommonEnvironment.TypeInfo.FundamentalTypes.All import *
@@ -99,6 +100,133 @@ class StandardSuite(unittest.TestCase):
             # print(ex)
             self.assertTrue(True)
 
+    # ----------------------------------------------------------------------
+    def test_Defaults(self):
+        # ----------------------------------------------------------------------
+        @Constraints( a=IntTypeInfo(),
+                      b=StringTypeInfo(arity='*'),
+                      c=StringTypeInfo(arity='?'),
+                    )
+        def Func(a, b=None, c=None, d=10):
+            return a, b, c, d
+
+        # ----------------------------------------------------------------------
+
+        self.assertEqual(Func(1), ( 1, [], None, 10 ))
+        self.assertEqual(Func(1, [ "one", ], c="two"), ( 1, [ "one", ], "two", 10 ))
+        self.assertEqual(Func(a=1, d=20), ( 1, [], None, 20 ))
+
+        try:
+            Func(1, d="twenty")
+            self.fail()
+        except ValidationException as ex:
+            self.assertEqual(str(ex), "Validation for the arg 'd' failed - Invalid input")
+
+    # ----------------------------------------------------------------------
+    def test_InlineValidation(self):
+        # Inline checks must produce the same results as the TypeInfo objects
+        type_infos = { "a" : IntTypeInfo(min=0, max=10, arity='?'),
+                       "b" : FloatTypeInfo(max=1.5),
+                       "c" : StringTypeInfo(min_length=2, max_length=3),
+                       "d" : EnumTypeInfo([ "one", "two", ]),
+                       "e" : BoolTypeInfo(),
+                       "f" : IntTypeInfo(validation_func=lambda value: None if value % 2 == 0 else "Odd"),
+                     }
+
+        # ----------------------------------------------------------------------
+        @Constraints( postcondition=IntTypeInfo(max=100),
+                      **type_infos
+                    )
+        def Func(a, b, c, d, e, f):
+            return f
+
+        # ----------------------------------------------------------------------
+
+        args = [ None, 1, "abc", "two", True, 2, ]
+        self.assertEqual(Func(*args), 2)
+
+        for index, invalid_value in [ ( 0, 11 ),
+                                      ( 0, "1" ),
+                                      ( 1, 2.0 ),
+                                      ( 1, None ),
+                                      ( 2, "a" ),
+                                      ( 2, [ "abc", ] ),
+                                      ( 3, "three" ),
+                                      ( 4, "True" ),
+                                      ( 5, 3 ),
+                                    ]:
+            arg = chr(ord('a') + index)
+
+            these_args = list(args)
+            these_args[index] = invalid_value
+
+            try:
+                Func(*these_args)
+                self.fail((arg, invalid_value))
+            except ValidationException as ex:
+                self.assertEqual(str(ex), "Validation for the arg '{}' failed - {}".format(arg, type_infos[arg].ValidateNoThrow(invalid_value)))
+
+        try:
+            Func(*(args[:-1] + [ 102, ]))
+            self.fail()
+        except ValidationException as ex:
+            self.assertEqual(str(ex), "Validation for the result failed - 102 is not <= 100")
+
+    # ----------------------------------------------------------------------
+    def test_InlineValidationModifiedTypeInfo(self):
+        # Changes made to TypeInfo objects after the first invocation are honored
+        type_infos = { "a" : IntTypeInfo(min=0, max=10),
+                       "b" : StringTypeInfo(),
+                       "c" : EnumTypeInfo([ "one", "two", ]),
+                     }
+
+        # ----------------------------------------------------------------------
+        @Constraints(**type_infos)
+        def Func(a, b, c):
+            return a, b, c
+
+        # ----------------------------------------------------------------------
+
+        self.assertEqual(Func(5, "abc", "one"), ( 5, "abc", "one" ))
+
+        type_infos["a"].Max = 4
+        type_infos["b"].MaxLength = 2
+        type_infos["c"].Values.remove("one")
+
+        for args in [ ( 5, "ab", "two" ),
+                      ( 4, "abc", "two" ),
+                      ( 4, "ab", "one" ),
+                    ]:
+            self.assertRaises(ValidationException, lambda: Func(*args))
+
+        self.assertEqual(Func(4, "ab", "two"), ( 4, "ab", "two" ))
+
+        type_infos["b"].ValidationFunc = lambda value: "Invalid"
+        self.assertRaises(ValidationException, lambda: Func(4, "ab", "two"))
+
+    # ----------------------------------------------------------------------
+    def test_Disabled(self):
+        prev_value = ConstraintsMod.VALIDATION_ENABLED
+        ConstraintsMod.VALIDATION_ENABLED = False
+
+        try:
+            # ----------------------------------------------------------------------
+            @Constraints( a=IntTypeInfo(min=10, max=10),
+                          b=IntTypeInfo(arity='*'),
+                          postcondition=IntTypeInfo(max=0),
+                        )
+            def Func(a, b=None):
+                return a + len(b)
+
+            # ----------------------------------------------------------------------
+
+            # Validation is skipped, but None defaults are still converted
+            self.assertEqual(Func(20), 20)
+            self.assertEqual(Func(20, [ 1, 2, ]), 22)
+
+        finally:
+            ConstraintsMod.VALIDATION_ENABLED = prev_value
+
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
@@ -0,0 +1,136 @@
+# ----------------------------------------------------------------------
+# |  
+# |  DirectoryIndex_UnitTest.py
+# |  
+# |  David Brownell <db@DavidBrownell.com>
+# |      2018-06-15 10:12:09
+# |  
+# ----------------------------------------------------------------------
+# |  
+# |  Copyright David Brownell 2018.
+# |  Distributed under the Boost Software License, Version 1.0.
+# |  (See accompanying file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+# |  
+# ----------------------------------------------------------------------
+"""Unit test for DirectoryIndex.py"""
+
+import os
+import sys
+import unittest
+
+from CommonEnvironment.DirectoryIndex import DirectoryIndex
+from CommonEnvironment import FileSystem
+from CommonEnvironment.Shell.All import CurrentShell
+
+# ----------------------------------------------------------------------
+_script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower() else sys.executable
+_script_dir, _script_name = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+# ----------------------------------------------------------------------
+class StandardSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def setUp(self):
+        self._temp_dir = os.path.realpath(CurrentShell.CreateTempDirectory())
+        self._root = os.path.join(self._temp_dir, "Root")
+
+        for dirname in [ "", "One", os.path.join("One", "Two"), "Three", ]:
+            FileSystem.MakeDirs(os.path.join(self._root, dirname))
+
+            for filename in [ "File1.txt", "File2.txt", ]:
+                with open(os.path.join(self._root, dirname, filename), 'w') as f:
+                    f.write(filename)
+
+        self._index_filename = os.path.join(self._temp_dir, "Generated", DirectoryIndex.DEFAULT_FILENAME)
+
+    # ----------------------------------------------------------------------
+    def tearDown(self):
+        FileSystem.RemoveTree(self._temp_dir)
+
+    # ----------------------------------------------------------------------
+    def test_Walk(self):
+        expected = list(FileSystem.WalkFiles(self._root))
+
+        with self._CreateIndex() as index:
+            self.assertEqual(list(FileSystem.WalkFiles(self._root, directory_index=index)), expected)
+            self.assertEqual(list(FileSystem.WalkFiles(self._root, directory_index=index)), expected)
+
+            self.assertEqual( list(FileSystem.WalkDirs(self._root, directory_index=index)),
+                              list(FileSystem.WalkDirs(self._root)),
+                            )
+
+        self.assertTrue(os.path.isfile(self._index_filename))
+
+        # Changes are detected
+        new_filename = os.path.join(self._root, "One", "New.txt")
+        with open(new_filename, 'w') as f:
+            f.write("New")
+
+        with self._CreateIndex() as index:
+            results = list(FileSystem.WalkFiles(self._root, directory_index=index))
+
+        self.assertEqual(results, list(FileSystem.WalkFiles(self._root)))
+        self.assertTrue(new_filename in results)
+
+    # ----------------------------------------------------------------------
+    def test_Persisted(self):
+        with self._CreateIndex() as index:
+            expected = list(FileSystem.WalkFiles(self._root, directory_index=index))
+
+        # Remove a file without changing the directory's modification time; the index
+        # is used for unchanged directories and will continue to report the file.
+        dirname = os.path.join(self._root, "Three")
+        self._RemoveFileWithoutModifyingDir(os.path.join(dirname, "File1.txt"))
+
+        with self._CreateIndex() as index:
+            self.assertEqual(list(FileSystem.WalkFiles(self._root, directory_index=index)), expected)
+
+            index.Invalidate([ dirname, ])
+            self.assertEqual( list(FileSystem.WalkFiles(self._root, directory_index=index)),
+                              [ filename for filename in expected if filename != os.path.join(dirname, "File1.txt") ],
+                            )
+
+    # ----------------------------------------------------------------------
+    def test_RecentlyModified(self):
+        index = DirectoryIndex(self._index_filename)
+
+        list(FileSystem.WalkFiles(self._root, directory_index=index))
+        index.Save()
+
+        # The directories were just created, so nothing should have been indexed
+        dirname = os.path.join(self._root, "Three")
+        self._RemoveFileWithoutModifyingDir(os.path.join(dirname, "File1.txt"))
+
+        self.assertEqual( list(FileSystem.WalkFiles(self._root, directory_index=DirectoryIndex(self._index_filename))),
+                          list(FileSystem.WalkFiles(self._root)),
+                        )
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _CreateIndex(self):
+        index = DirectoryIndex(self._index_filename)
+        index.RECENT_MODIFICATION_SECONDS = 0
+
+        return index
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _RemoveFileWithoutModifyingDir(filename):
+        dirname = os.path.dirname(filename)
+        stat_result = os.stat(dirname)
+
+        os.remove(filename)
+
+        if hasattr(stat_result, "st_mtime_ns"):
+            os.utime(dirname, ns=( stat_result.st_atime_ns, stat_result.st_mtime_ns ))
+        else:
+            os.utime(dirname, ( stat_result.st_atime, stat_result.st_mtime ))
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try: sys.exit(unittest.main(verbosity=2))
+    except KeyboardInterrupt: pass
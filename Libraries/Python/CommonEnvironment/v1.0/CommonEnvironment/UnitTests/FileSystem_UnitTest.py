@@ -14,10 +14,15 @@
 # ----------------------------------------------------------------------
 """Unit test for FileSystem.py."""
 
+import hashlib
 import os
+import re
 import sys
 import unittest
 
+import six
+
+from CommonEnvironment import FileSystem
 from CommonEnvironment.FileSystem import *
 from CommonEnvironment.Shell.All import CurrentShell
 
@@ -126,6 +131,111 @@ class StandardSuite(unittest.TestCase):
         self.assertEqual(GetSizeDisplay(10000000000000000000000000), "8.3 YiB")
         self.assertEqual(GetSizeDisplay(1000000000000000000000000000000), "827180.6 YiB")
 
+    # ----------------------------------------------------------------------
+    def test_CalculateHashes(self):
+        temp_dir = CurrentShell.CreateTempDirectory()
+        try:
+            filenames = []
+            expected = []
+
+            for index, size in enumerate([ 0, 10, 1024 * 1024, 5 * 1024 * 1024, 100, ]):
+                content = six.int2byte(index + 65) * size
+
+                filename = os.path.join(temp_dir, "File{}".format(index))
+                with open(filename, 'wb') as f:
+                    f.write(content)
+
+                filenames.append(filename)
+                expected.append(hashlib.sha256(content).digest())
+
+            self.assertEqual(CalculateHashes(filenames, None), expected)
+
+            for num_concurrent_tasks in [ None, 3, ]:
+                for mmap_min_size in [ 1, 4 * 1024 * 1024, ]:
+                    self.assertEqual( CalculateHashes( filenames,
+                                                       None,
+                                                       num_concurrent_tasks=num_concurrent_tasks,
+                                                       mmap_min_size=mmap_min_size,
+                                                     ),
+                                      expected,
+                                    )
+
+            sink = six.moves.StringIO()
+            self.assertEqual(CalculateHashes(filenames, sink, num_concurrent_tasks=None), expected)
+
+        finally:
+            RemoveTree(temp_dir)
+
+    # ----------------------------------------------------------------------
+    def test_Walk(self):
+        temp_dir = CurrentShell.CreateTempDirectory()
+        try:
+            for dirname in [ "",
+                             "One",
+                             os.path.join("One", "Two"),
+                             os.path.join("One", "Generated"),
+                             os.path.join("One", "Two", "Three"),
+                             "Four",
+                           ]:
+                MakeDirs(os.path.join(temp_dir, dirname))
+
+                for filename in [ "File.py", "File.txt", "Other.py", ]:
+                    with open(os.path.join(temp_dir, dirname, filename), 'w') as f:
+                        f.write(dirname)
+
+            if CurrentShell.Name != "Windows":
+                os.symlink(os.path.join(temp_dir, "One"), os.path.join(temp_dir, "Four", "Link"))
+
+            for kwargs in [ {},
+                            { "include_generated" : True, },
+                            { "recurse" : False, },
+                            { "exclude_dir_names" : "Two", },
+                            { "traverse_exclude_dir_names" : [ "Two", re.compile("F.+"), ], },
+                            { "traverse_include_dir_paths" : lambda value: "Two" not in value, },
+                            { "include_file_extensions" : ".py", },
+                            { "include_file_base_names" : re.compile(r"F.*"), "exclude_file_names" : [ "File.txt", re.compile("(?i)OTHER.PY"), ], },
+                            { "exclude_full_paths" : [ lambda value: value.endswith("Other.py"), re.compile(r"(.*)\.txt"), ], },
+                          ]:
+                FileSystem._USE_SCANDIR = False
+                try:
+                    expected_dirs = list(WalkDirs(temp_dir, **{ k : v for k, v in six.iteritems(kwargs) if "file" not in k and "full" not in k }))
+                    expected_files = list(WalkFiles(temp_dir, **kwargs))
+                finally:
+                    FileSystem._USE_SCANDIR = hasattr(os, "scandir")
+
+                self.assertTrue(expected_files, kwargs)
+
+                self.assertEqual(list(WalkDirs(temp_dir, **{ k : v for k, v in six.iteritems(kwargs) if "file" not in k and "full" not in k })), expected_dirs, kwargs)
+                self.assertEqual(list(WalkFiles(temp_dir, **kwargs)), expected_files, kwargs)
+
+        finally:
+            RemoveTree(temp_dir)
+
+    # ----------------------------------------------------------------------
+    def test_EnumerateDirectory(self):
+        temp_dir = CurrentShell.CreateTempDirectory()
+        try:
+            MakeDirs(os.path.join(temp_dir, "Dir"))
+
+            with open(os.path.join(temp_dir, "File.txt"), 'w') as f:
+                f.write("File")
+
+            expected_dirs = [ ( "Dir", False ), ]
+
+            if CurrentShell.Name != "Windows":
+                os.symlink(os.path.join(temp_dir, "Dir"), os.path.join(temp_dir, "Link"))
+                expected_dirs.append(( "Link", True ))
+
+            dirs, filenames = EnumerateDirectory(temp_dir)
+
+            self.assertEqual(sorted(dirs), expected_dirs)
+            self.assertEqual(filenames, [ "File.txt", ])
+
+            self.assertRaises(OSError, lambda: EnumerateDirectory(os.path.join(temp_dir, "DoesNotExist")))
+
+        finally:
+            RemoveTree(temp_dir)
+
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
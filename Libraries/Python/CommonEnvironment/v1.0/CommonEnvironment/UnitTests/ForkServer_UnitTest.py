@@ -0,0 +1,194 @@
+# ----------------------------------------------------------------------
+# |  
+# |  ForkServer_UnitTest.py
+# |  
+# |  David Brownell <db@DavidBrownell.com>
+# |      2018-06-18 10:15:32
+# |  
+# ----------------------------------------------------------------------
+# |  
+# |  Copyright David Brownell 2018.
+# |  Distributed under the Boost Software License, Version 1.0.
+# |  (See accompanying file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+# |  
+# ----------------------------------------------------------------------
+"""Unit test for ForkServer.py"""
+
+import os
+import sys
+import textwrap
+import threading
+import unittest
+
+from CommonEnvironment.CallOnExit import CallOnExit
+from CommonEnvironment import FileSystem
+from CommonEnvironment.ForkServer import ForkServer
+from CommonEnvironment import Process
+from CommonEnvironment.Shell.All import CurrentShell
+
+# ----------------------------------------------------------------------
+_script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower() else sys.executable
+_script_dir, _script_name = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+# ----------------------------------------------------------------------
+@unittest.skipUnless(ForkServer.IsSupported(), "Processes can't be forked on this platform")
+class StandardSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        cls._server = ForkServer(preload_modules=[ "six", "textwrap", ])
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def tearDownClass(cls):
+        cls._server.Close()
+
+    # ----------------------------------------------------------------------
+    def test_Output(self):
+        self._Compare( """\
+                       import sys
+
+                       sys.stdout.write("one\\r\\ntwo\\n")
+                       sys.stderr.write("three\\n")
+                       getattr(sys.stdout, "buffer", sys.stdout).write(b"\\xe2\\x9c\\x93\\xff\\n")
+                       """,
+                       0,
+                     )
+
+    # ----------------------------------------------------------------------
+    def test_ExitCodes(self):
+        self._Compare("pass", 0)
+        self._Compare("import sys; sys.exit()", 0)
+        self._Compare("import sys; sys.exit(3)", 3)
+        self._Compare("import sys; sys.exit('A message')", 1)
+        self._Compare("raise Exception('An exception')", 1, compare_output=False)
+
+        # The output contains a traceback
+        result, output = self._Execute("raise Exception('An exception')", self._server.Execute)
+        self.assertEqual(result, 1)
+        self.assertTrue(output.startswith("Traceback"), output)
+        self.assertTrue(output.endswith("Exception: An exception\n"), output)
+
+    # ----------------------------------------------------------------------
+    def test_Signal(self):
+        # Process.Execute invokes the command via the shell, which reports termination by a signal
+        # as 128 + <signal> (the shell's message describing the signal isn't reproduced).
+        self._Compare("import os, signal; os.kill(os.getpid(), signal.SIGTERM)", 128 + 15, compare_output=False)
+
+    # ----------------------------------------------------------------------
+    def test_Environment(self):
+        self._Compare( """\
+                       import os
+                       import sys
+
+                       print(__name__)
+                       print(os.path.basename(__file__))
+                       print(os.path.basename(sys.argv[0]))
+                       print(os.path.realpath(sys.path[0]) == os.path.realpath(os.path.dirname(__file__)))
+                       print(os.getcwd())
+                       """,
+                       0,
+                     )
+
+    # ----------------------------------------------------------------------
+    def test_UnitTest(self):
+        for succeed in [ True, False, ]:
+            result, output = self._Compare( """\
+                                            import sys
+                                            import unittest
+
+                                            class Suite(unittest.TestCase):
+                                                def test_Method(self):
+                                                    self.assertTrue({})
+
+                                            if __name__ == "__main__":
+                                                sys.exit(unittest.main(verbosity=2))
+                                            """.format(succeed),
+                                            0 if succeed else 1,
+                                            compare_output=False,
+                                          )
+
+            self.assertEqual(output.splitlines()[-1], "OK" if succeed else "FAILED (failures=1)")
+
+    # ----------------------------------------------------------------------
+    def test_Isolated(self):
+        # Changes made by one script aren't visible to others
+        content = """\
+                  import textwrap
+
+                  print(hasattr(textwrap, "Modified"))
+                  textwrap.Modified = True
+                  """
+
+        self.assertEqual(self._Execute(content, self._server.Execute), ( 0, "False\n" ))
+        self.assertEqual(self._Execute(content, self._server.Execute), ( 0, "False\n" ))
+
+    # ----------------------------------------------------------------------
+    def test_Concurrent(self):
+        results = [ None, ] * 10
+
+        # ----------------------------------------------------------------------
+        def ThreadProc(index):
+            results[index] = self._Execute( "import sys, time; time.sleep(0.2); sys.stdout.write('{index}'); sys.exit({index})".format(index=index),
+                                            self._server.Execute,
+                                          )
+
+        # ----------------------------------------------------------------------
+
+        threads = [ threading.Thread(target=ThreadProc, args=( index, )) for index in range(len(results)) ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, [ ( index, str(index) ) for index in range(len(results)) ])
+
+    # ----------------------------------------------------------------------
+    def test_Closed(self):
+        with ForkServer(preload_modules=[]) as server:
+            self.assertEqual(self._Execute("print('Open')", server.Execute), ( 0, "Open\n" ))
+
+        self.assertEqual(self._Execute("print('Closed')", server.Execute), ( -1, "" ))
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _Compare(self, content, expected_result, compare_output=True):
+        # ----------------------------------------------------------------------
+        def Execute(filename):
+            return ( self._server.Execute(filename),
+                     Process.Execute('"{}" "{}"'.format(sys.executable, filename)),
+                   )
+
+        # ----------------------------------------------------------------------
+
+        result, expected = self._Execute(content, Execute)
+
+        self.assertEqual(result[0], expected_result)
+        self.assertEqual(expected[0], expected_result)
+
+        if compare_output:
+            self.assertEqual(result[1], expected[1])
+
+        return result
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _Execute(content, execute_func):
+        temp_filename = CurrentShell.CreateTempFilename(".py")
+        with open(temp_filename, 'w') as f:
+            f.write(textwrap.dedent(content))
+
+        with CallOnExit(lambda: FileSystem.RemoveFile(temp_filename)):
+            return execute_func(temp_filename)
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try: sys.exit(unittest.main(verbosity=2))
+    except KeyboardInterrupt: pass
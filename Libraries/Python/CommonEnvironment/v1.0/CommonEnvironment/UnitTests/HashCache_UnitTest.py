@@ -0,0 +1,125 @@
+# ----------------------------------------------------------------------
+# |  
+# |  HashCache_UnitTest.py
+# |  
+# |  David Brownell <db@DavidBrownell.com>
+# |      2018-06-14 14:20:51
+# |  
+# ----------------------------------------------------------------------
+# |  
+# |  Copyright David Brownell 2018.
+# |  Distributed under the Boost Software License, Version 1.0.
+# |  (See accompanying file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+# |  
+# ----------------------------------------------------------------------
+"""Unit test for HashCache.py"""
+
+import os
+import sys
+import unittest
+
+from CommonEnvironment import FileSystem
+from CommonEnvironment.HashCache import HashCache
+from CommonEnvironment.Shell.All import CurrentShell
+
+# ----------------------------------------------------------------------
+_script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower() else sys.executable
+_script_dir, _script_name = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+# ----------------------------------------------------------------------
+class StandardSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def setUp(self):
+        self._temp_dir = CurrentShell.CreateTempDirectory()
+
+        self._filenames = []
+
+        for index in range(3):
+            filename = os.path.join(self._temp_dir, "File{}".format(index))
+            with open(filename, 'wb') as f:
+                f.write("Content {}".format(index).encode("utf-8"))
+
+            self._filenames.append(filename)
+
+        self._cache_filename = os.path.join(self._temp_dir, "Generated", HashCache.DEFAULT_FILENAME)
+
+    # ----------------------------------------------------------------------
+    def tearDown(self):
+        FileSystem.RemoveTree(self._temp_dir)
+
+    # ----------------------------------------------------------------------
+    def test_Lookup(self):
+        with self._CreateCache() as cache:
+            self.assertEqual([ value for _, value in cache.Lookup(self._filenames, "test") ], [ None, None, None, ])
+
+            cache.Update([ ( filename, cache.GetSignature(filename), "Value {}".format(index) ) for index, filename in enumerate(self._filenames) ], "test")
+
+            self.assertEqual([ value for _, value in cache.Lookup(self._filenames, "test") ], [ "Value 0", "Value 1", "Value 2", ])
+            self.assertEqual([ value for _, value in cache.Lookup(self._filenames, "other") ], [ None, None, None, ])
+
+        # Values are persisted and invalidated when the file changes
+        with open(self._filenames[1], 'ab') as f:
+            f.write(b"!")
+
+        with self._CreateCache() as cache:
+            self.assertEqual([ value for _, value in cache.Lookup(self._filenames, "test") ], [ "Value 0", None, "Value 2", ])
+
+            cache.Invalidate([ self._filenames[0], ])
+            self.assertEqual([ value for _, value in cache.Lookup(self._filenames, "test") ], [ None, None, "Value 2", ])
+
+            cache.Invalidate()
+            self.assertEqual([ value for _, value in cache.Lookup(self._filenames, "test") ], [ None, None, None, ])
+
+    # ----------------------------------------------------------------------
+    def test_ChangedWhileHashing(self):
+        with self._CreateCache() as cache:
+            signature = cache.GetSignature(self._filenames[0])
+
+            with open(self._filenames[0], 'ab') as f:
+                f.write(b"Changed content")
+
+            cache.Update([ ( self._filenames[0], signature, "Value" ), ], "test")
+            self.assertEqual(cache.Lookup(self._filenames[:1], "test")[0][1], None)
+
+    # ----------------------------------------------------------------------
+    def test_RecentlyModified(self):
+        # The files were just created, so nothing should be cached
+        with HashCache(self._cache_filename) as cache:
+            cache.Update([ ( filename, cache.GetSignature(filename), "Value" ) for filename in self._filenames ], "test")
+            self.assertEqual([ value for _, value in cache.Lookup(self._filenames, "test") ], [ None, None, None, ])
+
+    # ----------------------------------------------------------------------
+    def test_CalculateHashes(self):
+        expected = FileSystem.CalculateHashes(self._filenames, None)
+
+        with self._CreateCache() as cache:
+            self.assertEqual(FileSystem.CalculateHashes(self._filenames, None, hash_cache=cache), expected)
+            self.assertEqual([ value for _, value in cache.Lookup(self._filenames, "sha256.digest") ], expected)
+
+            # Cached values are used
+            cache.Update([ ( self._filenames[2], cache.GetSignature(self._filenames[2]), b"Cached" ), ], "sha256.digest")
+
+            self.assertEqual(FileSystem.CalculateHashes(self._filenames, None, hash_cache=cache), expected[:2] + [ b"Cached", ])
+
+            # Digest names are cached independently
+            self.assertEqual( FileSystem.CalculateHashes(self._filenames, None, hash_digest_name="hexdigest", hash_cache=cache),
+                              FileSystem.CalculateHashes(self._filenames, None, hash_digest_name="hexdigest"),
+                            )
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _CreateCache(self):
+        cache = HashCache(self._cache_filename)
+        cache.RECENT_MODIFICATION_SECONDS = 0
+
+        return cache
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try: sys.exit(unittest.main(verbosity=2))
+    except KeyboardInterrupt: pass
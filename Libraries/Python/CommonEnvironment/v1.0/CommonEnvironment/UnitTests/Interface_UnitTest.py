@@ -15,11 +15,18 @@
 """Unit tst for Interface.py"""
 
 import os
+import subprocess
 import sys
+import textwrap
 import unittest
 
+import six
+
 import CommonEnvironment
+import CommonEnvironment.Interface as InterfaceModule
 from CommonEnvironment.Interface import *
+from CommonEnvironment import FileSystem
+from CommonEnvironment.Shell.All import CurrentShell
 
 # ----------------------------------------------------------------------
 class InterfaceSuite(unittest.TestCase):
@@ -449,6 +456,254 @@ class ExtensionMethodSuite(unittest.TestCase):
         for index, prefix in enumerate(expected_prefixes):
             self.assertTrue(methods[index].startswith(prefix))
 
+# ----------------------------------------------------------------------
+class VerificationSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    class Base(Interface):
+        @abstractmethod
+        def Method(self, a, b): pass
+
+    # ----------------------------------------------------------------------
+    class Concrete(Base):
+        def Method(self, a, b): pass
+
+    # ----------------------------------------------------------------------
+    def setUp(self):
+        self._prev_mode = InterfaceModule.VERIFICATION_MODE
+
+    # ----------------------------------------------------------------------
+    def tearDown(self):
+        InterfaceModule.VERIFICATION_MODE = self._prev_mode
+
+    # ----------------------------------------------------------------------
+    def test_AbstractItems(self):
+        self.assertEqual(self.Base.AbstractItems, [ "Method", ])
+        self.assertEqual(self.Concrete.AbstractItems, [ "Method", ])
+
+    # ----------------------------------------------------------------------
+    def test_Deferred(self):
+        InterfaceModule.VERIFICATION_MODE = VERIFICATION_MODE_DEFERRED
+
+        self._TestScheduled()
+
+    # ----------------------------------------------------------------------
+    def test_Background(self):
+        InterfaceModule.VERIFICATION_MODE = VERIFICATION_MODE_BACKGROUND
+
+        prev_stderr = sys.stderr
+        sys.stderr = six.moves.StringIO()
+
+        try:
+            self._TestScheduled()
+        finally:
+            sys.stderr = prev_stderr
+
+    # ----------------------------------------------------------------------
+    def test_Cache(self):
+        temp_dir = CurrentShell.CreateTempDirectory()
+
+        try:
+            cache_filename = os.path.join(temp_dir, "Generated", "Cache.pickle")
+            module_name = "VerificationCacheTestModule"
+            module_filename = os.path.join(temp_dir, "{}.py".format(module_name))
+
+            # ----------------------------------------------------------------------
+            def ImportConcrete(content):
+                with open(module_filename, 'w') as f:
+                    f.write(textwrap.dedent(content))
+
+                sys.modules.pop(module_name, None)
+                return __import__(module_name).Concrete
+
+            # ----------------------------------------------------------------------
+
+            sys.path.insert(0, temp_dir)
+
+            try:
+                concrete = ImportConcrete(
+                    """\
+                    from CommonEnvironment.Interface import *
+
+                    class Concrete(Interface):
+                        pass
+                    """)
+
+                cache = InterfaceModule._VerificationCache(cache_filename)
+                self.assertFalse(cache.IsVerified(concrete))
+
+                cache.Add(concrete)
+                self.assertTrue(cache.IsVerified(concrete))
+
+                cache.Save()
+
+                # The information is persisted
+                cache = InterfaceModule._VerificationCache(cache_filename)
+                self.assertTrue(cache.IsVerified(concrete))
+
+                # Changes to the file invalidate the information
+                concrete = ImportConcrete(
+                    """\
+                    from CommonEnvironment.Interface import *
+
+                    class Concrete(Interface):
+                        Value = 10
+                    """)
+
+                cache = InterfaceModule._VerificationCache(cache_filename)
+                self.assertFalse(cache.IsVerified(concrete))
+
+            finally:
+                sys.path.remove(temp_dir)
+                sys.modules.pop(module_name, None)
+
+            # Types that can't be found by name aren't cached
+            # ----------------------------------------------------------------------
+            class Local(self.Base):
+                def Method(self, a, b): pass
+
+            # ----------------------------------------------------------------------
+
+            cache.Add(Local)
+            self.assertFalse(cache.IsVerified(Local))
+
+            cache.Add(self.Concrete)
+            self.assertTrue(cache.IsVerified(self.Concrete))
+
+        finally:
+            FileSystem.RemoveTree(temp_dir)
+
+    # ----------------------------------------------------------------------
+    def test_CacheStaticDerived(self):
+        temp_dir = CurrentShell.CreateTempDirectory()
+
+        prev_cache = InterfaceModule._verification_cache
+        prev_verify_type = InterfaceModule._VerifyType
+
+        verified_types = []
+
+        # ----------------------------------------------------------------------
+        def VerifyType(cls):
+            verified_types.append(cls.__name__)
+            return prev_verify_type(cls)
+
+        # ----------------------------------------------------------------------
+
+        InterfaceModule.VERIFICATION_MODE = VERIFICATION_MODE_IMMEDIATE
+        InterfaceModule._VerifyType = VerifyType
+
+        try:
+            cache_filename = os.path.join(temp_dir, "Cache.pickle")
+            module_name = "VerificationCacheStaticDerivedTestModule"
+
+            with open(os.path.join(temp_dir, "{}.py".format(module_name)), 'w') as f:
+                f.write(textwrap.dedent(
+                    """\
+                    from CommonEnvironment.Interface import *
+
+                    class Base(Interface):
+                        @staticmethod
+                        @abstractmethod
+                        def Method(a, b): pass
+
+                    @staticderived
+                    class Concrete(Base):
+                        @staticmethod
+                        def Method(a, b): pass
+                    """))
+
+            sys.path.insert(0, temp_dir)
+
+            try:
+                # Each import simulates a new process
+                for expected_verified_types in [ [ "Concrete", ], [], ]:
+                    InterfaceModule._verification_cache = InterfaceModule._VerificationCache(cache_filename)
+
+                    sys.modules.pop(module_name, None)
+                    __import__(module_name)
+
+                    InterfaceModule._verification_cache.Save()
+
+                    self.assertEqual(verified_types, expected_verified_types)
+                    verified_types[:] = []
+
+            finally:
+                sys.path.remove(temp_dir)
+                sys.modules.pop(module_name, None)
+
+        finally:
+            InterfaceModule._VerifyType = prev_verify_type
+            InterfaceModule._verification_cache = prev_cache
+
+            FileSystem.RemoveTree(temp_dir)
+
+    # ----------------------------------------------------------------------
+    def test_CacheDefaultFilename(self):
+        fundamental_repo = os.getenv("DEVELOPMENT_ENVIRONMENT_FUNDAMENTAL")
+        if not fundamental_repo:
+            try:
+                import RepositoryBootstrap
+            except ImportError:
+                self.skipTest("The fundamental repository could not be found")
+
+            fundamental_repo = os.path.dirname(os.path.dirname(os.path.realpath(RepositoryBootstrap.__file__)))
+
+        temp_dir = CurrentShell.CreateTempDirectory()
+
+        try:
+            # Simulate an activated environment, where the fundamental repository isn't
+            # in the python path and the cache location isn't explicitly provided.
+            environment = dict(os.environ)
+
+            environment.pop(InterfaceModule.VERIFICATION_CACHE_ENV_VAR_NAME, None)
+            environment["DEVELOPMENT_ENVIRONMENT_FUNDAMENTAL"] = fundamental_repo
+            environment["DEVELOPMENT_ENVIRONMENT_REPOSITORY_GENERATED"] = temp_dir
+            environment["PYTHONPATH"] = os.path.dirname(os.path.dirname(os.path.realpath(InterfaceModule.__file__)))
+
+            output = subprocess.check_output( [ sys.executable,
+                                                "-c",
+                                                "import CommonEnvironment.Interface as InterfaceModule; print(InterfaceModule._GetVerificationCache().Filename)",
+                                              ],
+                                              cwd=temp_dir,
+                                              env=environment,
+                                            )
+
+            self.assertEqual(output.decode("utf-8").strip(), os.path.join(temp_dir, InterfaceModule._VerificationCache.DEFAULT_FILENAME))
+
+        finally:
+            FileSystem.RemoveTree(temp_dir)
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _TestScheduled(self):
+        # ----------------------------------------------------------------------
+        class Valid(self.Base):
+            def Method(self, a, b): pass
+
+        # ----------------------------------------------------------------------
+        class Invalid(self.Base):
+            def Method(self, a): pass
+
+        # ----------------------------------------------------------------------
+
+        # Instantiation doesn't fail, as verification is delayed
+        Valid()
+        Invalid()
+        Invalid()
+
+        try:
+            VerifyAll()
+            self.fail()
+        except InterfaceException as ex:
+            self.assertEqual(str(ex).count("Can't instantiate class 'Invalid'"), 1)
+            self.assertTrue("class 'Valid'" not in str(ex))
+
+        # Errors are only reported once
+        VerifyAll()
+
+        Valid()
+
 # ----------------------------------------------------------------------
 class StaticDerivedSuite(unittest.TestCase):
 
@@ -588,6 +843,23 @@ class TestCreateCulledCallable(unittest.TestCase):
                                                    ( "bar", 2 ),
                                                  ])), 10)
 
+    # ----------------------------------------------------------------------
+    def test_BindingPlan(self):
+        func = CreateCulledCallable(lambda a, b, c=30: ( a, b, c ))
+
+        self.assertEqual(func.GetBindingPlan([ "a", "b", ]), ( ( "a", "a" ), ( "b", "b" ) ))
+        self.assertEqual(func.GetBindingPlan([ "foo", "b", "bar", ]), ( ( "b", "b" ), ( "a", "foo" ) ))
+        self.assertEqual(func.GetBindingPlan([ "c", "foo", "bar", ]), ( ( "c", "c" ), ( "a", "foo" ), ( "b", "bar" ) ))
+
+        # Plans are cached
+        self.assertTrue(func.GetBindingPlan([ "a", "b", ]) is func.GetBindingPlan(( "a", "b" )))
+
+        # The order of the incoming args impacts the plan
+        self.assertEqual(func(OrderedDict([ ( "foo", 1 ), ( "bar", 2 ), ])), ( 1, 2, 30 ))
+        self.assertEqual(func(OrderedDict([ ( "bar", 2 ), ( "foo", 1 ), ])), ( 2, 1, 30 ))
+
+        self.assertEqual(CreateCulledCallable(lambda **kwargs: kwargs).GetBindingPlan([ "a", ]), None)
+
 # ----------------------------------------------------------------------
 class TestIsMethodsSuite(unittest.TestCase):
 
@@ -0,0 +1,100 @@
+# ----------------------------------------------------------------------
+# |  
+# |  PersistedData_UnitTest.py
+# |  
+# |  David Brownell <db@DavidBrownell.com>
+# |      2018-06-21 09:20:35
+# |  
+# ----------------------------------------------------------------------
+# |  
+# |  Copyright David Brownell 2018.
+# |  Distributed under the Boost Software License, Version 1.0.
+# |  (See accompanying file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+# |  
+# ----------------------------------------------------------------------
+"""Unit test for PersistedData.py"""
+
+import os
+import sys
+import unittest
+
+import six.moves.cPickle as pickle
+
+from CommonEnvironment import FileSystem
+from CommonEnvironment import PersistedData
+from CommonEnvironment.Shell.All import CurrentShell
+
+# ----------------------------------------------------------------------
+_script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower() else sys.executable
+_script_dir, _script_name = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+# ----------------------------------------------------------------------
+class GetGeneratedFilenameSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def setUp(self):
+        self._prev_environment = dict(os.environ)
+
+    # ----------------------------------------------------------------------
+    def tearDown(self):
+        os.environ.clear()
+        os.environ.update(self._prev_environment)
+
+    # ----------------------------------------------------------------------
+    def test_NotActivated(self):
+        os.environ.pop("DEVELOPMENT_ENVIRONMENT_FUNDAMENTAL", None)
+        self.assertEqual(PersistedData.GetGeneratedFilename("File.txt"), None)
+
+    # ----------------------------------------------------------------------
+    def test_Activated(self):
+        fundamental_repo = os.getenv("DEVELOPMENT_ENVIRONMENT_FUNDAMENTAL")
+        if not fundamental_repo:
+            try:
+                import RepositoryBootstrap
+            except ImportError:
+                self.skipTest("The fundamental repository could not be found")
+
+            fundamental_repo = os.path.dirname(os.path.dirname(os.path.realpath(RepositoryBootstrap.__file__)))
+
+        os.environ["DEVELOPMENT_ENVIRONMENT_FUNDAMENTAL"] = fundamental_repo
+        os.environ["DEVELOPMENT_ENVIRONMENT_REPOSITORY_GENERATED"] = _script_dir
+
+        self.assertEqual(PersistedData.GetGeneratedFilename("File.txt"), os.path.join(_script_dir, "File.txt"))
+
+        os.environ.pop("DEVELOPMENT_ENVIRONMENT_REPOSITORY_GENERATED")
+        self.assertEqual(PersistedData.GetGeneratedFilename("File.txt"), None)
+
+# ----------------------------------------------------------------------
+class SavePickleSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def setUp(self):
+        self._temp_dir = CurrentShell.CreateTempDirectory()
+
+    # ----------------------------------------------------------------------
+    def tearDown(self):
+        FileSystem.RemoveTree(self._temp_dir)
+
+    # ----------------------------------------------------------------------
+    def test_Standard(self):
+        dirname = os.path.join(self._temp_dir, "Generated")
+        filename = os.path.join(dirname, "Data.pickle")
+
+        for data in [ ( 1, { "one" : 1, } ),
+                      ( 2, { "two" : 2, } ),
+                    ]:
+            PersistedData.SavePickle(filename, data)
+
+            with open(filename, 'rb') as f:
+                self.assertEqual(pickle.load(f), data)
+
+            # The temporary file has been moved into place
+            self.assertEqual(os.listdir(dirname), [ "Data.pickle", ])
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try: sys.exit(unittest.main(verbosity=2))
+    except KeyboardInterrupt: pass
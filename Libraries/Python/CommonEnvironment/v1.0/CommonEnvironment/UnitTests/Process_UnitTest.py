@@ -0,0 +1,115 @@
+# ----------------------------------------------------------------------
+# |  
+# |  Process_UnitTest.py
+# |  
+# |  David Brownell <db@DavidBrownell.com>
+# |      2018-06-12 08:41:17
+# |  
+# ----------------------------------------------------------------------
+# |  
+# |  Copyright David Brownell 2018.
+# |  Distributed under the Boost Software License, Version 1.0.
+# |  (See accompanying file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+# |  
+# ----------------------------------------------------------------------
+"""Unit test for Process.py"""
+
+import os
+import sys
+import textwrap
+import unittest
+
+from CommonEnvironment.CallOnExit import CallOnExit
+from CommonEnvironment import FileSystem
+from CommonEnvironment import Process
+from CommonEnvironment.Shell.All import CurrentShell
+
+# ----------------------------------------------------------------------
+_script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower() else sys.executable
+_script_dir, _script_name = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+# ----------------------------------------------------------------------
+def Execute(content, *args, **kwargs):
+    """Executes a python script that writes the given bytes to stdout."""
+
+    temp_filename = CurrentShell.CreateTempFilename(".py")
+    with open(temp_filename, 'w') as f:
+        f.write(textwrap.dedent(
+            """\
+            import sys
+
+            getattr(sys.stdout, "buffer", sys.stdout).write({})
+            """).format(repr(content)))
+
+    with CallOnExit(lambda: FileSystem.RemoveFile(temp_filename)):
+        return Process.Execute('"{}" "{}"'.format(sys.executable, temp_filename), *args, **kwargs)
+
+# ----------------------------------------------------------------------
+class StandardSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def test_Output(self):
+        for block_buffered in [ True, False, ]:
+            self.assertEqual(Execute(b"one\ntwo\nthree", block_buffered=block_buffered), ( 0, "one\ntwo\nthree" ))
+            self.assertEqual(Execute(b"one\r\ntwo\r\n", block_buffered=block_buffered), ( 0, "one\ntwo\n" ))
+            self.assertEqual(Execute(b"one\r\ntwo\r\n", block_buffered=block_buffered, convert_newlines=False), ( 0, "one\r\ntwo\r\n" ))
+            self.assertEqual(Execute(b"\033[31mred\033[0m\n", block_buffered=block_buffered), ( 0, "\033[31mred\033[0m\n" ))
+
+    # ----------------------------------------------------------------------
+    def test_LineDelimited(self):
+        for block_buffered in [ True, False, ]:
+            lines = []
+
+            self.assertEqual(Execute(b"one\r\ntwo\n\nthree", lines.append, line_delimited_output=True, block_buffered=block_buffered), 0)
+            self.assertEqual(lines, [ "one\n", "two\n\n", "three", ])
+
+    # ----------------------------------------------------------------------
+    def test_HardStop(self):
+        for block_buffered in [ True, False, ]:
+            lines = []
+
+            # ----------------------------------------------------------------------
+            def Output(line):
+                lines.append(line)
+                return not line.startswith("two")
+
+            # ----------------------------------------------------------------------
+
+            Execute(b"one\ntwo\nthree\n", Output, line_delimited_output=True, block_buffered=block_buffered)
+            self.assertEqual(lines, [ "one\n", "two\n", ])
+
+    # ----------------------------------------------------------------------
+    def test_BlockBoundaries(self):
+        # Newlines, escape sequences, and multi-byte characters that span blocks
+        content = b''.join([ b"x" * (Process.BLOCK_SIZE - 1),
+                             b"\r\n",
+                             b"y" * (Process.BLOCK_SIZE - 3),
+                             b"\033[31m",
+                             b"z" * (Process.BLOCK_SIZE - 1),
+                             u"é".encode("utf-8"),
+                             b"\n",
+                           ])
+
+        expected = content.decode("utf-8").replace("\r\n", "\n")
+
+        lines = []
+
+        self.assertEqual(Execute(content, lines.append), 0)
+        self.assertEqual(''.join(lines), expected)
+
+        for line in lines:
+            self.assertTrue('\033' not in line or "\033[31m" in line, line)
+
+        self.assertEqual(Execute(content), ( 0, expected ))
+
+    # ----------------------------------------------------------------------
+    def test_Result(self):
+        self.assertEqual(Process.Execute('"{}" -c "import sys; sys.exit(3)"'.format(sys.executable)), ( 3, '' ))
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try: sys.exit(unittest.main(verbosity=2))
+    except KeyboardInterrupt: pass
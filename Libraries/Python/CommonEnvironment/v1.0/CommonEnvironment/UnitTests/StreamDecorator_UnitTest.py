@@ -0,0 +1,96 @@
+# ----------------------------------------------------------------------
+# |  
+# |  StreamDecorator_UnitTest.py
+# |  
+# |  David Brownell <db@DavidBrownell.com>
+# |      2018-06-18 08:41:17
+# |  
+# ----------------------------------------------------------------------
+# |  
+# |  Copyright David Brownell 2018.
+# |  Distributed under the Boost Software License, Version 1.0.
+# |  (See accompanying file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+# |  
+# ----------------------------------------------------------------------
+"""Unit test for StreamDecorator.py"""
+
+import os
+import sys
+import unittest
+
+from six.moves import StringIO
+
+from CommonEnvironment.StreamDecorator import StreamDecorator
+
+# ----------------------------------------------------------------------
+_script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower() else sys.executable
+_script_dir, _script_name = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+# ----------------------------------------------------------------------
+class StandardSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def test_LinePrefix(self):
+        sink = StringIO()
+        stream = StreamDecorator(sink, line_prefix="> ", line_suffix=" <")
+
+        stream.write("one\ntwo\n\nthree")
+        stream.write(" four\r\nfive\n", custom_line_prefix="* ")
+
+        self.assertEqual(sink.getvalue(), "> one <\n> two <\n>  <\n> three four <\r\n> * five <\n")
+
+    # ----------------------------------------------------------------------
+    def test_LinePrefixFunc(self):
+        sink = StringIO()
+        stream = StreamDecorator( sink,
+                                  line_prefix=lambda column: "[{}]".format(column),
+                                  line_suffix=lambda column: "({})".format(column),
+                                  skip_first_line_prefix=True,
+                                )
+
+        stream.write("one\n\ttwo\nthree")
+        stream.write("\n")
+
+        self.assertEqual(sink.getvalue(), "one(3)\n[0]\ttwo(7)\n[0]three(5)\n")
+
+    # ----------------------------------------------------------------------
+    def test_PrefixAndSuffix(self):
+        sink = StringIO()
+        stream = StreamDecorator(sink, prefix="<", suffix=">", one_time_prefix="[", one_time_suffix="]")
+
+        stream.write("one")
+        stream.flush()
+        stream.write("two")
+        stream.flush()
+
+        self.assertEqual(sink.getvalue(), "[<one>]<two>")
+
+    # ----------------------------------------------------------------------
+    def test_SingleWrite(self):
+        # ----------------------------------------------------------------------
+        class Stream(object):
+            def __init__(self):
+                self.Writes = []
+
+            def write(self, content):
+                self.Writes.append(content)
+
+            def flush(self):
+                pass
+
+        # ----------------------------------------------------------------------
+
+        sink = Stream()
+
+        stream = StreamDecorator(StreamDecorator(StreamDecorator(sink, line_prefix="  "), line_prefix="  "), line_prefix="  ")
+        stream.write("one\ntwo\nthree\n")
+
+        self.assertEqual(sink.Writes, [ "      one\n      two\n      three\n", ])
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try: sys.exit(unittest.main(verbosity=2))
+    except KeyboardInterrupt: pass
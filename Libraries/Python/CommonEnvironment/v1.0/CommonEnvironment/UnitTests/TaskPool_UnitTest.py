@@ -0,0 +1,185 @@
+# ----------------------------------------------------------------------
+# |  
+# |  TaskPool_UnitTest.py
+# |  
+# |  David Brownell <db@DavidBrownell.com>
+# |      2018-06-13 10:02:44
+# |  
+# ----------------------------------------------------------------------
+# |  
+# |  Copyright David Brownell 2018.
+# |  Distributed under the Boost Software License, Version 1.0.
+# |  (See accompanying file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+# |  
+# ----------------------------------------------------------------------
+"""Unit test for TaskPool.py"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+import six
+
+from CommonEnvironment import TaskPool
+
+# ----------------------------------------------------------------------
+_script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower() else sys.executable
+_script_dir, _script_name = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+# Functors invoked in other processes must be defined at the module level
+
+# ----------------------------------------------------------------------
+def Succeed(task_index, output_stream, on_status_update):
+    on_status_update("Working")
+    output_stream.write("Output from {} ({})\n".format(task_index, os.getpid()))
+
+# ----------------------------------------------------------------------
+def Fail(task_index):
+    return task_index, "Failure from {}\n".format(task_index)
+
+# ----------------------------------------------------------------------
+def Raise():
+    raise Exception("Raised")
+
+# ----------------------------------------------------------------------
+def Square(item):
+    return item * item
+
+# ----------------------------------------------------------------------
+class ExecuteSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def test_Success(self):
+        for executor in TaskPool.EXECUTORS:
+            sink = six.moves.StringIO()
+
+            self.assertEqual(TaskPool.Execute( [ TaskPool.Task("Task {}".format(index), Succeed) for index in six.moves.range(5) ],
+                                               sink,
+                                               verbose=True,
+                                               executor=executor,
+                                             ), 0)
+
+            sink = sink.getvalue()
+
+            for index in six.moves.range(5):
+                self.assertTrue("Output from {} (".format(index) in sink, executor)
+
+    # ----------------------------------------------------------------------
+    def test_Failure(self):
+        for executor in TaskPool.EXECUTORS:
+            sink = six.moves.StringIO()
+
+            self.assertEqual(TaskPool.Execute( [ TaskPool.Task("Task {}".format(index), Fail) for index in six.moves.range(3) ],
+                                               sink,
+                                               executor=executor,
+                                             ), 1)
+
+            sink = sink.getvalue()
+
+            self.assertTrue("Failure from 0" not in sink, executor)
+            self.assertTrue("Failure from 1" in sink, executor)
+            self.assertTrue("Failure from 2" in sink, executor)
+
+    # ----------------------------------------------------------------------
+    def test_Exception(self):
+        for executor in TaskPool.EXECUTORS:
+            sink = six.moves.StringIO()
+
+            self.assertEqual(TaskPool.Execute( [ TaskPool.Task("Task", Raise), ],
+                                               sink,
+                                               display_exception_callstack=False,
+                                               executor=executor,
+                                             ), -1)
+
+            self.assertTrue("Raised" in sink.getvalue(), executor)
+
+# ----------------------------------------------------------------------
+class DependenciesSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def test_Order(self):
+        events = []
+        events_lock = threading.Lock()
+
+        # ----------------------------------------------------------------------
+        def Create(name, delay):
+            # ----------------------------------------------------------------------
+            def Func():
+                with events_lock:
+                    events.append("{} start".format(name))
+
+                time.sleep(delay)
+
+                with events_lock:
+                    events.append("{} stop".format(name))
+
+            # ----------------------------------------------------------------------
+
+            return Func
+
+        # ----------------------------------------------------------------------
+
+        build_a = TaskPool.Task("Build A", Create("Build A", 0.5))
+        build_b = TaskPool.Task("Build B", Create("Build B", 0.1))
+        test_a = TaskPool.Task("Test A", Create("Test A", 0), dependencies=[ build_a, ])
+        test_b = TaskPool.Task("Test B", Create("Test B", 0), dependencies=[ build_b, ])
+        report = TaskPool.Task("Report", Create("Report", 0), dependencies=[ test_a, test_b, ])
+
+        self.assertEqual(TaskPool.Execute([ report, test_b, test_a, build_b, build_a, ], None), 0)
+
+        # Test B should not wait for Build A to complete
+        self.assertLess(events.index("Test B stop"), events.index("Build A stop"))
+
+        self.assertLess(events.index("Build A stop"), events.index("Test A start"))
+        self.assertLess(events.index("Build B stop"), events.index("Test B start"))
+        self.assertLess(events.index("Test A stop"), events.index("Report start"))
+        self.assertLess(events.index("Test B stop"), events.index("Report start"))
+
+    # ----------------------------------------------------------------------
+    def test_Cancel(self):
+        executed = []
+
+        build_a = TaskPool.Task("Build A", lambda: (1, "Build A failed\n"))
+        build_b = TaskPool.Task("Build B", lambda: executed.append("Build B"))
+        test_a = TaskPool.Task("Test A", lambda: executed.append("Test A"), dependencies=[ build_a, ])
+        test_b = TaskPool.Task("Test B", lambda: executed.append("Test B"), dependencies=[ build_b, ])
+        report = TaskPool.Task("Report", lambda: executed.append("Report"), dependencies=[ test_a, test_b, ])
+
+        sink = six.moves.StringIO()
+
+        self.assertEqual(TaskPool.Execute([ build_a, build_b, test_a, test_b, report, ], sink), 1)
+        self.assertEqual(sorted(executed), [ "Build B", "Test B", ])
+
+        sink = sink.getvalue()
+
+        self.assertTrue("Build A failed" in sink)
+        self.assertTrue("cancelled because the task 'Build A'" in sink)
+
+    # ----------------------------------------------------------------------
+    def test_Errors(self):
+        task_a = TaskPool.Task("A", lambda: None)
+        task_b = TaskPool.Task("B", lambda: None, dependencies=[ task_a, ])
+
+        self.assertRaises(Exception, lambda: TaskPool.Execute([ task_b, ], None))
+
+        task_a.Dependencies.append(task_b)
+
+        self.assertRaises(Exception, lambda: TaskPool.Execute([ task_a, task_b, ], None))
+
+# ----------------------------------------------------------------------
+class TransformSuite(unittest.TestCase):
+
+    # ----------------------------------------------------------------------
+    def test_Standard(self):
+        for executor in TaskPool.EXECUTORS:
+            self.assertEqual(TaskPool.Transform(list(six.moves.range(10)), Square, None, executor=executor), [ index * index for index in six.moves.range(10) ])
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try: sys.exit(unittest.main(verbosity=2))
+    except KeyboardInterrupt: pass
@@ -14,10 +14,16 @@
 # ----------------------------------------------------------------------
 """Verifies Python source code using PyLint"""
 
+import hashlib
+import json
+import multiprocessing
 import os
 import re
+import sqlite3
 import sys
 import textwrap
+import threading
+import zlib
 
 import inflect as inflect_mod
 import six
@@ -27,9 +33,11 @@ from CommonEnvironment.CallOnExit import CallOnExit
 from CommonEnvironment import CommandLine
 from CommonEnvironment import FileSystem
 from CommonEnvironment.Interface import staticderived
+from CommonEnvironment import PersistedData
 from CommonEnvironment import Process
 from CommonEnvironment.Shell.All import CurrentShell
 from CommonEnvironment.StreamDecorator import StreamDecorator
+from CommonEnvironment import TaskPool
 
 from CommonEnvironment.CompilerImpl import Verifier as VerifierMod
 from CommonEnvironment.TypeInfo.FundamentalTypes.FilenameTypeInfo import FilenameTypeInfo
@@ -39,6 +47,11 @@ _script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower
 _script_dir, _script_name = os.path.split(_script_fullpath)
 # ----------------------------------------------------------------------
 
+sys.path.insert(0, _script_dir)
+with CallOnExit(lambda: sys.path.pop(0)):
+    import PythonVerifierImpl
+
+# ----------------------------------------------------------------------
 inflect                                     = inflect_mod.engine()
 
 # ----------------------------------------------------------------------
@@ -65,6 +78,14 @@ class Verifier(VerifierMod.Verifier):
     # configuration file will be used if this environment variable isn't defined.
     CONFIGURATION_ENVIRONMENT_VAR_NAME      = "DEVELOPMENT_ENVIRONMENT_PYTHON_VERIFIER_CONFIGURATION"
 
+    # Maximum number of processes used when verifying multiple files at once; None
+    # corresponds to the number of cores.
+    MAX_NUM_BATCH_PROCESSES                 = None
+
+    # Output generated by VerifyBatch for files that have not been verified yet
+    _lint_outputs                           = {}
+    _lint_outputs_lock                      = threading.Lock()
+
     # ----------------------------------------------------------------------
     # |  
     # |  Public Methods
@@ -103,6 +124,35 @@ class Verifier(VerifierMod.Verifier):
 
         return os.path.join(dirname, name)
 
+    # ----------------------------------------------------------------------
+    @classmethod
+    def VerifyBatch(cls, contexts, status_stream, verbose=False):
+        # Lint all of the files up front with a small number of processes; the
+        # output for each file is used when the file's context is verified.
+        filenames = []
+
+        for context in contexts:
+            filename = cls._GetFilename(context)
+            if filename is not None and filename not in filenames:
+                filenames.append(filename)
+
+        if len(filenames) > 1:
+            status_stream = StreamDecorator(status_stream)
+
+            status_stream.write("Linting {}...".format(inflect.no("file", len(filenames))))
+            with status_stream.DoneManager():
+                lint_outputs = cls._Lint(filenames)
+
+            with cls._lint_outputs_lock:
+                cls._lint_outputs.update(lint_outputs)
+
+        try:
+            return super(Verifier, cls).VerifyBatch(contexts, status_stream, verbose)
+        finally:
+            with cls._lint_outputs_lock:
+                for filename in filenames:
+                    cls._lint_outputs.pop(filename, None)
+
     # ----------------------------------------------------------------------
     # |  
     # |  Private Methods
@@ -133,6 +183,69 @@ class Verifier(VerifierMod.Verifier):
                      verbose_stream,
                      verbose,
                    ):
+        filename = cls._GetFilename(context)
+        if filename is None:
+            return 0
+
+        with cls._lint_outputs_lock:
+            lint_output = cls._lint_outputs.pop(filename, None)
+
+        if lint_output is None:
+            lint_output = cls._Lint([ filename, ])[filename]
+
+        sink = six.moves.StringIO()
+        output_stream = StreamDecorator([ sink, verbose_stream, ])
+
+        output_stream.write(lint_output)
+        regex_sink = lint_output
+
+        result = 0
+
+        # Extract the results
+        match = re.search( r"Your code has been rated at (?P<score>[-\d\.]+)/(?P<max>[\d\.]+)", 
+                           regex_sink,
+                           re.MULTILINE,
+                         )
+
+        if not match:
+            result = -1
+        else:
+            score = float(match.group("score"))
+            max_score = float(match.group("max"))
+            assert max_score != 0.0
+
+            # Don't measure scores for files in Impl directories
+            is_impl_file = os.path.basename(filename).endswith("Impl")
+
+            if is_impl_file and not context["explicit_passing_score"]:
+                passing_score = None
+            else:
+                passing_score = context["passing_score"]
+
+            output_stream.write(textwrap.dedent(
+                """\
+                Score:                  {score} (out of {max_score})
+                Passing Score:          {passing_score}{explicit}
+
+                """).format( score=score,
+                             max_score=max_score,
+                             passing_score=passing_score,
+                             explicit=" (explicitly provided)" if context["explicit_passing_score"] else '',
+                           ))
+
+            if passing_score is not None and score < passing_score:
+                result = -1
+
+        if result != 0 and not verbose:
+            status_stream.write(sink.getvalue())
+
+        return result
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _GetFilename(cls, context):
+        """Returns the filename to lint or None if the file shouldn't be linted."""
+
         # If the file is being invoked as a test file, measure the file under test
         # rather than the test itself.
         filename = context["input"]
@@ -145,90 +258,315 @@ class Verifier(VerifierMod.Verifier):
         assert os.path.isfile(filename), filename
 
         if os.path.basename(filename) == "__init__.py" and os.path.getsize(filename) == 0:
-            return 0
+            return None
+
+        return filename
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _Lint(cls, filenames):
+        """
+        Returns the PyLint output for each filename.
+
+        Output is replayed from the LintCache (when available) for files that have not
+        changed since they were last linted.
+        """
 
-        # Create the lint file
         configuration_file = os.getenv(cls.CONFIGURATION_ENVIRONMENT_VAR_NAME) or os.path.join(_script_dir, "PythonVerifier.default_configuration")
         assert os.path.isfile(configuration_file), configuration_file
 
-        # Write the python script that invokes the linter
-        temp_filename = CurrentShell.CreateTempFilename(".py")
-        with open(temp_filename, 'w') as f:
-            f.write(textwrap.dedent(
+        lint_cache = LintCache.Create()
+        if lint_cache is None:
+            return cls._LintImpl(configuration_file, filenames)[0]
+
+        with CallOnExit(lint_cache.Close):
+            hashes = FileSystem.CalculateHashes( [ configuration_file, ] + list(filenames),
+                                                 None,
+                                                 no_status=True,
+                                                 hash_digest_name="hexdigest",
+                                                 num_concurrent_tasks=None,
+                                               )
+
+            configuration_hash = hashes.pop(0)
+            file_hashes = dict(six.moves.zip(filenames, hashes))
+
+            results = lint_cache.Lookup( [ ( filename, file_hashes[filename] ) for filename in filenames ],
+                                         configuration_hash,
+                                       )
+
+            filenames = [ filename for filename in filenames if filename not in results ]
+            if filenames:
+                outputs, dependencies = cls._LintImpl(configuration_file, filenames)
+
+                results.update(outputs)
+
+                # Only files that were linted to completion have dependencies
+                lint_cache.Update( [ ( filename, file_hashes[filename], dependencies[filename], outputs[filename] ) for filename in filenames if filename in dependencies ],
+                                   configuration_hash,
+                                 )
+
+            return results
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _LintImpl(cls, configuration_file, filenames):
+        """
+        Returns the PyLint output for each filename and the first-party modules
+        imported (directly or indirectly) by each file that was linted.
+
+        Files are divided among a small number of processes. Each process lints its
+        files one at a time with a single linter, so the interpreter, the PyLint
+        configuration and checkers, and the astroid cache of imported modules are
+        shared by all of the files in a process while scores continue to be
+        calculated for each file.
+        """
+
+        num_processes = min(cls.MAX_NUM_BATCH_PROCESSES or multiprocessing.cpu_count(), len(filenames))
+
+        # Keep files that are near each other in the same process, as they are likely
+        # to import the same modules.
+        chunk_size = (len(filenames) + num_processes - 1) // num_processes
+        chunks = [ filenames[index:index + chunk_size] for index in six.moves.range(0, len(filenames), chunk_size) ]
+
+        results = {}
+        results_dependencies = {}
+        results_lock = threading.Lock()
+
+        # ----------------------------------------------------------------------
+        def Invoke(task_index):
+            chunk = chunks[task_index]
+
+            dependencies_filename = CurrentShell.CreateTempFilename(".json")
+
+            with CallOnExit(lambda: FileSystem.RemoveFile(dependencies_filename)):
+                _, output = Process.Execute('python "{script}" "{config}" "{dependencies}" {filenames}'.format( script=os.path.join(_script_dir, "PythonVerifierImpl.py"),
+                                                                                                               config=configuration_file,
+                                                                                                               dependencies=dependencies_filename,
+                                                                                                               filenames=' '.join([ '"{}"'.format(filename) for filename in chunk ]),
+                                                                                                             ))
+
+                # The dependencies file won't exist if the process terminated before all of the files were linted
+                if os.path.isfile(dependencies_filename):
+                    with open(dependencies_filename) as f:
+                        dependencies = json.load(f)
+                else:
+                    dependencies = {}
+
+            outputs = {}
+
+            matches = list(PythonVerifierImpl.LINT_OUTPUT_DELIMITER_REGEX.finditer(output))
+
+            for index, match in enumerate(matches):
+                outputs[match.group("filename")] = output[match.end():matches[index + 1].start() if index + 1 < len(matches) else len(output)]
+
+            with results_lock:
+                for filename in chunk:
+                    # Provide all of the output if the process terminated before the file was linted
+                    results[filename] = outputs.get(filename, output)
+
+                    if filename in outputs and filename in dependencies:
+                        results_dependencies[filename] = dependencies[filename]
+
+        # ----------------------------------------------------------------------
+
+        TaskPool.Execute( [ TaskPool.Task("Linting {}".format(index), Invoke) for index in six.moves.range(len(chunks)) ],
+                          None,
+                          raise_on_error=True,
+                          num_concurrent_tasks=len(chunks),
+                        )
+
+        return results, results_dependencies
+
+# ----------------------------------------------------------------------
+class LintCache(object):
+    """
+    Persisted PyLint output. Cached output is only used when the file, the PyLint
+    configuration file, the PyLint version, and every first-party module imported
+    by the file (directly or indirectly) are unchanged since the file was linted.
+
+    A single compressed entry is stored for each file in a SQLite database, which
+    may be updated by multiple processes at the same time.
+    """
+
+    ENVIRONMENT_VAR_NAME                    = "DEVELOPMENT_ENVIRONMENT_PYTHON_VERIFIER_CACHE"
+    DEFAULT_FILENAME                        = "Compiler.PythonVerifier.db"
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Create(cls):
+        """
+        Returns a LintCache stored in the file specified by the environment variable
+        or in the activated repository's Generated directory, or None if neither are
+        available or PyLint isn't installed.
+        """
+
+        try:
+            import pylint
+        except ImportError:
+            return None
+
+        filename = os.getenv(cls.ENVIRONMENT_VAR_NAME) or PersistedData.GetGeneratedFilename(cls.DEFAULT_FILENAME)
+        if not filename:
+            return None
+
+        return cls( filename,
+                    "{} (Python {}.{})".format(pylint.__version__, sys.version_info[0], sys.version_info[1]),
+                  )
+
+    # ----------------------------------------------------------------------
+    def __init__( self,
+                  filename,
+                  linter_version,
+                  timeout=60.0,             # seconds
+                ):
+        dirname = os.path.dirname(filename)
+        if dirname:
+            FileSystem.MakeDirs(dirname)
+
+        self.Filename                       = filename
+        self.LinterVersion                  = linter_version
+
+        self._lock                          = threading.Lock()
+        self._connection                    = sqlite3.connect( filename,
+                                                               timeout=timeout,
+                                                               check_same_thread=False,
+                                                             )
+
+        try:
+            # WAL journals allow readers to proceed while another process is writing; this
+            # isn't supported on all file systems, in which case the default journal is used.
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.DatabaseError:
+            pass
+
+        with self._connection:
+            self._connection.execute(
                 """\
-                import sys
+                CREATE TABLE IF NOT EXISTS LintResults (
+                    filename TEXT NOT NULL PRIMARY KEY,
+                    key TEXT NOT NULL,
+                    data BLOB NOT NULL
+                )
+                """)
 
-                from pylint import lint
+    # ----------------------------------------------------------------------
+    def __enter__(self):
+        return self
 
-                lint.Run([ r"--rcfile={config}",
-                           r"--msg-template={{path}}({{line}}): [{{msg_id}}] {{msg}}",
-                           r"{filename}",
-                         ])
-                """).format( config=configuration_file,
-                             filename=filename,
-                           ))
+    # ----------------------------------------------------------------------
+    def __exit__(self, *args):
+        self.Close()
 
-        with CallOnExit(lambda: FileSystem.RemoveFile(temp_filename)):
-            # Run the generated file
-            command_line = 'python "{}"'.format(temp_filename)
+    # ----------------------------------------------------------------------
+    def Close(self):
+        with self._lock:
+            self._connection.close()
 
-            sink = six.moves.StringIO()
-            output_stream = StreamDecorator([ sink, verbose_stream, ])
+    # ----------------------------------------------------------------------
+    def Lookup(self, items, configuration_hash):
+        """
+        Returns a dict of cached output for the ( filename, hash ) items whose output
+        is still valid; hash is the file's current hash value.
+        """
 
-            regex_sink = six.moves.StringIO()
-            Process.Execute(command_line, StreamDecorator([ regex_sink, output_stream, ]))
-            regex_sink = regex_sink.getvalue()
+        candidates = []
 
-            result = 0
+        with self._lock:
+            for filename, file_hash in items:
+                if file_hash is None:
+                    continue
 
-            # Extract the results
-            match = re.search( r"Your code has been rated at (?P<score>[-\d\.]+)/(?P<max>[\d\.]+)", 
-                               regex_sink,
-                               re.MULTILINE,
-                             )
+                row = self._connection.execute( "SELECT key, data FROM LintResults WHERE filename = ?",
+                                                ( self._NormalizeFilename(filename), ),
+                                              ).fetchone()
 
-            if not match:
-                result = -1
-            else:
-                score = float(match.group("score"))
-                max_score = float(match.group("max"))
-                assert max_score != 0.0
+                if row is None or row[0] != self._CreateKey(file_hash, configuration_hash):
+                    continue
 
-                # Don't measure scores for files in Impl directories
-                is_impl_file = os.path.basename(filename).endswith("Impl")
+                dependencies, output = json.loads(zlib.decompress(bytes(row[1])).decode("utf-8"))
 
-                if is_impl_file and not context["explicit_passing_score"]:
-                    passing_score = None
-                else:
-                    passing_score = context["passing_score"]
+                candidates.append(( filename, dependencies, output ))
+
+        dependency_hashes = self._CalculateHashes(set( dependency for _, dependencies, _ in candidates for dependency, _ in dependencies ))
+
+        results = {}
+
+        for filename, dependencies, output in candidates:
+            if all(dependency_hashes.get(dependency) == dependency_hash for dependency, dependency_hash in dependencies):
+                results[filename] = output
+
+        return results
+
+    # ----------------------------------------------------------------------
+    def Update(self, items, configuration_hash):
+        """
+        Updates the cache with ( filename, hash, dependencies, output ) items, where
+        hash is the file's hash value before it was linted and dependencies are the
+        first-party modules imported by the file.
+        """
+
+        dependency_hashes = self._CalculateHashes(set( dependency for _, _, dependencies, _ in items for dependency in dependencies ))
+
+        rows = []
+
+        for filename, file_hash, dependencies, output in items:
+            if file_hash is None or any(dependency_hashes.get(dependency) is None for dependency in dependencies):
+                continue
 
-                output_stream.write(textwrap.dedent(
-                    """\
-                    Score:                  {score} (out of {max_score})
-                    Passing Score:          {passing_score}{explicit}
+            data = json.dumps([ [ [ dependency, dependency_hashes[dependency] ] for dependency in dependencies ],
+                                output,
+                              ])
 
-                    """).format( score=score,
-                                 max_score=max_score,
-                                 passing_score=passing_score,
-                                 explicit=" (explicitly provided)" if context["explicit_passing_score"] else '',
-                               ))
+            rows.append(( self._NormalizeFilename(filename),
+                          self._CreateKey(file_hash, configuration_hash),
+                          sqlite3.Binary(zlib.compress(data.encode("utf-8"))),
+                        ))
 
-                if passing_score is not None and score < passing_score:
-                    result = -1
+        if not rows:
+            return
 
-            if result != 0 and not verbose:
-                status_stream.write(sink.getvalue())
+        with self._lock, self._connection:
+            self._connection.executemany("INSERT OR REPLACE INTO LintResults VALUES (?, ?, ?)", rows)
 
-            return result
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _CreateKey(self, file_hash, configuration_hash):
+        return hashlib.sha256("{}|{}|{}".format(file_hash, configuration_hash, self.LinterVersion).encode("utf-8")).hexdigest()
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CalculateHashes(filenames):
+        """Returns a dict of hash values for the filenames that exist."""
+
+        filenames = [ filename for filename in filenames if os.path.isfile(filename) ]
+        if not filenames:
+            return {}
+
+        return dict(six.moves.zip( filenames,
+                                   FileSystem.CalculateHashes( filenames,
+                                                               None,
+                                                               no_status=True,
+                                                               hash_digest_name="hexdigest",
+                                                               num_concurrent_tasks=None,
+                                                             ),
+                                 ))
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _NormalizeFilename(filename):
+        return os.path.normcase(os.path.realpath(filename))
 
 # ----------------------------------------------------------------------
 @CommandLine.EntryPoint
 @CommandLine.Constraints( input=CommandLine.FilenameTypeInfo(match_any=True, arity='+'),
                           passing_score=CommandLine.FloatTypeInfo(min=0.0, max=10.0, arity='?'),
+                          jobs=CommandLine.IntTypeInfo(min=1, arity='?'),
                           output_stream=None,
                         )
 def Verify( input,                          # <Redefinig built-in type> pylint: disable = W0622
             passing_score=None,
+            jobs=1,
             output_stream=sys.stdout,
             verbose=False,
           ):
@@ -240,6 +578,7 @@ def Verify( input,                          # <Redefinig built-in type> pylint:
                                           inputs,
                                           StreamDecorator(output_stream),
                                           verbose,
+                                          jobs=jobs,
                                           passing_score=passing_score,
                                         )
 
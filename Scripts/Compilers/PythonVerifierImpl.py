@@ -0,0 +1,200 @@
+# ----------------------------------------------------------------------
+# |  
+# |  PythonVerifierImpl.py
+# |  
+# |  David Brownell <db@DavidBrownell.com>
+# |      2018-06-20 09:14:27
+# |  
+# ----------------------------------------------------------------------
+# |  
+# |  Copyright David Brownell 2018.
+# |  Distributed under the Boost Software License, Version 1.0.
+# |  (See accompanying file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+# |  
+# ----------------------------------------------------------------------
+"""
+Lints python files in a single process on behalf of PythonVerifier.py.
+
+Usage: python PythonVerifierImpl.py <configuration_file> <dependencies_output_filename> <filename> [<filename> ...]
+
+The output of each file is preceded by a delimiter on stdout; the first-party modules
+imported by each file that was linted are written to the dependencies output file as json.
+"""
+
+import json
+import os
+import re
+import sys
+import sysconfig
+
+from contextlib import contextmanager
+
+# ----------------------------------------------------------------------
+_script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower() else sys.executable
+_script_dir, _script_name = os.path.split(_script_fullpath)
+# ----------------------------------------------------------------------
+
+# Written to the output before each file is linted
+LINT_OUTPUT_DELIMITER_TEMPLATE              = "----- PythonVerifier: {} -----"
+LINT_OUTPUT_DELIMITER_REGEX                 = re.compile(r"^----- PythonVerifier: (?P<filename>.+?) -----\n", re.MULTILINE)
+
+# Modules in these directories are part of the standard library or installed packages
+_third_party_dirs                           = set( os.path.normcase(os.path.realpath(dirname))
+                                                   for dirname in [ sysconfig.get_path(name) for name in [ "stdlib", "platstdlib", "purelib", "platlib", ] ]
+                                                   if dirname
+                                                 )
+
+_first_party_filenames                      = {}
+
+# ----------------------------------------------------------------------
+# |  
+# |  Public Methods
+# |  
+# ----------------------------------------------------------------------
+def Lint(configuration_file, filenames):
+    """
+    Lints each file, writing its output to stdout after a delimiter. Returns the
+    first-party modules imported by each file that was linted.
+
+    The configuration file is parsed and the checkers are created when the first file
+    is linted; the same linter is used for the remaining files. Statistics (and
+    therefore scores) are reset each time a file is checked.
+    """
+
+    from pylint import lint
+
+    # Older versions of PyLint add the file's directory (or package root) to sys.path
+    # within Run rather than within check; newer versions do so within check.
+    fix_import_path = getattr(lint, "fix_import_path", None) or _UnchangedImportPath
+
+    linter = None
+    dependencies = {}
+
+    for filename in filenames:
+        sys.stdout.write("{}\n".format(LINT_OUTPUT_DELIMITER_TEMPLATE.format(filename)))
+        sys.stdout.flush()
+
+        try:
+            if linter is None:
+                linter = lint.Run( [ "--rcfile={}".format(configuration_file),
+                                     "--msg-template={path}({line}): [{msg_id}] {msg}",
+                                     filename,
+                                   ],
+                                   exit=False,
+                                 ).linter
+            else:
+                with fix_import_path([ filename, ]):
+                    linter.check([ filename, ])
+                    linter.generate_reports()
+
+        except SystemExit:
+            pass
+
+        sys.stdout.flush()
+
+        try:
+            dependencies[filename] = GetDependencies(filename)
+        except Exception:
+            pass
+
+    return dependencies
+
+# ----------------------------------------------------------------------
+def GetDependencies(filename):
+    """Returns the first-party modules imported (directly or indirectly) by the file"""
+
+    from astroid import MANAGER, nodes
+
+    filename = os.path.realpath(filename)
+
+    dependencies = set([ filename, ])
+    pending = [ filename, ]
+
+    while pending:
+        try:
+            module = MANAGER.ast_from_file(pending.pop())
+        except Exception:
+            continue
+
+        modnames = []
+
+        for node in module.nodes_of_class(( nodes.Import, nodes.ImportFrom )):
+            if isinstance(node, nodes.Import):
+                modnames += [ name for name, _ in node.names ]
+                continue
+
+            try:
+                modname = module.relative_to_absolute_name(node.modname, node.level)
+            except Exception:
+                continue
+
+            # Imported names may be modules
+            modnames += [ modname, ] + [ "{}.{}".format(modname, name) for name, _ in node.names if name != "*" ]
+
+        for modname in modnames:
+            # Parent packages are imported as well
+            parts = modname.split(".")
+
+            for index in range(1, len(parts) + 1):
+                dependency = _GetFirstPartyFilename(".".join(parts[:index]), module.file)
+                if dependency is not None and dependency not in dependencies:
+                    dependencies.add(dependency)
+                    pending.append(dependency)
+
+    dependencies.remove(filename)
+    return sorted(dependencies)
+
+# ----------------------------------------------------------------------
+# |  
+# |  Private Methods
+# |  
+# ----------------------------------------------------------------------
+def _GetFirstPartyFilename(modname, context_filename):
+    """Returns the filename of the module or None if it isn't a first-party python module"""
+
+    key = ( modname, os.path.dirname(context_filename) )
+
+    if key not in _first_party_filenames:
+        from astroid import modutils
+
+        try:
+            filename = modutils.file_from_modpath(modname.split("."), context_file=context_filename)
+        except Exception:
+            filename = None
+
+        if filename and os.path.splitext(filename)[1] == ".py":
+            filename = os.path.realpath(filename)
+
+            normalized_filename = os.path.normcase(filename)
+            if any(normalized_filename.startswith(dirname + os.sep) for dirname in _third_party_dirs):
+                filename = None
+        else:
+            filename = None
+
+        _first_party_filenames[key] = filename
+
+    return _first_party_filenames[key]
+
+# ----------------------------------------------------------------------
+@contextmanager
+def _UnchangedImportPath(filenames):                                        # <Unused argument> pylint: disable = W0613
+    yield
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    try:
+        if len(sys.argv) < 4:
+            sys.stderr.write("{}\n".format(__doc__.strip()))
+            sys.exit(-1)
+
+        configuration_file, dependencies_filename = sys.argv[1:3]
+
+        dependencies = Lint(configuration_file, sys.argv[3:])
+
+        with open(dependencies_filename, 'w') as f:
+            json.dump(dependencies, f)
+
+    except KeyboardInterrupt:
+        pass
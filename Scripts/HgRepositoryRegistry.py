@@ -59,6 +59,9 @@ def EntryPoint( root_dir,
 
                 repositories.append(directory)
 
+        # Repositories are found in parallel, so the order isn't deterministic
+        repositories.sort()
+
         # Organize the repos
         dm.stream.write("Organizing...")
         with dm.stream.DoneManager():
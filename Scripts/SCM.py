@@ -14,13 +14,18 @@
 # ----------------------------------------------------------------------
 """Tools for use with SourceControlManagement systems"""
 
+import datetime
+import multiprocessing
 import os
 import re
 import sys
 import textwrap
 import threading
+import time
+import traceback
 
 from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 import inflect as inflect_mod
 import six
@@ -28,6 +33,7 @@ import six
 from CommonEnvironment import Describe
 from CommonEnvironment import CommandLine
 from CommonEnvironment import Interface
+from CommonEnvironment import Nonlocals
 from CommonEnvironment.StreamDecorator import StreamDecorator
 from CommonEnvironment import StringHelpers
 from CommonEnvironment.SourceControlManagement import SourceControlManagement, DistributedSourceControlManagement
@@ -35,7 +41,6 @@ from CommonEnvironment.SourceControlManagement.All import GetAnySCM, \
                                                           EnumSCMs, \
                                                           ALL_TYPES as ALL_SCM_TYPES
 from CommonEnvironment.SourceControlManagement import UpdateMergeArgs
-from CommonEnvironment import TaskPool
 
 # ----------------------------------------------------------------------
 _script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower() else sys.executable
@@ -44,9 +49,17 @@ _script_dir, _script_name = os.path.split(_script_fullpath)
 
 inflect                                     = inflect_mod.engine()
 
+StreamDecorator.InitAnsiSequenceStreams()
+
 # ----------------------------------------------------------------------
 _SCM_NAMES                                  = [ _scm.Name for _scm in ALL_SCM_TYPES ]
 
+# Maximum number of operations invoked at the same time by the '*All' methods. Operations
+# that communicate with remote repositories are limited separately so that the servers
+# aren't overwhelmed.
+_MAX_CONCURRENT_LOCAL_OPERATIONS            = multiprocessing.cpu_count() * 5
+_MAX_CONCURRENT_REMOTE_OPERATIONS           = 4
+
 # <Missing function docstring> pylint: disable = C0111
 
 # ----------------------------------------------------------------------
@@ -1029,14 +1042,18 @@ def PullAndUpdate( directory=None,
 # ----------------------------------------------------------------------
 @CommandLine.EntryPoint
 @CommandLine.Constraints( directory=CommandLine.DirectoryTypeInfo(),
+                          prune=CommandLine.StringTypeInfo(arity='*'),
                           output_stream=None,
                         )
 def AllChangeStatus( directory,
+                     prune=None,
                      output_stream=sys.stdout,
                      verbose=False,
                    ):
     """Detects local and untracked changes."""
 
+    prune_directory_names = prune or None; del prune
+
     changes = []
     changes_lock = threading.Lock()
 
@@ -1074,10 +1091,15 @@ def AllChangeStatus( directory,
                        directory,
                        output_stream,
                        verbose=verbose,
+                       prune_directory_names=prune_directory_names,
+                       is_remote_query=True,
                      )
     if result != 0:
         return result
 
+    # Repositories are processed in the order in which they are found, which isn't deterministic
+    changes = sorted([ change for change in changes if change is not None ], key=lambda change: change.Directory)
+
     if not changes:
         return 0
 
@@ -1106,9 +1128,6 @@ def AllChangeStatus( directory,
                    ))
 
     for change in changes:
-        if change is None:
-            continue
-
         output_stream.write("{}\n".format(template.format( change.Directory,
                                                            change.Scm.Name,
                                                            change.Status.branch,
@@ -1125,14 +1144,18 @@ def AllChangeStatus( directory,
 # ----------------------------------------------------------------------
 @CommandLine.EntryPoint
 @CommandLine.Constraints( directory=CommandLine.DirectoryTypeInfo(),
+                          prune=CommandLine.StringTypeInfo(arity='*'),
                           output_stream=None,
                         )
 def AllWorkingChangeStatus( directory,
+                            prune=None,
                             output_stream=sys.stdout,
                             verbose=False,
                           ):
     """Detects local and untracked changes."""
 
+    prune_directory_names = prune or None; del prune
+
     changed_repos = []
     changed_repos_lock = threading.Lock()
 
@@ -1157,11 +1180,12 @@ def AllWorkingChangeStatus( directory,
                        directory,
                        output_stream,
                        verbose=verbose,
+                       prune_directory_names=prune_directory_names,
                      )
     if result != 0:
         return result
 
-    changed_repos = [ cr for cr in changed_repos if cr ]
+    changed_repos = sorted([ cr for cr in changed_repos if cr ], key=lambda cr: cr[1])
 
     if changed_repos:
         output_stream.write(textwrap.dedent(
@@ -1179,14 +1203,18 @@ def AllWorkingChangeStatus( directory,
 # ----------------------------------------------------------------------
 @CommandLine.EntryPoint
 @CommandLine.Constraints( directory=CommandLine.DirectoryTypeInfo(),
+                          prune=CommandLine.StringTypeInfo(arity='*'),
                           output_stream=None,
                         )
 def PushAll( directory,
+             prune=None,
              output_stream=sys.stdout,
              verbose=False,
            ):
     """Pushes local changes for each repository found under the provided directory."""
 
+    prune_directory_names = prune or None; del prune
+
     return _WrapAll( "HasLocalChanges",
                      lambda directory, scm: scm.HasLocalChanges(directory),
                      "Push",
@@ -1194,20 +1222,27 @@ def PushAll( directory,
                      directory,
                      output_stream,
                      verbose=verbose,
+                     prune_directory_names=prune_directory_names,
                      requires_distributed=True,
+                     is_remote_query=True,
+                     is_remote_action=True,
                    )
 
 # ----------------------------------------------------------------------
 @CommandLine.EntryPoint
 @CommandLine.Constraints( directory=CommandLine.DirectoryTypeInfo(),
+                          prune=CommandLine.StringTypeInfo(arity='*'),
                           output_stream=None,
                         )
 def PullAll( directory,
+             prune=None,
              output_stream=sys.stdout,
              verbose=False,
            ):
     """Pulls remote changes from each repository found under the provided directory."""
 
+    prune_directory_names = prune or None; del prune
+
     return _WrapAll( "HasRemoteChanges",
                      lambda directory, scm: scm.HasRemoteChanges(directory),
                      "Pull",
@@ -1215,20 +1250,27 @@ def PullAll( directory,
                      directory,
                      output_stream,
                      verbose=verbose,
+                     prune_directory_names=prune_directory_names,
                      requires_distributed=True,
+                     is_remote_query=True,
+                     is_remote_action=True,
                    )
 
 # ----------------------------------------------------------------------
 @CommandLine.EntryPoint
 @CommandLine.Constraints( directory=CommandLine.DirectoryTypeInfo(),
+                          prune=CommandLine.StringTypeInfo(arity='*'),
                           output_stream=None,
                         )
 def UpdateAll( directory,
+               prune=None,
                output_stream=sys.stdout,
                verbose=False,
              ):
     """Updates the working directory for each repository found under the provided directory."""
 
+    prune_directory_names = prune or None; del prune
+
     return _WrapAll( "HasUpdateChanges",
                      lambda directory, scm: scm.HasUpdateChanges(directory),
                      "Update",
@@ -1236,20 +1278,25 @@ def UpdateAll( directory,
                      directory,
                      output_stream,
                      verbose=verbose,
+                     prune_directory_names=prune_directory_names,
                      requires_distributed=True,
                    )
 
 # ----------------------------------------------------------------------
 @CommandLine.EntryPoint
 @CommandLine.Constraints( directory=CommandLine.DirectoryTypeInfo(),
+                          prune=CommandLine.StringTypeInfo(arity='*'),
                           output_stream=None,
                         )
 def PullAndUpdateAll( directory,
+                      prune=None,
                       output_stream=sys.stdout,
                       verbose=False,
                     ):
     """Pulls remote changes and updates the working directory for each repository found under the provided directory."""
 
+    prune_directory_names = prune or None; del prune
+
     # ----------------------------------------------------------------------
     def Action(directory, scm):
         result, output = scm.Pull(directory)
@@ -1272,7 +1319,10 @@ def PullAndUpdateAll( directory,
                      directory,
                      output_stream,
                      verbose=verbose,
+                     prune_directory_names=prune_directory_names,
                      requires_distributed=True,
+                     is_remote_query=True,
+                     is_remote_action=True,
                    )
 
 # ----------------------------------------------------------------------
@@ -1335,89 +1385,178 @@ def _Wrap( method_name,
 
 # ----------------------------------------------------------------------
 def _WrapAll( query_method_name,
-              query_callback,               # def Func(directory, scm) -> Bool
+              query_callback,               # def Func(directory, scm, task_index) -> Bool
               optional_action_method_name,
-              optional_action_callback,     # def Func(directory, scm); only invoked if query_callback returns True
+              optional_action_callback,     # def Func(directory, scm, task_index); only invoked if query_callback returns True
               directory,
               output_stream,
               verbose=False,
               requires_distributed=False,
+              is_remote_query=False,        # True if query_callback communicates with remote repositories
+              is_remote_action=False,       # True if optional_action_callback communicates with remote repositories
+              prune_directory_names=None,   # Names of directories that aren't searched; defaults to DEFAULT_PRUNE_DIRECTORY_NAMES
             ):
     directory = directory or os.getcwd()
 
+    query_callback = Interface.CreateCulledCallable(query_callback)
+    optional_action_callback = Interface.CreateCulledCallable(optional_action_callback) if optional_action_callback else None
+
+    # ----------------------------------------------------------------------
+    class Repository(object):
+        def __init__(self, scm, directory):
+            self.Scm                        = scm
+            self.Directory                  = directory
+
+            self.Output                     = six.moves.StringIO()
+            self.Result                     = 0
+            self.StartTime                  = time.time()
+            self.TimeDeltaString            = None
+
+            self.QueryFuture                = None
+            self.ActionFuture               = None
+
+    # ----------------------------------------------------------------------
+
     with StreamDecorator(output_stream).DoneManager( line_prefix='',
                                                      prefix="\nResults: ",
                                                      suffix='\n',
                                                    ) as dm:
-        # Get the repositories
         repositories = []
 
-        dm.stream.write("Searching for repositories in '{}'...".format(directory))
-        with dm.stream.DoneManager( done_suffix=lambda: "{} found".format(inflect.no("repository", len(repositories))),
-                                  ):
-            repositories += EnumSCMs(directory)
+        nonlocals = Nonlocals(num_complete=0)
+        nonlocals_lock = threading.Lock()
+
+        with dm.stream.SingleLineDoneManager( "Processing repositories in '{}'...".format(directory),
+                                              done_suffix=lambda: "{} found".format(inflect.no("repository", len(repositories))),
+                                            ) as this_dm:
+            # ----------------------------------------------------------------------
+            def UpdateStatus():
+                with nonlocals_lock:
+                    this_dm.stream.write_status("{} found, {} complete".format(len(repositories), nonlocals.num_complete))
+
+            # ----------------------------------------------------------------------
+            def Invoke(method_name, callback, task_index):
+                repository = repositories[task_index]
+
+                results = []
 
-            if requires_distributed:
-                repositories = [ repo for repo in repositories if repo[0].IsDistributed ]
+                # ----------------------------------------------------------------------
+                def Callback(directory, scm):
+                    results.append(callback(OrderedDict([ ( "directory", directory ),
+                                                          ( "scm", scm ),
+                                                          ( "task_index", task_index ),
+                                                        ])))
 
-        if not repositories:
-            return dm.result
+                    return results[0]
 
-        # Invoke the functionality
-        query_callback = Interface.CreateCulledCallable(query_callback)
-        optional_action_callback = Interface.CreateCulledCallable(optional_action_callback) if optional_action_callback else None
+                # ----------------------------------------------------------------------
+
+                _Wrap( method_name,
+                       Callback,
+                       repository.Directory,
+                       repository.Scm,
+                       repository.Output,
+                     )
+
+                return results[0]
 
-        with dm.stream.SingleLineDoneManager("Running...") as this_dm:
             # ----------------------------------------------------------------------
-            def Impl(task_index, output_stream, on_status_update):
-                scm, directory = repositories[task_index]
-            
-                on_status_update(query_method_name)
-                
-                result = _Wrap( query_method_name,
-                                lambda directory, scm: query_callback(OrderedDict([ ( "directory", directory ),
-                                                                                    ( "scm", scm ),
-                                                                                    ( "task_index", task_index ),
-                                                                                  ])),
-                                directory,
-                                scm,
-                                output_stream,
-                              )
-                if not result:
-                    return 0
-            
-                on_status_update(optional_action_method_name)
-            
-                if optional_action_callback:
-                    result = _Wrap( optional_action_method_name,
-                                    lambda directory, scm: optional_action_callback(OrderedDict([ ( "directory", directory ),
-                                                                                                  ( "scm", scm ),
-                                                                                                  ( "task_index", task_index ),
-                                                                                                ])),
-                                    directory,
-                                    scm,
-                                    output_stream,
-                                  )
-            
-                    if result != 0:
-                        return result
-                
-                return 0
-            
+            def OnComplete(repository):
+                repository.TimeDeltaString = str(datetime.timedelta(seconds=(time.time() - repository.StartTime)))
+
+                with nonlocals_lock:
+                    nonlocals.num_complete += 1
+
+                UpdateStatus()
+
+            # ----------------------------------------------------------------------
+            def Query(task_index):
+                repository = repositories[task_index]
+
+                try:
+                    if Invoke(query_method_name, query_callback, task_index) and optional_action_callback:
+                        repository.ActionFuture = action_executor.submit(Action, task_index)
+                        return
+
+                except:
+                    repository.Result = -1
+                    repository.Output.write(traceback.format_exc())
+
+                OnComplete(repository)
+
             # ----------------------------------------------------------------------
-            
-            this_dm.result = TaskPool.Execute( [ TaskPool.Task( repository[1],
-                                                                Impl,
-                                                              )
-                                                 for repository in repositories
-                                               ],
-                                               this_dm.stream,
-                                               verbose=verbose,
-                                               progress_bar=True,
-                                             )
+            def Action(task_index):
+                repository = repositories[task_index]
+
+                try:
+                    result = Invoke(optional_action_method_name, optional_action_callback, task_index)
+
+                    if isinstance(result, tuple):
+                        result = result[0]
+
+                    repository.Result = result if isinstance(result, int) else 0
+
+                except:
+                    repository.Result = -1
+                    repository.Output.write(traceback.format_exc())
+
+                OnComplete(repository)
+
+            # ----------------------------------------------------------------------
+
+            with ThreadPoolExecutor(_MAX_CONCURRENT_LOCAL_OPERATIONS) as local_executor, \
+                 ThreadPoolExecutor(_MAX_CONCURRENT_REMOTE_OPERATIONS) as remote_executor:
+                query_executor = remote_executor if is_remote_query else local_executor
+                action_executor = remote_executor if is_remote_action else local_executor
+
+                # Repositories are processed as soon as they are found
+                for scm, repo_directory in EnumSCMs(directory, prune_directory_names=prune_directory_names):
+                    if requires_distributed and not scm.IsDistributed:
+                        continue
+
+                    with nonlocals_lock:
+                        task_index = len(repositories)
+                        repositories.append(Repository(scm, repo_directory))
+
+                    repositories[task_index].QueryFuture = query_executor.submit(Query, task_index)
+
+                    UpdateStatus()
+
+                # Actions are submitted before the corresponding query completes
+                for repository in repositories:
+                    repository.QueryFuture.result()
+
+                    if repository.ActionFuture is not None:
+                        repository.ActionFuture.result()
+
+            # Display the results
+            for repository in sorted(repositories, key=lambda repository: repository.Directory):
+                if repository.Result == 0 and not verbose:
+                    continue
+
+                content = textwrap.dedent(
+                    """\
+                    # ----------------------------------------------------------------------
+                    # |  
+                    # |  {name} ({result}, {time})
+                    # |  
+                    # ----------------------------------------------------------------------
+                    {output}
+                    """).format( name=repository.Directory,
+                                 result=repository.Result,
+                                 time=repository.TimeDeltaString,
+                                 output=repository.Output.getvalue(),
+                               )
+
+                if repository.Result != 0:
+                    this_dm.stream.write_error(content)
+                else:
+                    this_dm.stream.write_verbose(content)
+
+            this_dm.result = next((repository.Result for repository in repositories if repository.Result != 0), 0)
 
         return dm.result
-              
+
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
@@ -22,6 +22,7 @@ import textwrap
 import time
 
 from collections import OrderedDict
+from contextlib import contextmanager
 from xml.etree import ElementTree as ET
 
 from CommonEnvironment.CallOnExit import CallOnExit
@@ -41,6 +42,12 @@ sys.path.insert(0, _script_dir)
 with CallOnExit(lambda: sys.path.pop(0)):
     from StandardTestExecutor import TestExecutor as StandardTestExecutor
 
+# ----------------------------------------------------------------------
+_COVERAGE_FILE_ENV_VAR_NAME                 = "COVERAGE_FILE"
+
+_DATA_FILENAME                              = ".coverage"
+_COMBINED_XML_FILENAME                      = "CombinedCoverage.xml"
+
 # ----------------------------------------------------------------------
 @staticderived
 class TestExecutor(TestExecutorImpl):
@@ -65,8 +72,23 @@ class TestExecutor(TestExecutorImpl):
     Note that if no values are extracted from the source, the code will make
     A best-guess to find the production code when the executed filename ends
     with _*Test.py
+
+    Each test writes coverage data to its own directory, so multiple tests can be
+    executed at the same time.
     """
 
+    # ----------------------------------------------------------------------
+    # |  Public Types
+    class ExecuteResult(TestExecutorImpl.ExecuteResult):
+        """ExecuteResult that contains the coverage data used when creating a combined report"""
+
+        def __init__(self, *args, **kwargs):
+            coverage_data = kwargs.pop("coverage_data", None)
+
+            super(TestExecutor.ExecuteResult, self).__init__(*args, **kwargs)
+
+            self.CoverageData               = coverage_data
+
     # ----------------------------------------------------------------------
     # |  Public Properties
     Name                                    = "PyCoverage"
@@ -79,6 +101,11 @@ class TestExecutor(TestExecutorImpl):
         # Supports any compiler that supports python; use this file as a test subject.
         return compiler.IsSupported(_script_fullpath if os.path.splitext(_script_name)[1] == ".py" else "{}.py".format(os.path.splitext(_script_fullpath)[0]))
 
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def IsParallelExecutionSupported():
+        return True
+
     # ----------------------------------------------------------------------
     @classmethod
     def Execute( cls,
@@ -179,44 +206,42 @@ class TestExecutor(TestExecutorImpl):
 
             includes.append("*/{}".format('/'.join(stack)))
         
-        # Run the process and calculate code coverage
-        temp_filename = CurrentShell.CreateTempFilename(".py")
+        # Run the process and calculate code coverage. Coverage data is written to a directory
+        # dedicated to this execution, so that it isn't overwritten by tests running in parallel.
+        # The directory is removed once the data has been read.
+        temp_dir = CurrentShell.CreateTempDirectory()
 
-        with open(temp_filename, 'w') as f:
-            f.write(textwrap.dedent(
-                """\
-                from coverage.cmdline import main
+        with CallOnExit(lambda: FileSystem.RemoveTree(temp_dir)):
+            environment = dict(os.environ)
+            environment[_COVERAGE_FILE_ENV_VAR_NAME] = os.path.join(temp_dir, _DATA_FILENAME)
 
-                main()
-                """))
+            with _CreateCoverageCommandLineTemplate() as command_line_template:
+                # Run the process
+                start_time = time.time()
 
-        with CallOnExit(lambda: FileSystem.RemoveFile(temp_filename)):
-            command_line_template = 'python "{}" "{{}}"'.format(temp_filename)
+                command_line = '{} --parallel-mode {} {} {}'.format( command_line_template.format("run"),
+                                                                     '"--include={}"'.format(','.join(includes)) if includes else '',
+                                                                     '"--omit={}"'.format(','.join(excludes)) if excludes else '',
+                                                                     filename,
+                                                                   )
 
-            # Run the process
-            start_time = time.time()
+                test_result, test_output = Process.Execute(command_line, environment=environment)
+                test_time = str(datetime.timedelta(seconds=(time.time() - start_time)))
 
-            command_line = '{} {} {} {}'.format( command_line_template.format("run"),
-                                                 '"--include={}"'.format(','.join(includes)) if includes else '',
-                                                 '"--omit={}"'.format(','.join(excludes)) if excludes else '',
-                                                 filename,
-                                               )
+                # Get the coverage info
+                start_time = time.time()
 
-            test_result, test_output = Process.Execute(command_line)
-            test_time = str(datetime.timedelta(seconds=(time.time() - start_time)))
+                coverage_data_filename = CurrentShell.CreateTempFilename(".xml")
 
-            # Get the coverage info
-            start_time = time.time()
+                coverage_result, coverage_output = _CreateXmlReport(command_line_template, environment, coverage_data_filename)
+                coverage_time = str(datetime.timedelta(seconds=(time.time() - start_time)))
 
-            xml_temp_filename = CurrentShell.CreateTempFilename(".xml")
+            # Retain the combined data for CreateCombinedReport
+            coverage_data = None
 
-            command_line = '{} -o "{}"'.format( command_line_template.format("xml"),
-                                                xml_temp_filename,
-                                              )
-
-            coverage_result, coverage_output = Process.Execute(command_line)
-            coverage_time = str(datetime.timedelta(seconds=(time.time() - start_time)))
-            coverage_data_filename = xml_temp_filename
+            if coverage_result == 0 and os.path.isfile(environment[_COVERAGE_FILE_ENV_VAR_NAME]):
+                with open(environment[_COVERAGE_FILE_ENV_VAR_NAME], 'rb') as f:
+                    coverage_data = f.read()
 
         # Get the percentage info
         if not os.path.isfile(coverage_data_filename):
@@ -248,4 +273,71 @@ class TestExecutor(TestExecutorImpl):
                                   coverage_data_filename,
                                   percentage,
                                   percentages,
+                                  coverage_data=coverage_data,
                                 )
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def CreateCombinedReport(execute_results, output_dir):
+        coverage_data_items = [ execute_result.CoverageData for execute_result in execute_results if getattr(execute_result, "CoverageData", None) ]
+        if not coverage_data_items:
+            return None
+
+        temp_dir = CurrentShell.CreateTempDirectory()
+
+        with CallOnExit(lambda: FileSystem.RemoveTree(temp_dir)):
+            for index, coverage_data in enumerate(coverage_data_items):
+                with open(os.path.join(temp_dir, "{}.{}".format(_DATA_FILENAME, index)), 'wb') as f:
+                    f.write(coverage_data)
+
+            environment = dict(os.environ)
+            environment[_COVERAGE_FILE_ENV_VAR_NAME] = os.path.join(temp_dir, _DATA_FILENAME)
+
+            FileSystem.MakeDirs(output_dir)
+            xml_filename = os.path.join(output_dir, _COMBINED_XML_FILENAME)
+
+            with _CreateCoverageCommandLineTemplate() as command_line_template:
+                result, _ = _CreateXmlReport(command_line_template, environment, xml_filename)
+
+        if result != 0:
+            return None
+
+        return xml_filename
+
+# ----------------------------------------------------------------------
+# |  
+# |  Private Methods
+# |  
+# ----------------------------------------------------------------------
+@contextmanager
+def _CreateCoverageCommandLineTemplate():
+    """Yields a command line template that invokes coverage.py with the command name to be populated"""
+
+    temp_filename = CurrentShell.CreateTempFilename(".py")
+
+    with open(temp_filename, 'w') as f:
+        f.write(textwrap.dedent(
+            """\
+            from coverage.cmdline import main
+
+            main()
+            """))
+
+    with CallOnExit(lambda: FileSystem.RemoveFile(temp_filename)):
+        yield 'python "{}" "{{}}"'.format(temp_filename)
+
+# ----------------------------------------------------------------------
+def _CreateXmlReport(command_line_template, environment, xml_filename):
+    """Combines the parallel-mode data files associated with the environment's COVERAGE_FILE and writes an XML report"""
+
+    result, output = Process.Execute(command_line_template.format("combine"), environment=environment)
+    if result != 0:
+        return result, output
+
+    command_line = '{} -o "{}"'.format( command_line_template.format("xml"),
+                                        xml_filename,
+                                      )
+
+    result, xml_output = Process.Execute(command_line, environment=environment)
+
+    return result, output + xml_output
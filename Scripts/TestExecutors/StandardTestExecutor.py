@@ -14,11 +14,15 @@
 # ----------------------------------------------------------------------
 """Contains the TestExecutor object"""
 
+import atexit
 import datetime
 import os
+import re
 import sys
+import threading
 import time
 
+from CommonEnvironment.ForkServer import ForkServer
 from CommonEnvironment.Interface import staticderived
 from CommonEnvironment import Process
 from CommonEnvironment.TestExecutorImpl import TestExecutorImpl
@@ -28,6 +32,16 @@ _script_fullpath = os.path.abspath(__file__) if "python" in sys.executable.lower
 _script_dir, _script_name = os.path.split(_script_fullpath)
 # ----------------------------------------------------------------------
 
+# Set this environment variable to "1" to run python tests in processes forked from
+# a pre-warmed interpreter (see CommonEnvironment.ForkServer) rather than starting
+# a new interpreter for each test.
+FORK_SERVER_ENV_VAR_NAME                    = "DEVELOPMENT_ENVIRONMENT_TESTER_FORK_SERVER"
+
+_python_command_line_regex                  = re.compile(r'^python\s+"(?P<filename>[^"]+)"\s*$')
+
+_fork_server_lock                           = threading.Lock()
+_fork_server                                = None
+
 # ----------------------------------------------------------------------
 @staticderived
 class TestExecutor(TestExecutorImpl):
@@ -45,6 +59,11 @@ class TestExecutor(TestExecutorImpl):
         # Any compile is supported
         return True
 
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def IsParallelExecutionSupported():
+        return True
+
     # ----------------------------------------------------------------------
     @classmethod
     def Execute( cls,
@@ -57,9 +76,35 @@ class TestExecutor(TestExecutorImpl):
                ):
         start_time = time.time()
 
-        result, output = Process.Execute(command_line)
+        fork_server = _GetForkServer()
+        match = _python_command_line_regex.match(command_line) if fork_server else None
+
+        if match:
+            result, output = fork_server.Execute(match.group("filename"))
+        else:
+            result, output = Process.Execute(command_line)
 
         return cls.ExecuteResult( result,
                                   output,
                                   str(datetime.timedelta(seconds=(time.time() - start_time))),
                                 )
+
+# ----------------------------------------------------------------------
+# |  
+# |  Private Methods
+# |  
+# ----------------------------------------------------------------------
+def _GetForkServer():
+    """Returns the ForkServer shared by all tests, or False if it isn't enabled."""
+
+    global _fork_server
+
+    with _fork_server_lock:
+        if _fork_server is None:
+            if os.getenv(FORK_SERVER_ENV_VAR_NAME) == "1" and ForkServer.IsSupported():
+                _fork_server = ForkServer()
+                atexit.register(_fork_server.Close)
+            else:
+                _fork_server = False
+
+        return _fork_server
@@ -15,9 +15,11 @@
 """General purpose test executor."""
 
 import datetime
+import hashlib
 import multiprocessing
 import os
 import re
+import sqlite3
 import sys
 import tempfile
 import textwrap
@@ -28,12 +30,14 @@ from collections import OrderedDict, namedtuple
 
 import colorama
 import six
+import six.moves.cPickle as pickle
 import inflect as inflect_mod
 
 from CommonEnvironment import Nonlocals, ObjectStrImpl
 from CommonEnvironment.CallOnExit import CallOnExit
 from CommonEnvironment import CommandLine
 from CommonEnvironment import FileSystem
+from CommonEnvironment import PersistedData
 from CommonEnvironment.Shell.All import CurrentShell
 from CommonEnvironment import StringHelpers
 from CommonEnvironment.StreamDecorator import StreamDecorator
@@ -250,7 +254,8 @@ class Results(object):
         self.compile_time                   = None
 
         self.has_errors                     = False
-        
+        self.is_cached                      = False     # True if the results were retrieved from a TestResultCache rather than generated
+
         self.execute_results                = []        # TestExecutorImpl.ExecuteResult
         self.test_parse_results             = []        # TestParseResult
         self.coverage_validation_results    = []        # CoverageValidationResult
@@ -339,6 +344,13 @@ class Results(object):
                                ),
                   ]
 
+        if self.is_cached:
+            results.append("Result:                                         {} {}(cached){}\n".format( ResultToString(0),
+                                                                                                    colorama.Style.DIM,
+                                                                                                    colorama.Style.RESET_ALL,
+                                                                                                  ))
+            return ''.join(results)
+
         result_code = self.ResultCode()
         if result_code is None:
             return "Result:                                         {}\n".format(ResultToString(result_code))
@@ -442,13 +454,23 @@ class Results(object):
 
     # ----------------------------------------------------------------------
     def TotalTime(self):
-        dti = DurationTypeInfo()
-
         total_time = datetime.timedelta(seconds=0)
 
-        get_duration = lambda duration: StringSerialization.DeserializeItem(dti, duration) if duration is not None else datetime.timedelta(seconds=0)
+        for duration in self.Durations():
+            total_time += duration
 
-        total_time += get_duration(self.compile_time)
+        return StringSerialization.SerializeItem(DurationTypeInfo(), total_time)
+
+    # ----------------------------------------------------------------------
+    def Durations(self):
+        """
+        Returns ( <compile>, <execute>, <parse>, <coverage> ) timedeltas, where times
+        associated with multiple iterations are averaged.
+        """
+
+        dti = DurationTypeInfo()
+
+        get_duration = lambda duration: StringSerialization.DeserializeItem(dti, duration) if duration is not None else datetime.timedelta(seconds=0)
 
         # ----------------------------------------------------------------------
         def Average(items, attr_name):
@@ -468,12 +490,11 @@ class Results(object):
 
         # ----------------------------------------------------------------------
 
-        total_time += Average(self.execute_results, "TestTime")
-        total_time += Average(self.execute_results, "CoverageTime")
-        total_time += Average(self.test_parse_results, "Time")
-        total_time += Average(self.coverage_validation_results, "Time")
-
-        return StringSerialization.SerializeItem(dti, total_time)
+        return ( get_duration(self.compile_time),
+                 Average(self.execute_results, "TestTime"),
+                 Average(self.test_parse_results, "Time"),
+                 Average(self.execute_results, "CoverageTime") + Average(self.coverage_validation_results, "Time"),
+               )
 
 # ----------------------------------------------------------------------
 class CompleteResult(object):
@@ -552,6 +573,370 @@ class CompleteResult(object):
                                                                                          ).rstrip(),
                        )
 
+# ----------------------------------------------------------------------
+class TestResultCache(object):
+    """
+    Persisted information about tests that have passed. A test is identified by a key
+    based on the contents of the test file, the contents of the file that it tests (as
+    determined by the compiler's TestToItemName method), and the names and command line
+    flags of the compiler, test parser, test executor, and code coverage validator. A test
+    that has passed with the same key and build configuration doesn't need to be built or
+    executed again.
+
+    Note that changes to files imported by the file under test do not invalidate the
+    cached results; specify 'force' on the command line to execute all tests.
+    """
+
+    ENVIRONMENT_VAR_NAME                    = "DEVELOPMENT_ENVIRONMENT_TESTER_RESULT_CACHE"
+
+    _VERSION                                = 2
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Create( cls,
+                force=False,
+                plugin_flags=None,
+              ):
+        """Returns a TestResultCache if the environment variable has been set to a filename, or None if caching is disabled"""
+
+        filename = os.getenv(cls.ENVIRONMENT_VAR_NAME)
+        if not filename:
+            return None
+
+        return cls( filename,
+                    force=force,
+                    plugin_flags=plugin_flags,
+                  )
+
+    # ----------------------------------------------------------------------
+    def __init__( self,
+                  filename,
+                  force=False,              # Existing results are ignored (but updated) when True
+                  plugin_flags=None,        # [ compiler_flag, test_parser_flag, test_executor_flag, code_coverage_validator_flag ]; each is a dict or None
+                ):
+        self.Filename                       = filename
+        self.Force                          = force
+        self.PluginFlags                    = plugin_flags or []
+
+        self._lock                          = threading.Lock()
+        self._entries                       = self._Load(filename)
+        self._is_modified                   = False
+
+    # ----------------------------------------------------------------------
+    def CreateKeys( self,
+                    test_items,
+                    compiler,
+                    test_parser,
+                    optional_test_executor,
+                    optional_code_coverage_validator,
+                  ):
+        """Returns a key for each test item, or None for items whose results can't be cached"""
+
+        if not isinstance(compiler.InputTypeInfo, FilenameTypeInfo):
+            return [ None, ] * len(test_items)
+
+        item_filenames = []
+
+        for test_item in test_items:
+            try:
+                item_filename = compiler.TestToItemName(test_item)
+            except:                                                         # <No exception type(s) specified> pylint: disable = W0702
+                item_filename = None
+
+            if item_filename is not None and not os.path.isfile(item_filename):
+                item_filename = None
+
+            item_filenames.append(item_filename)
+
+        # Hash all of the files at once
+        filenames = list(test_items) + [ item_filename for item_filename in item_filenames if item_filename is not None ]
+
+        hashes = dict(six.moves.zip( filenames,
+                                     FileSystem.CalculateHashes( filenames,
+                                                                 None,
+                                                                 no_status=True,
+                                                                 hash_digest_name="hexdigest",
+                                                                 num_concurrent_tasks=None,
+                                                               ),
+                                   ))
+
+        plugin_names = [ compiler.Name,
+                         test_parser.Name,
+                         optional_test_executor.Name if optional_test_executor else '',
+                         optional_code_coverage_validator.Name if optional_code_coverage_validator else '',
+                       ]
+
+        # Flags are serialized in sorted order so that the key doesn't depend on the order
+        # in which they were provided on the command line.
+        plugin_names += [ ';'.join([ "{}={}".format(k, flags[k]) for k in sorted(six.iterkeys(flags or {})) ])
+                          for flags in self.PluginFlags
+                        ]
+
+        keys = []
+
+        for test_item, item_filename in six.moves.zip(test_items, item_filenames):
+            key = hashlib.sha256()
+
+            for value in [ hashes[test_item],
+                           hashes[item_filename] if item_filename is not None else '',
+                           ] + plugin_names:
+                key.update(value.encode("utf-8"))
+                key.update(b"\0")
+
+            keys.append(key.hexdigest())
+
+        return keys
+
+    # ----------------------------------------------------------------------
+    def IsPassing(self, key, configuration):
+        if self.Force:
+            return False
+
+        with self._lock:
+            return ( key, configuration ) in self._entries
+
+    # ----------------------------------------------------------------------
+    def SetPassing(self, key, configuration):
+        with self._lock:
+            self._entries[( key, configuration )] = time.time()
+            self._is_modified = True
+
+    # ----------------------------------------------------------------------
+    def Save(self):
+        """Persists the cache if it has been modified."""
+
+        with self._lock:
+            if not self._is_modified:
+                return
+
+            # Merge with results written by other processes since the cache was loaded
+            entries = self._Load(self.Filename)
+            entries.update(self._entries)
+
+            PersistedData.SavePickle(self.Filename, ( self._VERSION, entries ))
+
+            self._entries = entries
+            self._is_modified = False
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _Load(cls, filename):
+        if os.path.isfile(filename):
+            try:
+                with open(filename, 'rb') as f:
+                    version, entries = pickle.load(f)
+
+                if version == cls._VERSION:
+                    return entries
+
+            except Exception:
+                # The cache will be rebuilt
+                pass
+
+        return {}
+
+# ----------------------------------------------------------------------
+class TestTimingDatabase(object):
+    """
+    Persisted durations of previous test runs. When tests are executed in parallel,
+    those that are expected to take the longest are started first so that a slow
+    test started last doesn't determine the overall execution time.
+
+    Durations are associated with the test, its build configuration, and the names
+    of the compiler and test executor. The data is stored in a SQLite database,
+    which may be updated by multiple processes at the same time.
+    """
+
+    ENVIRONMENT_VAR_NAME                    = "DEVELOPMENT_ENVIRONMENT_TESTER_TIMING_DATABASE"
+    DEFAULT_FILENAME                        = "TesterTimings.db"
+
+    # The expected duration of a test is the average of its most recent runs
+    NUM_EXPECTED_DURATION_RUNS              = 5
+
+    # Older runs are removed from the database
+    MAX_NUM_RUNS                            = 50
+
+    _TOTAL_TIME_EXPRESSION                  = "compile_time + execute_time + parse_time + coverage_time"
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Create(cls):
+        """
+        Returns a TestTimingDatabase stored in the file specified by the environment variable
+        or in the activated repository's Generated directory, or None if neither are available.
+        """
+
+        filename = os.getenv(cls.ENVIRONMENT_VAR_NAME) or PersistedData.GetGeneratedFilename(cls.DEFAULT_FILENAME)
+        if not filename:
+            return None
+
+        return cls(filename)
+
+    # ----------------------------------------------------------------------
+    def __init__( self,
+                  filename,
+                  timeout=60.0,             # seconds
+                ):
+        dirname = os.path.dirname(filename)
+        if dirname:
+            FileSystem.MakeDirs(dirname)
+
+        self.Filename                       = filename
+
+        self._lock                          = threading.Lock()
+        self._connection                    = sqlite3.connect( filename,
+                                                               timeout=timeout,
+                                                               check_same_thread=False,
+                                                             )
+
+        try:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.DatabaseError:
+            pass
+
+        with self._connection:
+            self._connection.execute(
+                """\
+                CREATE TABLE IF NOT EXISTS Timings (
+                    test TEXT NOT NULL,
+                    configuration TEXT NOT NULL,
+                    plugins TEXT NOT NULL,
+                    timestamp REAL NOT NULL,
+                    result INTEGER,
+                    compile_time REAL NOT NULL,
+                    execute_time REAL NOT NULL,
+                    parse_time REAL NOT NULL,
+                    coverage_time REAL NOT NULL
+                )
+                """)
+
+            self._connection.execute("CREATE INDEX IF NOT EXISTS TimingsIndex ON Timings (test, configuration, plugins, timestamp)")
+
+    # ----------------------------------------------------------------------
+    def __enter__(self):
+        return self
+
+    # ----------------------------------------------------------------------
+    def __exit__(self, *args):
+        self.Close()
+
+    # ----------------------------------------------------------------------
+    def Close(self):
+        with self._lock:
+            self._connection.close()
+
+    # ----------------------------------------------------------------------
+    def GetExpectedDurations(self, test_items, compiler, optional_test_executor):
+        """Returns { <test_item>: { <configuration>: <seconds>, ... }, ... } for tests that have been run before"""
+
+        plugins = self._GetPlugins(compiler, optional_test_executor)
+
+        results = {}
+
+        with self._lock:
+            for test_item in test_items:
+                durations = {}
+
+                for configuration, total_time in self._connection.execute( "SELECT configuration, {} FROM Timings WHERE test = ? AND plugins = ? ORDER BY timestamp DESC".format(self._TOTAL_TIME_EXPRESSION),
+                                                                           ( self._NormalizeTestItem(test_item), plugins ),
+                                                                         ):
+                    configuration_durations = durations.setdefault(configuration, [])
+                    if len(configuration_durations) < self.NUM_EXPECTED_DURATION_RUNS:
+                        configuration_durations.append(total_time)
+
+                if durations:
+                    results[test_item] = { configuration : sum(values) / len(values) for configuration, values in six.iteritems(durations) }
+
+        return results
+
+    # ----------------------------------------------------------------------
+    def Update(self, complete_results, compiler, optional_test_executor):
+        """Records the durations of tests that were built and executed"""
+
+        plugins = self._GetPlugins(compiler, optional_test_executor)
+        timestamp = time.time()
+
+        rows = []
+
+        for complete_result in complete_results:
+            for results, configuration in [ ( complete_result.debug, "Debug" ),
+                                            ( complete_result.release, "Release" ),
+                                          ]:
+                if results.is_cached or results.compiler_context is None or results.compile_result is None:
+                    continue
+
+                rows.append(tuple([ self._NormalizeTestItem(complete_result.Item),
+                                    configuration,
+                                    plugins,
+                                    timestamp,
+                                    results.ResultCode(),
+                                  ] + [ duration.total_seconds() for duration in results.Durations() ]))
+
+        if not rows:
+            return
+
+        with self._lock, self._connection:
+            self._connection.executemany("INSERT INTO Timings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+            self._connection.executemany(
+                """\
+                DELETE FROM Timings
+                WHERE test = ? AND configuration = ? AND plugins = ? AND timestamp NOT IN (
+                    SELECT timestamp FROM Timings WHERE test = ? AND configuration = ? AND plugins = ? ORDER BY timestamp DESC LIMIT ?
+                )
+                """,
+                [ row[:3] + row[:3] + ( self.MAX_NUM_RUNS, ) for row in rows ],
+            )
+
+    # ----------------------------------------------------------------------
+    def GetSlowestTests(self, num_tests, num_runs):
+        """
+        Returns [ ( <test>, <configuration>, <plugins>, [ <seconds>, ... ] ), ... ] for the tests
+        whose most recent runs took the longest; durations are ordered from oldest to newest.
+        """
+
+        with self._lock:
+            latest = self._connection.execute(
+                """\
+                SELECT test, configuration, plugins, {total} FROM Timings AS Latest
+                WHERE timestamp = (
+                    SELECT MAX(timestamp) FROM Timings AS Other
+                    WHERE Other.test = Latest.test AND Other.configuration = Latest.configuration AND Other.plugins = Latest.plugins
+                )
+                ORDER BY {total} DESC
+                LIMIT ?
+                """.format(total=self._TOTAL_TIME_EXPRESSION),
+                ( num_tests, ),
+            ).fetchall()
+
+            results = []
+
+            for test, configuration, plugins, _ in latest:
+                durations = [ row[0] for row in self._connection.execute( "SELECT {} FROM Timings WHERE test = ? AND configuration = ? AND plugins = ? ORDER BY timestamp DESC LIMIT ?".format(self._TOTAL_TIME_EXPRESSION),
+                                                                          ( test, configuration, plugins, num_runs ),
+                                                                        ) ]
+
+                results.append(( test, configuration, plugins, list(reversed(durations)) ))
+
+        return results
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _GetPlugins(compiler, optional_test_executor):
+        return "{} / {}".format(compiler.Name, optional_test_executor.Name if optional_test_executor else "Standard")
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _NormalizeTestItem(test_item):
+        if os.path.exists(test_item):
+            return os.path.normcase(os.path.realpath(test_item))
+
+        return test_item
+
 # ----------------------------------------------------------------------
 # |  
 # |  Public Methods
@@ -625,6 +1010,9 @@ def GenerateTestResults( test_items,
                          verbose,
                          no_status,
                          max_num_concurrent_tasks=multiprocessing.cpu_count(),
+                         result_cache=None,                 # TestResultCache
+                         timing_database=None,              # TestTimingDatabase
+                         combined_report=False,
                        ):
     assert test_items
     assert output_dir
@@ -659,7 +1047,8 @@ def GenerateTestResults( test_items,
 
     # Ensure that we only build the debug configuration with code coverage
     if optional_test_executor:
-        execute_in_parallel = False
+        if not optional_test_executor.IsParallelExecutionSupported():
+            execute_in_parallel = False
 
         if compiler.IsCompiler:
             debug_only = True
@@ -699,6 +1088,56 @@ def GenerateTestResults( test_items,
                                                threading.Lock(),
                                              ))
 
+    # ----------------------------------------------------------------------
+    # |  Check for cached results
+    cache_keys = {}
+
+    if result_cache is not None and working_data_items:
+        test_items = [ working_data.complete_result.Item for working_data in working_data_items ]
+
+        for test_item, key in six.moves.zip( test_items,
+                                             result_cache.CreateKeys( test_items,
+                                                                      compiler,
+                                                                      test_parser,
+                                                                      optional_test_executor,
+                                                                      optional_code_coverage_validator,
+                                                                    ),
+                                           ):
+            if key is not None:
+                cache_keys[test_item] = key
+
+    # ----------------------------------------------------------------------
+    # |  Schedule the tests expected to take the longest first
+    scheduled_working_data_items = working_data_items
+    expected_durations = {}
+
+    if timing_database is not None and execute_in_parallel and working_data_items:
+        expected_durations = timing_database.GetExpectedDurations( [ working_data.complete_result.Item for working_data in working_data_items ],
+                                                                   compiler,
+                                                                   optional_test_executor,
+                                                                 )
+
+    # ----------------------------------------------------------------------
+    def GetExpectedDuration(test_item, configuration=None):
+        durations = expected_durations.get(test_item, None)
+        if not durations:
+            # Tests that haven't been run before may be slow, so start them first
+            return float("inf")
+
+        if configuration is not None and configuration in durations:
+            return durations[configuration]
+
+        return max(six.itervalues(durations))
+
+    # ----------------------------------------------------------------------
+
+    if expected_durations:
+        # Sorting is stable, so tests with the same expected duration retain their original order
+        scheduled_working_data_items = sorted( working_data_items,
+                                               key=lambda working_data: GetExpectedDuration(working_data.complete_result.Item),
+                                               reverse=True,
+                                             )
+
     # ----------------------------------------------------------------------
     # |  Build
 
@@ -706,6 +1145,14 @@ def GenerateTestResults( test_items,
     for working_data in working_data_items:
         # ----------------------------------------------------------------------
         def PopulateResults(results, configuration):
+            cache_key = cache_keys.get(working_data.complete_result.Item, None)
+            if cache_key is not None and result_cache.IsPassing(cache_key, configuration):
+                # The test passed and hasn't changed since, so there is no need to build or execute it
+                results.is_cached = True
+                results.compile_result = 0
+
+                return
+
             output_dir = os.path.join(working_data.output_dir, configuration)
 
             FileSystem.RemoveTree(output_dir)
@@ -746,9 +1193,9 @@ def GenerateTestResults( test_items,
 
     # ----------------------------------------------------------------------
     def BuildThreadProc(task_index, output_stream, on_status_update):
-        working_data = working_data_items[task_index % len(working_data_items)]
+        working_data = scheduled_working_data_items[task_index % len(scheduled_working_data_items)]
     
-        if task_index >= len(working_data_items):
+        if task_index >= len(scheduled_working_data_items):
             configuration_results = working_data.complete_result.release
         else:
             configuration_results = working_data.complete_result.debug
@@ -804,25 +1251,31 @@ def GenerateTestResults( test_items,
 
     # ----------------------------------------------------------------------
 
-    debug_tasks = []
-    release_tasks = []
+    debug_build_tasks = []
+    release_build_tasks = []
 
-    for working_data in working_data_items:
+    for working_data in scheduled_working_data_items:
         # Rather than add the tasks back-to-back, add all of the debug tasks followed by
         # all of the release tasks. This will help to avoid potential build issues associated
         # with building the same binary that has slightly different output.
-        debug_tasks.append(TaskPool.Task("{} [Debug]".format(working_data.complete_result.Item), BuildThreadProc))
-        release_tasks.append(TaskPool.Task("{} [Release]".format(working_data.complete_result.Item), BuildThreadProc))
-
-    with output_stream.SingleLineDoneManager( "Building...",
-                                              done_suffix=lambda: inflect.no("build failure", nonlocals.build_failures),
-                                            ) as this_dm:
-        result = TaskPool.Execute( debug_tasks + release_tasks,
-                                   this_dm.stream,
-                                   progress_bar=True,
-                                   display_errors=verbose,
-                                   num_concurrent_tasks=max_num_concurrent_tasks if isinstance(compiler.InputTypeInfo, FilenameTypeInfo) else 1,
-                                 )
+        debug_build_tasks.append(TaskPool.Task("{} [Debug]".format(working_data.complete_result.Item), BuildThreadProc))
+        release_build_tasks.append(TaskPool.Task("{} [Release]".format(working_data.complete_result.Item), BuildThreadProc))
+
+    # When builds and tests are executed with the same level of concurrency, execute them
+    # together so that tests for an item start as soon as the item has been built (rather than
+    # waiting for all of the builds to complete).
+    pipeline_tasks = isinstance(compiler.InputTypeInfo, FilenameTypeInfo) and execute_in_parallel
+
+    if not pipeline_tasks:
+        with output_stream.SingleLineDoneManager( "Building...",
+                                                  done_suffix=lambda: inflect.no("build failure", nonlocals.build_failures),
+                                                ) as this_dm:
+            TaskPool.Execute( debug_build_tasks + release_build_tasks,
+                              this_dm.stream,
+                              progress_bar=True,
+                              display_errors=verbose,
+                              num_concurrent_tasks=max_num_concurrent_tasks if isinstance(compiler.InputTypeInfo, FilenameTypeInfo) else 1,
+                            )
 
     # ----------------------------------------------------------------------
     # |  Execute
@@ -959,7 +1412,9 @@ def GenerateTestResults( test_items,
 
         on_status_update("Waiting")
 
-        if not execute_in_parallel:
+        # Tests associated with the same item are never executed at the same time when using
+        # a test executor, as the executor may use the item's build output.
+        if not execute_in_parallel or optional_test_executor:
             with working_data.execution_lock:
                 Invoke()
         else:
@@ -970,15 +1425,27 @@ def GenerateTestResults( test_items,
     debug_tasks = []
     release_tasks = []
 
+    task_expected_duration_keys = {}
+
     # ----------------------------------------------------------------------
     def EnqueueTestIfNecessary( iteration,
                                 working_data,
                                 configuration_results,
                                 configuration,
+                                build_task,
                               ):
-        if configuration_results.compiler_context is None or configuration_results.compile_result != 0:
+        if configuration_results.compiler_context is None:
             return
 
+        if pipeline_tasks:
+            # The test will be cancelled if the build fails
+            dependencies = [ build_task, ]
+        else:
+            if configuration_results.compile_result != 0:
+                return
+
+            dependencies = None
+
         if iteration == 0:
             configuration_results.execute_results = [ None, ] * iterations
             configuration_results.test_parse_results = [ None, ] * iterations
@@ -1013,47 +1480,106 @@ def GenerateTestResults( test_items,
 
         # ----------------------------------------------------------------------
 
-        task_list.append(TaskPool.Task( "{} [{}]{}".format( working_data.complete_result.Item,
-                                                            configuration,
-                                                            '' if iterations == 1 else " <Iteration {}>".format(iteration + 1),
-                                                          ),
-                                        TestThreadProcWrapper,
-                                      ))
+        task = TaskPool.Task( "{} [{}]{}".format( working_data.complete_result.Item,
+                                                  configuration,
+                                                  '' if iterations == 1 else " <Iteration {}>".format(iteration + 1),
+                                                ),
+                              TestThreadProcWrapper,
+                              dependencies=dependencies,
+                            )
+
+        task_list.append(task)
+        task_expected_duration_keys[task] = ( working_data.complete_result.Item, configuration )
 
     # ----------------------------------------------------------------------
 
     for iteration in six.moves.range(iterations):
+        for working_data, debug_build_task, release_build_task in six.moves.zip(scheduled_working_data_items, debug_build_tasks, release_build_tasks):
+            EnqueueTestIfNecessary(iteration, working_data, working_data.complete_result.debug, "Debug", debug_build_task)
+            EnqueueTestIfNecessary(iteration, working_data, working_data.complete_result.release, "Release", release_build_task)
+
+    # ----------------------------------------------------------------------
+    def CountTestFailures():
+        failures = 0
+
         for working_data in working_data_items:
-            EnqueueTestIfNecessary(iteration, working_data, working_data.complete_result.debug, "Debug")
-            EnqueueTestIfNecessary(iteration, working_data, working_data.complete_result.release, "Release")
+            for results in [ working_data.complete_result.debug,
+                             working_data.complete_result.release,
+                           ]:
+                if results.has_errors:
+                    failures += 1
 
-    if debug_tasks or release_tasks:
-        # ----------------------------------------------------------------------
-        def CountTestFailures():
-            failures = 0
+        return failures
+
+    # ----------------------------------------------------------------------
 
-            for working_data in working_data_items:
-                for results in [ working_data.complete_result.debug,
-                                 working_data.complete_result.release,
-                               ]:
-                    if results.has_errors:
-                        failures += 1
+    if pipeline_tasks:
+        with output_stream.SingleLineDoneManager( "Building and Executing...",
+                                                  done_suffix=lambda: "{}, {}".format( inflect.no("build failure", nonlocals.build_failures),
+                                                                                       inflect.no("test failure", CountTestFailures()),
+                                                                                     ),
+                                                  suffix='\n',
+                                                ) as this_dm:
+            TaskPool.Execute( debug_build_tasks + release_build_tasks + debug_tasks + release_tasks,
+                              this_dm.stream,
+                              progress_bar=True,
+                              display_errors=verbose,
+                              num_concurrent_tasks=max_num_concurrent_tasks,
+                            )
 
-            return failures
+    elif debug_tasks or release_tasks:
+        test_tasks = debug_tasks + release_tasks
 
-        # ----------------------------------------------------------------------
+        if expected_durations:
+            test_tasks.sort( key=lambda task: GetExpectedDuration(*task_expected_duration_keys[task]),
+                             reverse=True,
+                           )
 
         with output_stream.SingleLineDoneManager( "Executing...",
                                                   done_suffix=lambda: inflect.no("test failure", CountTestFailures()),
                                                   suffix='\n',
                                                 ) as this_dm:
-            TaskPool.Execute( debug_tasks + release_tasks,
+            TaskPool.Execute( test_tasks,
                               this_dm.stream,
                               progress_bar=True,
                               display_errors=verbose,
                               num_concurrent_tasks=max_num_concurrent_tasks if execute_in_parallel else 1,
                             )
 
+    if optional_test_executor and combined_report:
+        execute_results = []
+
+        for working_data in working_data_items:
+            for results in [ working_data.complete_result.debug,
+                             working_data.complete_result.release,
+                           ]:
+                execute_results += [ execute_result for execute_result in results.execute_results if execute_result is not None ]
+
+        if execute_results:
+            combined_report_filename = optional_test_executor.CreateCombinedReport(execute_results, output_dir)
+            if combined_report_filename:
+                output_stream.write("Combined test executor results have been written to '{}'.\n".format(combined_report_filename))
+
+    if cache_keys:
+        for working_data in working_data_items:
+            cache_key = cache_keys.get(working_data.complete_result.Item, None)
+            if cache_key is None:
+                continue
+
+            for results, configuration in [ ( working_data.complete_result.debug, "Debug" ),
+                                            ( working_data.complete_result.release, "Release" ),
+                                          ]:
+                if not results.is_cached and results.compiler_context is not None and results.ResultCode() == 0:
+                    result_cache.SetPassing(cache_key, configuration)
+
+        result_cache.Save()
+
+    if timing_database is not None:
+        timing_database.Update( [ working_data.complete_result for working_data in working_data_items ],
+                                compiler,
+                                optional_test_executor,
+                              )
+
     return [ working_data.complete_result for working_data in working_data_items ]
 
 # ----------------------------------------------------------------------
@@ -1082,6 +1608,8 @@ _verbose_param_description                              = CommandLine.EntryPoint
 _quiet_param_description                                = CommandLine.EntryPoint.Parameter("Quiet output.")
 _preserve_ansi_escape_sequences_param_description       = CommandLine.EntryPoint.Parameter("Preserve ansi escape sequences when generating output (useful when invoking this functionality from another script).")
 _no_status_param_description                            = CommandLine.EntryPoint.Parameter("Do not display progress bar status when building and executing.")
+_force_param_description                                = CommandLine.EntryPoint.Parameter("Build and execute all tests, including those with cached results (results are cached when the '{}' environment variable is defined).".format(TestResultCache.ENVIRONMENT_VAR_NAME))
+_combined_report_param_description                      = CommandLine.EntryPoint.Parameter("Write a report that combines the test executor's results for all tests to the output directory (if supported by the test executor).")
 
 _compiler_param_description                             = CommandLine.EntryPoint.Parameter("The name or index of the compiler to use.")
 _compiler_flag_param_description                        = CommandLine.EntryPoint.Parameter("Custom flags passed when creating the compiler.")
@@ -1111,6 +1639,8 @@ _code_coverage_validator_flag_param_description         = CommandLine.EntryPoint
                          quiet=_quiet_param_description,
                          preserve_ansi_escape_sequences=_preserve_ansi_escape_sequences_param_description,
                          no_status=_no_status_param_description,
+                         force=_force_param_description,
+                         combined_report=_combined_report_param_description,
                        )
 @CommandLine.Constraints( configuration=_configuration_type_info,
                           filename_or_dir=CommandLine.FilenameTypeInfo(match_any=True),
@@ -1136,9 +1666,14 @@ def Test( configuration,
           quiet=False,
           preserve_ansi_escape_sequences=False,
           no_status=False,
+          force=False,
+          combined_report=False,
         ):
     """Tests the given input"""
     
+    if combined_report and not code_coverage:
+        raise CommandLine.UsageException("'combined_report' is only valid when 'code_coverage' is specified")
+
     configuration = CONFIGURATIONS[configuration]
 
     if os.path.isdir(filename_or_dir):
@@ -1166,11 +1701,16 @@ def Test( configuration,
                                  quiet=quiet,
                                  preserve_ansi_escape_sequences=preserve_ansi_escape_sequences,
                                  no_status=no_status,
+                                 force=force,
+                                 combined_report=combined_report,
                                )
 
     if quiet:
         raise CommandLine.UsageException("'quiet' is only used when executing tests via a directory")
 
+    if combined_report:
+        raise CommandLine.UsageException("'combined_report' is only used when executing tests via a directory")
+
     return _ExecuteImpl( filename_or_dir,
                          configuration.Compiler,
                          configuration.TestParser,
@@ -1265,6 +1805,8 @@ def TestFile( filename,
                          quiet=_quiet_param_description,
                          preserve_ansi_escape_sequences=_preserve_ansi_escape_sequences_param_description,
                          no_status=_no_status_param_description,
+                         force=_force_param_description,
+                         combined_report=_combined_report_param_description,
                        )
 @CommandLine.Constraints( configuration=_configuration_type_info,
                           input_dir=CommandLine.DirectoryTypeInfo(),
@@ -1290,6 +1832,8 @@ def TestType( configuration,
               quiet=False,
               preserve_ansi_escape_sequences=False,
               no_status=False,
+              force=False,
+              combined_report=False,
             ):
     """Run tests for the test type with the specified configuration"""
     
@@ -1309,6 +1853,8 @@ def TestType( configuration,
                  quiet=quiet,
                  preserve_ansi_escape_sequences=preserve_ansi_escape_sequences,
                  no_status=no_status,
+                 force=force,
+                 combined_report=combined_report,
                )
 
 # ----------------------------------------------------------------------
@@ -1326,6 +1872,8 @@ def TestType( configuration,
                          quiet=_quiet_param_description,
                          preserve_ansi_escape_sequences=_preserve_ansi_escape_sequences_param_description,
                          no_status=_no_status_param_description,
+                         force=_force_param_description,
+                         combined_report=_combined_report_param_description,
                        )
 @CommandLine.Constraints( input_dir=CommandLine.DirectoryTypeInfo(),
                           output_dir=CommandLine.DirectoryTypeInfo(ensure_exists=False),
@@ -1349,6 +1897,8 @@ def TestAll( input_dir,
              quiet=False,
              preserve_ansi_escape_sequences=False,
              no_status=False,
+             force=False,
+             combined_report=False,
            ):
     """Run tests for the test type with all configurations"""
     
@@ -1384,6 +1934,8 @@ def TestAll( input_dir,
                                            quiet=quiet,
                                            preserve_ansi_escape_sequences=preserve_ansi_escape_sequences,
                                            no_status=no_status,
+                                           force=force,
+                                           combined_report=combined_report,
                                          )
 
         return dm.result
@@ -1652,6 +2204,8 @@ def Execute( filename,
                          quiet=_quiet_param_description,
                          preserve_ansi_escape_sequences=_preserve_ansi_escape_sequences_param_description,
                          no_status=_no_status_param_description,
+                         force=_force_param_description,
+                         combined_report=_combined_report_param_description,
                        )
 @CommandLine.Constraints( input_dir=CommandLine.DirectoryTypeInfo(),
                           output_dir=CommandLine.DirectoryTypeInfo(ensure_exists=False),
@@ -1690,6 +2244,8 @@ def ExecuteTree( input_dir,
                  quiet=False,
                  preserve_ansi_escape_sequences=False,
                  no_status=False,
+                 force=False,
+                 combined_report=False,
                ):
     """
     Executes tests found within 'test_type' subdirectories using a specific compiler, test parser, test executor, and code coverage validator. In most
@@ -1699,6 +2255,9 @@ def ExecuteTree( input_dir,
     if test_executor_flag and test_executor is None:
         raise CommandLine.UsageException("Test executor flags are only valid when a test executor is specified")
 
+    if combined_report and test_executor is None:
+        raise CommandLine.UsageException("Combined reports are only valid when a test executor is specified")
+
     if code_coverage_validator_flag and code_coverage_validator is None:
         raise CommandLine.UsageException("Code coverage validator flags are only valid when a code coverage validator is specified")
 
@@ -1720,8 +2279,76 @@ def ExecuteTree( input_dir,
                              quiet=quiet,
                              preserve_ansi_escape_sequences=preserve_ansi_escape_sequences,
                              no_status=no_status,
+                             force=force,
+                             combined_report=combined_report,
+                             compiler_flag=compiler_flag,
+                             test_parser_flag=test_parser_flag,
+                             test_executor_flag=test_executor_flag,
+                             code_coverage_validator_flag=code_coverage_validator_flag,
                            )
 
+# ----------------------------------------------------------------------
+@CommandLine.EntryPoint( num_tests=CommandLine.EntryPoint.Parameter("Number of tests to display."),
+                         num_runs=CommandLine.EntryPoint.Parameter("Number of recent runs to display for each test."),
+                       )
+@CommandLine.Constraints( num_tests=CommandLine.IntTypeInfo(min=1, arity='?'),
+                          num_runs=CommandLine.IntTypeInfo(min=1, arity='?'),
+                          output_stream=None,
+                        )
+def SlowestTests( num_tests=20,
+                  num_runs=5,
+                  output_stream=sys.stdout,
+                ):
+    """Displays the tests that took the longest to build and execute during their most recent run, along with the durations of previous runs."""
+
+    timing_database = TestTimingDatabase.Create()
+    if timing_database is None:
+        output_stream.write("Test durations are only recorded when a repository has been activated or the '{}' environment variable is defined.\n".format(TestTimingDatabase.ENVIRONMENT_VAR_NAME))
+        return -1
+
+    with timing_database:
+        slowest_tests = timing_database.GetSlowestTests(num_tests, num_runs)
+
+    if not slowest_tests:
+        output_stream.write("No test durations have been recorded.\n")
+        return 0
+
+    output_template = "{latest:>10}  {average:>10}  {change:>8}  {test}\n"
+
+    output_stream.write(output_template.format( latest="Latest",
+                                                average="Average",
+                                                change="Change",
+                                                test="Test",
+                                              ))
+    output_stream.write(output_template.format( latest="-" * 10,
+                                                average="-" * 10,
+                                                change="-" * 8,
+                                                test="-" * 4,
+                                              ))
+
+    for test, configuration, plugins, durations in slowest_tests:
+        # The change is relative to the average of the previous runs
+        latest = durations[-1]
+        previous = durations[:-1]
+
+        if previous and sum(previous):
+            previous_average = sum(previous) / len(previous)
+            change = "{:+.0f}%".format((latest - previous_average) / previous_average * 100)
+        else:
+            change = "N/A"
+
+        output_stream.write(output_template.format( latest="{:.2f}s".format(latest),
+                                                    average="{:.2f}s".format(sum(durations) / len(durations)),
+                                                    change=change,
+                                                    test="{} [{}] ({})".format(test, configuration, plugins),
+                                                  ))
+
+        output_stream.write("{}{}\n".format( " " * 36,
+                                             " -> ".join([ "{:.2f}s".format(duration) for duration in durations ]),
+                                           ))
+
+    return 0
+
 # ----------------------------------------------------------------------
 def CommandLineSuffix():
     return StringHelpers.LeftJustify( textwrap.dedent(
@@ -1890,6 +2517,12 @@ def _ExecuteTreeImpl( input_dir,
                       quiet,
                       preserve_ansi_escape_sequences,
                       no_status,
+                      force=False,
+                      combined_report=False,
+                      compiler_flag=None,
+                      test_parser_flag=None,
+                      test_executor_flag=None,
+                      code_coverage_validator_flag=None,
                     ):
     if verbose and quiet:
         raise CommandLine.UsageException("'verbose' and 'quiet' are mutually exclusive options and cannot be specified together")
@@ -1931,22 +2564,35 @@ def _ExecuteTreeImpl( input_dir,
                 if execute_in_parallel is None:
                     execute_in_parallel = False
         
-            complete_results = GenerateTestResults( test_items,
-                                                    output_dir,
-                                                    compiler,
-                                                    test_parser,
-                                                    test_executor,
-                                                    code_coverage_validator,
-                                                    execute_in_parallel=execute_in_parallel,
-                                                    iterations=iterations,
-                                                    debug_on_error=debug_on_error,
-                                                    continue_iterations_on_error=continue_iterations_on_error,
-                                                    debug_only=debug_only,
-                                                    release_only=release_only,
-                                                    output_stream=dm.stream,
-                                                    verbose=verbose,
-                                                    no_status=no_status,
-                                                  )
+            timing_database = TestTimingDatabase.Create()
+
+            with CallOnExit(lambda: timing_database.Close() if timing_database is not None else None):
+                complete_results = GenerateTestResults( test_items,
+                                                        output_dir,
+                                                        compiler,
+                                                        test_parser,
+                                                        test_executor,
+                                                        code_coverage_validator,
+                                                        execute_in_parallel=execute_in_parallel,
+                                                        iterations=iterations,
+                                                        debug_on_error=debug_on_error,
+                                                        continue_iterations_on_error=continue_iterations_on_error,
+                                                        debug_only=debug_only,
+                                                        release_only=release_only,
+                                                        output_stream=dm.stream,
+                                                        verbose=verbose,
+                                                        no_status=no_status,
+                                                        result_cache=TestResultCache.Create( force=force,
+                                                                                             plugin_flags=[ compiler_flag,
+                                                                                                            test_parser_flag,
+                                                                                                            test_executor_flag,
+                                                                                                            code_coverage_validator_flag,
+                                                                                                          ],
+                                                                                           ),
+                                                        timing_database=timing_database,
+                                                        combined_report=combined_report,
+                                                      )
+
             if not complete_results:
                 return 0
 
@@ -1981,7 +2627,7 @@ def _ExecuteTreeImpl( input_dir,
 
                 dm.stream.write(" {}, {}, {}\n".format( test_item,
                                                         result_type,
-                                                        results.TotalTime(),
+                                                        "cached" if results.is_cached else results.TotalTime(),
                                                       ))
 
             # ----------------------------------------------------------------------